@@ -0,0 +1,147 @@
+import logging
+from collections.abc import Iterator
+from typing import NamedTuple
+
+import numpy as np
+from car_repayment import (
+    ERROR_MESSAGES,
+    calculate_monthly_repayment,
+    calculate_monthly_repayment_batch,
+)
+from numpy.typing import ArrayLike
+
+logger = logging.getLogger(__name__)
+
+
+class AmortizationRow(NamedTuple):
+    """One month of an amortization schedule."""
+
+    month: int
+    payment: float
+    interest: float
+    principal: float
+    balance: float
+
+
+def _number_of_months(years: float) -> int:
+    """Return years * 12 as a whole number of months, or raise a ValueError."""
+    number_of_payments = years * 12
+    if number_of_payments != int(number_of_payments):
+        raise ValueError(
+            "The number of payments must be a whole number of months to build a schedule."
+        )
+    return int(number_of_payments)
+
+
+def iter_amortization_schedule(
+    price: float, years: float, annual_interest_rate: float, deposit: float = 0.0
+) -> Iterator[AmortizationRow]:
+    """
+    Lazily yield the month-by-month amortization schedule for a car loan.
+
+    The monthly payment comes from ``calculate_monthly_repayment``. Each month the
+    interest is charged on the outstanding balance, and the rest of the payment
+    reduces the balance:
+      interest = balance * monthly_interest_rate
+      principal = payment - interest
+      balance = balance - principal
+
+    Only the current row is kept in memory, so schedules can be streamed for any
+    number of contracts without materializing them.
+
+    :param price: float - the total price of the car.
+    :param years: float - the number of years over which the loan will be repaid.
+    :param annual_interest_rate: float - the annual interest rate as a percentage.
+    :param deposit: float - an initial deposit (default is 0.0).
+    :return: an iterator of AmortizationRow, one per month.
+    :raises ValueError: if the inputs are invalid for calculate_monthly_repayment or
+        years does not cover a whole number of months.
+    """
+    payment = calculate_monthly_repayment(price, years, annual_interest_rate, deposit)
+    number_of_months = _number_of_months(years)
+    monthly_interest_rate = (annual_interest_rate / 100) / 12
+    balance = price - deposit
+
+    for month in range(1, number_of_months + 1):
+        interest = balance * monthly_interest_rate
+        principal = payment - interest
+        balance -= principal
+        yield AmortizationRow(month, payment, interest, principal, balance)
+
+
+def amortization_schedule_block(
+    price: ArrayLike,
+    years: ArrayLike,
+    annual_interest_rate: ArrayLike,
+    deposit: ArrayLike = 0.0,
+) -> dict[str, np.ndarray]:
+    """
+    Build the amortization schedules of a whole portfolio as columnar arrays.
+
+    Every column has shape (number_of_loans, max_months), where max_months is the
+    longest term in the portfolio. Months past the end of a shorter loan are padded
+    with zeros. Balances use the closed form of the schedule recurrence:
+      balance_k = loan_amount * (1 + r) ** k - payment * ((1 + r) ** k - 1) / r
+    or, for a zero interest rate:
+      balance_k = loan_amount - payment * k
+
+    :param price: the total prices of the cars.
+    :param years: the number of years over which each loan will be repaid.
+    :param annual_interest_rate: the annual interest rates as percentages.
+    :param deposit: the initial deposits (default is 0.0).
+    :return: a dict with ``month``, ``payment``, ``interest``, ``principal`` and
+        ``balance`` arrays.
+    :raises ValueError: if any loan is invalid, following the same rules as
+        calculate_monthly_repayment_batch, or does not cover a whole number of
+        months. The message is that of the first invalid loan.
+    """
+    price, years, annual_interest_rate, deposit = (
+        np.atleast_1d(column).astype(np.float64)
+        for column in np.broadcast_arrays(price, years, annual_interest_rate, deposit)
+    )
+    logger.debug("Building amortization schedules for %d loans", price.size)
+
+    payment, error_code = calculate_monthly_repayment_batch(
+        price, years, annual_interest_rate, deposit
+    )
+    invalid = np.flatnonzero(error_code)
+    if invalid.size:
+        raise ValueError(ERROR_MESSAGES[error_code[invalid[0]]])
+
+    number_of_payments = years * 12
+    if (number_of_payments != np.floor(number_of_payments)).any():
+        raise ValueError(
+            "The number of payments must be a whole number of months to build a schedule."
+        )
+
+    loan_amount = (price - deposit)[:, None]
+    monthly_interest_rate = ((annual_interest_rate / 100) / 12)[:, None]
+    number_of_payments = number_of_payments[:, None]
+    has_interest = monthly_interest_rate != 0
+    payment = payment[:, None]
+
+    month = np.arange(int(number_of_payments.max()) + 1)[None, :]
+    growth = (1 + monthly_interest_rate) ** month
+    balance = np.where(
+        has_interest,
+        loan_amount * growth
+        - payment
+        * np.divide(
+            growth - 1,
+            monthly_interest_rate,
+            where=has_interest,
+            out=np.zeros_like(growth),
+        ),
+        loan_amount - payment * month,
+    )
+
+    active = month[:, 1:] <= number_of_payments
+    interest = np.where(active, balance[:, :-1] * monthly_interest_rate, 0.0)
+    principal = np.where(active, payment - interest, 0.0)
+    return {
+        "month": np.broadcast_to(month[:, 1:], active.shape),
+        "payment": np.where(active, payment, 0.0),
+        "interest": interest,
+        "principal": principal,
+        "balance": np.where(active, balance[:, 1:], 0.0),
+    }
@@ -0,0 +1,81 @@
+"""
+Benchmark the amortization schedule engine against a naive Python loop that
+rebuilds month-by-month rows for every loan.
+
+Usage:
+    python benchmark_amortization.py [number_of_loans]
+
+Every loan in the portfolio runs for 30 years (360 months); the default
+portfolio has 10,000 loans.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# The modules shared by the Tutorial 2 solutions, such as call_metrics.py, live in
+# the directory above this one.
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from amortization import amortization_schedule_block, iter_amortization_schedule
+from car_repayment import calculate_monthly_repayment
+
+
+def make_portfolio(number_of_loans: int, seed: int = 0) -> tuple[np.ndarray, ...]:
+    """Generate random 30-year loans."""
+    rng = np.random.default_rng(seed)
+    price = rng.uniform(100_000, 1_000_000, number_of_loans)
+    deposit = price * rng.uniform(0, 0.2, number_of_loans)
+    annual_interest_rate = rng.uniform(0, 15, number_of_loans)
+    years = np.full(number_of_loans, 30.0)
+    return price, years, annual_interest_rate, deposit
+
+
+def naive_schedule(price, years, annual_interest_rate, deposit) -> list[tuple]:
+    """Rebuild a schedule the way the loan-servicing jobs do today."""
+    payment = calculate_monthly_repayment(price, years, annual_interest_rate, deposit)
+    monthly_interest_rate = (annual_interest_rate / 100) / 12
+    balance = price - deposit
+    rows = []
+    for month in range(1, int(years * 12) + 1):
+        interest = balance * monthly_interest_rate
+        principal = payment - interest
+        balance -= principal
+        rows.append((month, payment, interest, principal, balance))
+    return rows
+
+
+def time_it(label: str, function, rows: int):
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    print(f"{label:<28} {seconds:10.4f} s {rows / seconds:14,.0f} rows/s")
+
+
+def main():
+    number_of_loans = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    portfolio = make_portfolio(number_of_loans)
+    loans = list(zip(*(column.tolist() for column in portfolio)))
+    rows = number_of_loans * 360
+
+    def naive():
+        for loan in loans:
+            naive_schedule(*loan)
+
+    def streaming():
+        for loan in loans:
+            for _ in iter_amortization_schedule(*loan):
+                pass
+
+    def block():
+        amortization_schedule_block(*portfolio)
+
+    print(f"{number_of_loans:,} loans x 360 months = {rows:,} rows")
+    time_it("naive loop (lists)", naive, rows)
+    time_it("streaming generator", streaming, rows)
+    time_it("columnar block", block, rows)
+
+
+if __name__ == "__main__":
+    main()
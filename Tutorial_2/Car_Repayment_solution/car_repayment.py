@@ -1,6 +1,41 @@
 import logging
+import sys
+from pathlib import Path
 
-logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
+import numpy as np
+from numpy.typing import ArrayLike
+
+if __name__ == "__main__":
+    # Run as a script: put the modules shared by the Tutorial 2 solutions, such as
+    # call_metrics.py, on the import path. Importers and the tests do it themselves.
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# The metrics hook is shared with the investment calculator.
+import call_metrics
+from call_metrics import call_with_metrics
+
+logger = logging.getLogger(__name__)
+
+# Error codes of calculate_monthly_repayment_batch, one per validation rule.
+OK = 0
+NEGATIVE_PRICE = 1
+NEGATIVE_YEARS = 2
+NEGATIVE_INTEREST_RATE = 3
+NEGATIVE_DEPOSIT = 4
+DEPOSIT_EXCEEDS_PRICE = 5
+NO_PAYMENTS = 6
+INVALID_INPUT = 7
+
+ERROR_MESSAGES = {
+    OK: "",
+    NEGATIVE_PRICE: "Price cannot be negative.",
+    NEGATIVE_YEARS: "Years cannot be negative.",
+    NEGATIVE_INTEREST_RATE: "Annual interest rate cannot be negative.",
+    NEGATIVE_DEPOSIT: "Deposit cannot be negative.",
+    DEPOSIT_EXCEEDS_PRICE: "Deposit cannot exceed the price of the car.",
+    NO_PAYMENTS: "The number of payments must be greater than 0. Check the value of years.",
+    INVALID_INPUT: "Invalid input. Please ensure all inputs are numbers.",
+}
 
 
 def calculate_monthly_repayment(
@@ -28,11 +63,36 @@ def calculate_monthly_repayment(
     :return: float - the calculated monthly repayment.
     :raises ValueError: if any input is negative or if deposit exceeds price.
     """
-    logging.info(
-        f"Calculating monthly repayment with price={price}, years={years}, "
-        f"annual_interest_rate={annual_interest_rate}, deposit={deposit}"
+    hook = call_metrics.metrics_hook
+    if hook is None:
+        return _calculate_monthly_repayment(price, years, annual_interest_rate, deposit)
+    return call_with_metrics(
+        hook,
+        "calculate_monthly_repayment",
+        _calculate_monthly_repayment,
+        price,
+        years,
+        annual_interest_rate,
+        deposit,
     )
 
+
+def _calculate_monthly_repayment(
+    price: float, years: float, annual_interest_rate: float, deposit: float
+) -> float:
+    """Validate the inputs and apply the amortizing loan formula."""
+    # Checked once per call so the quiet path skips every info call below.
+    info = logger.isEnabledFor(logging.INFO)
+    if info:
+        logger.info(
+            "Calculating monthly repayment with price=%s, years=%s, "
+            "annual_interest_rate=%s, deposit=%s",
+            price,
+            years,
+            annual_interest_rate,
+            deposit,
+        )
+
     if price < 0:
         raise ValueError("Price cannot be negative.")
     if years < 0:
@@ -60,10 +120,68 @@ def calculate_monthly_repayment(
             1 - (1 + monthly_interest_rate) ** (-number_of_payments)
         )
 
-    logging.info(f"Calculated monthly repayment: {monthly_repayment}")
+    if info:
+        logger.info("Calculated monthly repayment: %s", monthly_repayment)
     return monthly_repayment
 
 
+def calculate_monthly_repayment_batch(
+    price: ArrayLike,
+    years: ArrayLike,
+    annual_interest_rate: ArrayLike,
+    deposit: ArrayLike = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the monthly repayment of many car loans at once.
+
+    Uses the same formula as ``calculate_monthly_repayment``. Rather than raising,
+    invalid loans get a NaN repayment and a non-zero error code. When a loan breaks
+    several rules, the code of the first check made by the scalar function wins.
+
+    :param price: the total prices of the cars.
+    :param years: the number of years over which each loan will be repaid.
+    :param annual_interest_rate: the annual interest rates as percentages.
+    :param deposit: the initial deposits (default is 0.0).
+    :return: a tuple of arrays (monthly_repayment, error_code).
+    """
+    price, years, annual_interest_rate, deposit = np.broadcast_arrays(
+        *(
+            np.asarray(column, dtype=np.float64)
+            for column in (price, years, annual_interest_rate, deposit)
+        )
+    )
+    loan_amount = price - deposit
+    number_of_payments = years * 12
+
+    # Assign codes from the last check to the first, so the earliest rule wins.
+    error_code = np.full(price.shape, OK, dtype=np.int8)
+    checks = [
+        (np.isnan(price + years + annual_interest_rate + deposit), INVALID_INPUT),
+        (price < 0, NEGATIVE_PRICE),
+        (years < 0, NEGATIVE_YEARS),
+        (annual_interest_rate < 0, NEGATIVE_INTEREST_RATE),
+        (deposit < 0, NEGATIVE_DEPOSIT),
+        (deposit > price, DEPOSIT_EXCEEDS_PRICE),
+        (number_of_payments <= 0, NO_PAYMENTS),
+    ]
+    for failed, code in reversed(checks):
+        error_code[failed] = code
+    valid = error_code == OK
+
+    monthly_interest_rate = (annual_interest_rate / 100) / 12
+    has_interest = valid & (annual_interest_rate != 0)
+    monthly_repayment = np.divide(
+        loan_amount, number_of_payments, where=valid, out=np.full(price.shape, np.nan)
+    )
+    np.divide(
+        loan_amount * monthly_interest_rate,
+        1 - (1 + monthly_interest_rate) ** (-number_of_payments),
+        where=has_interest,
+        out=monthly_repayment,
+    )
+    return monthly_repayment, error_code
+
+
 def get_user_input() -> tuple[float, float, float, float]:
     """
     Prompt the user to input the car price, number of years for repayment,
@@ -82,12 +200,15 @@ def get_user_input() -> tuple[float, float, float, float]:
         deposit_input = input("Enter the deposit amount (press Enter for 0): ")
         deposit = float(deposit_input) if deposit_input.strip() != "" else 0.0
     except ValueError as e:
-        logging.error("Invalid input. Please enter numeric values.")
+        logger.error("Invalid input. Please enter numeric values.")
         raise ValueError("Invalid input. Please ensure all inputs are numbers.") from e
 
-    logging.info(
-        f"User input received: price={price}, years={years}, "
-        f"annual_interest_rate={annual_interest_rate}, deposit={deposit}"
+    logger.info(
+        "User input received: price=%s, years=%s, annual_interest_rate=%s, deposit=%s",
+        price,
+        years,
+        annual_interest_rate,
+        deposit,
     )
     return price, years, annual_interest_rate, deposit
 
@@ -99,6 +220,7 @@ def main():
     This function retrieves user input, calculates the monthly repayment, and displays the result.
     It handles exceptions gracefully and logs errors when they occur.
     """
+    logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
     try:
         price, years, annual_interest_rate, deposit = get_user_input()
 
@@ -107,7 +229,7 @@ def main():
         )
         print(f"Your monthly repayment is: R{repayment:.2f}")
     except ValueError as e:
-        logging.error(f"Error in calculation: {e}")
+        logger.error("Error in calculation: %s", e)
         print(f"Error: {e}")
 
 
@@ -0,0 +1,327 @@
+"""
+Inverse solvers for the car loan repayment formula.
+
+``calculate_monthly_repayment`` answers "what will I pay per month?". These
+functions answer the inverse questions, such as "what price can I afford at
+R5,000/month?", without calling it in a search loop:
+
+  - price, deposit and term have closed-form solutions;
+  - the interest rate has none, so it is found with a bracketed Newton iteration
+    and the number of iterations is reported alongside the answer.
+
+Every solver has a batched form taking arrays, and a scalar form returning floats.
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# SolverResult and as_arrays are shared with the investment solvers. They live in the
+# Tutorial_2 directory, which conftest.py puts on the import path for the tests.
+from solvers_common import SolverResult, as_arrays
+
+
+def _validate(**columns: np.ndarray):
+    for name, column in columns.items():
+        if (column < 0).any():
+            raise ValueError(
+                f"{name.replace('_', ' ').capitalize()} cannot be negative."
+            )
+
+
+def _number_of_payments(years: np.ndarray) -> np.ndarray:
+    number_of_payments = years * 12
+    if (number_of_payments <= 0).any():
+        raise ValueError(
+            "The number of payments must be greater than 0. Check the value of years."
+        )
+    return number_of_payments
+
+
+def _present_value_factor(monthly_interest_rate, number_of_payments) -> np.ndarray:
+    """Return loan_amount / monthly_repayment, i.e. (1 - (1 + r) ** -n) / r."""
+    has_interest = monthly_interest_rate != 0
+    return np.divide(
+        -np.expm1(-number_of_payments * np.log1p(monthly_interest_rate)),
+        monthly_interest_rate,
+        where=has_interest,
+        out=np.array(number_of_payments),
+    )
+
+
+def solve_affordable_price_batch(
+    monthly_repayment: ArrayLike,
+    years: ArrayLike,
+    annual_interest_rate: ArrayLike,
+    deposit: ArrayLike = 0.0,
+) -> np.ndarray:
+    """
+    Calculate the highest car price each monthly repayment can pay off.
+
+    Formula:
+      loan_amount = monthly_repayment * (1 - (1 + monthly_interest_rate) ** -n) / monthly_interest_rate
+      price = loan_amount + deposit
+    With a zero interest rate, loan_amount = monthly_repayment * n.
+
+    :raises ValueError: if any input is negative or any term has no payments.
+    """
+    monthly_repayment, years, annual_interest_rate, deposit = as_arrays(
+        monthly_repayment, years, annual_interest_rate, deposit
+    )
+    _validate(
+        monthly_repayment=monthly_repayment,
+        years=years,
+        annual_interest_rate=annual_interest_rate,
+        deposit=deposit,
+    )
+    monthly_interest_rate = (annual_interest_rate / 100) / 12
+    factor = _present_value_factor(monthly_interest_rate, _number_of_payments(years))
+    return monthly_repayment * factor + deposit
+
+
+def solve_required_deposit_batch(
+    price: ArrayLike,
+    monthly_repayment: ArrayLike,
+    years: ArrayLike,
+    annual_interest_rate: ArrayLike,
+) -> np.ndarray:
+    """
+    Calculate the smallest deposit that brings each loan down to the monthly
+    repayment. If the repayment already covers the full price, the deposit is 0.
+
+    :raises ValueError: if any input is negative or any term has no payments.
+    """
+    price, monthly_repayment, years, annual_interest_rate = as_arrays(
+        price, monthly_repayment, years, annual_interest_rate
+    )
+    _validate(price=price)
+    affordable_loan = solve_affordable_price_batch(
+        monthly_repayment, years, annual_interest_rate
+    )
+    return np.maximum(price - affordable_loan, 0.0)
+
+
+def solve_term_batch(
+    price: ArrayLike,
+    monthly_repayment: ArrayLike,
+    annual_interest_rate: ArrayLike,
+    deposit: ArrayLike = 0.0,
+) -> np.ndarray:
+    """
+    Calculate the number of years needed to repay each loan.
+
+    Formula:
+      n = -log(1 - loan_amount * monthly_interest_rate / monthly_repayment) / log(1 + monthly_interest_rate)
+    With a zero interest rate, n = loan_amount / monthly_repayment.
+    The result is years = n / 12, which need not be a whole number of months.
+
+    :raises ValueError: if any input is negative, the deposit exceeds the price, or
+        a repayment does not cover the monthly interest on its loan.
+    """
+    price, monthly_repayment, annual_interest_rate, deposit = as_arrays(
+        price, monthly_repayment, annual_interest_rate, deposit
+    )
+    _validate(
+        price=price,
+        monthly_repayment=monthly_repayment,
+        annual_interest_rate=annual_interest_rate,
+        deposit=deposit,
+    )
+    if (deposit > price).any():
+        raise ValueError("Deposit cannot exceed the price of the car.")
+
+    loan_amount = price - deposit
+    monthly_interest_rate = (annual_interest_rate / 100) / 12
+    if (monthly_repayment <= loan_amount * monthly_interest_rate).any():
+        raise ValueError(
+            "The monthly repayment must be greater than the monthly interest on the loan."
+        )
+
+    has_interest = monthly_interest_rate != 0
+    number_of_payments = np.divide(
+        -np.log1p(-np.divide(loan_amount * monthly_interest_rate, monthly_repayment)),
+        np.log1p(monthly_interest_rate),
+        where=has_interest,
+        out=np.array(loan_amount / monthly_repayment),
+    )
+    return number_of_payments / 12
+
+
+def solve_interest_rate_batch(
+    price: ArrayLike,
+    monthly_repayment: ArrayLike,
+    years: ArrayLike,
+    deposit: ArrayLike = 0.0,
+    tolerance: float = 1e-12,
+    max_iterations: int = 100,
+) -> SolverResult:
+    """
+    Calculate the annual interest rate (as a percentage) implied by each monthly
+    repayment.
+
+    The repayment grows with the rate, so the root of
+      f(r) = loan_amount * r / (1 - (1 + r) ** -n) - monthly_repayment
+    is bracketed in (0, monthly_repayment / loan_amount]. Newton steps are taken
+    from the usual small-rate approximation and fall back to bisection whenever
+    they would leave the bracket.
+
+    :param tolerance: the change in monthly rate below which a loan has converged.
+    :param max_iterations: the maximum number of iterations.
+    :return: a SolverResult of arrays (annual_interest_rate, iterations, converged).
+    :raises ValueError: if any input is negative, the deposit exceeds the price, a
+        loan of 0 has a non-zero repayment, or a repayment is too small to pay off
+        its loan even at a zero interest rate.
+    """
+    price, monthly_repayment, years, deposit = as_arrays(
+        price, monthly_repayment, years, deposit
+    )
+    _validate(
+        price=price, monthly_repayment=monthly_repayment, years=years, deposit=deposit
+    )
+    if (deposit > price).any():
+        raise ValueError("Deposit cannot exceed the price of the car.")
+
+    loan_amount = price - deposit
+    if ((loan_amount == 0) & (monthly_repayment != 0)).any():
+        raise ValueError("A loan of 0 cannot have a non-zero monthly repayment.")
+    n = _number_of_payments(years)
+    if (monthly_repayment * n < loan_amount).any():
+        raise ValueError(
+            "The monthly repayment cannot pay off the loan, even at a zero interest rate."
+        )
+
+    # Loans repaid without interest are solved before iterating.
+    active = monthly_repayment * n > loan_amount
+    rate = np.zeros_like(loan_amount)
+    iterations = np.zeros(loan_amount.shape, dtype=np.int64)
+    converged = ~active
+
+    safe_loan = np.where(active, loan_amount, 1.0)
+    low = np.zeros_like(loan_amount)
+    high = np.where(active, monthly_repayment / safe_loan, 0.0)
+    rate[active] = np.minimum(
+        2 * (monthly_repayment * n / safe_loan - 1) / (n + 1), high / 2
+    )[active]
+
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        r, a = rate[active], n[active]
+        growth = np.exp(-a * np.log1p(r))
+        one_minus_growth = -np.expm1(-a * np.log1p(r))
+        payment = safe_loan[active] * r / one_minus_growth
+        f = payment - monthly_repayment[active]
+        derivative = (
+            safe_loan[active]
+            * (one_minus_growth - r * a * growth / (1 + r))
+            / one_minus_growth**2
+        )
+
+        below = f < 0
+        low[active] = np.where(below, r, low[active])
+        high[active] = np.where(below, high[active], r)
+        candidate = r - f / derivative
+        inside = (candidate > low[active]) & (candidate < high[active])
+        new_rate = np.where(inside, candidate, (low[active] + high[active]) / 2)
+
+        iterations[active] += 1
+        done = np.abs(new_rate - r) <= tolerance * (1 + r)
+        rate[active] = new_rate
+        newly_converged = np.zeros_like(active)
+        newly_converged[active] = done
+        converged |= newly_converged
+        active &= ~newly_converged
+
+    return SolverResult(rate * 12 * 100, iterations, converged)
+
+
+def solve_affordable_price(
+    monthly_repayment: float,
+    years: float,
+    annual_interest_rate: float,
+    deposit: float = 0.0,
+) -> float:
+    """
+    Calculate the highest car price a monthly repayment can pay off.
+
+    :param monthly_repayment: float - the monthly repayment the buyer can afford.
+    :param years: float - the number of years over which the loan will be repaid.
+    :param annual_interest_rate: float - the annual interest rate as a percentage.
+    :param deposit: float - an initial deposit (default is 0.0).
+    :return: float - the affordable price of the car.
+    :raises ValueError: if any input is negative or years is 0.
+    """
+    return float(
+        solve_affordable_price_batch(
+            monthly_repayment, years, annual_interest_rate, deposit
+        )
+    )
+
+
+def solve_required_deposit(
+    price: float, monthly_repayment: float, years: float, annual_interest_rate: float
+) -> float:
+    """
+    Calculate the smallest deposit that brings a loan down to a monthly repayment.
+
+    :param price: float - the total price of the car.
+    :param monthly_repayment: float - the monthly repayment the buyer can afford.
+    :param years: float - the number of years over which the loan will be repaid.
+    :param annual_interest_rate: float - the annual interest rate as a percentage.
+    :return: float - the required deposit, or 0.0 if none is needed.
+    :raises ValueError: if any input is negative or years is 0.
+    """
+    return float(
+        solve_required_deposit_batch(
+            price, monthly_repayment, years, annual_interest_rate
+        )
+    )
+
+
+def solve_term(
+    price: float,
+    monthly_repayment: float,
+    annual_interest_rate: float,
+    deposit: float = 0.0,
+) -> float:
+    """
+    Calculate the number of years needed to repay a loan at a monthly repayment.
+
+    :param price: float - the total price of the car.
+    :param monthly_repayment: float - the monthly repayment the buyer can afford.
+    :param annual_interest_rate: float - the annual interest rate as a percentage.
+    :param deposit: float - an initial deposit (default is 0.0).
+    :return: float - the number of years.
+    :raises ValueError: if any input is negative, the deposit exceeds the price, or
+        the repayment does not cover the monthly interest.
+    """
+    return float(
+        solve_term_batch(price, monthly_repayment, annual_interest_rate, deposit)
+    )
+
+
+def solve_interest_rate(
+    price: float,
+    monthly_repayment: float,
+    years: float,
+    deposit: float = 0.0,
+    tolerance: float = 1e-12,
+    max_iterations: int = 100,
+) -> SolverResult:
+    """
+    Calculate the annual interest rate implied by a monthly repayment.
+
+    :param price: float - the total price of the car.
+    :param monthly_repayment: float - the quoted monthly repayment.
+    :param years: float - the number of years over which the loan will be repaid.
+    :param deposit: float - an initial deposit (default is 0.0).
+    :param tolerance: float - the convergence tolerance on the monthly rate.
+    :param max_iterations: int - the maximum number of iterations.
+    :return: SolverResult (annual_interest_rate, iterations, converged).
+    :raises ValueError: if any input is negative, the deposit exceeds the price, a
+        loan of 0 has a non-zero repayment, or the repayment cannot pay off the loan
+        even at a zero interest rate.
+    """
+    rate, iterations, converged = solve_interest_rate_batch(
+        price, monthly_repayment, years, deposit, tolerance, max_iterations
+    )
+    return SolverResult(float(rate), int(iterations), bool(converged))
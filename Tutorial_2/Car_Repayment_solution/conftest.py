@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The modules shared by the Tutorial 2 solutions, such as solvers_common.py, live
+# in the directory above this one.
+sys.path.append(str(Path(__file__).resolve().parent.parent))
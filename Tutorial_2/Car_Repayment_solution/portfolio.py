@@ -0,0 +1,207 @@
+"""
+Portfolio runner for car loan repayments.
+
+Reads loan quotes from a CSV file with ``price``, ``years``,
+``annual_interest_rate`` and (optionally) ``deposit`` columns, calculates the
+monthly repayment of every loan in vectorized chunks, optionally sharded across
+a process pool, and writes the results to a CSV file in bulk.
+
+Instead of raising a ValueError on the first bad loan, every row gets an error
+code from ``calculate_monthly_repayment_batch`` in car_repayment.py.
+
+Usage:
+    python portfolio.py loans.csv results.csv [--workers 4] [--chunk-size 100000]
+"""
+
+import argparse
+import csv
+import logging
+import sys
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+if __name__ == "__main__":
+    # Run as a script: put the modules shared by the Tutorial 2 solutions, such as
+    # call_metrics.py, on the import path. Importers and the tests do it themselves.
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from car_repayment import calculate_monthly_repayment_batch
+
+logger = logging.getLogger(__name__)
+
+INPUT_COLUMNS = ["price", "years", "annual_interest_rate", "deposit"]
+OUTPUT_COLUMNS = INPUT_COLUMNS + ["monthly_repayment", "error_code"]
+
+
+class PortfolioSummary(NamedTuple):
+    """Totals reported after a portfolio run."""
+
+    loans: int
+    failed: int
+    seconds: float
+
+    @property
+    def loans_per_second(self) -> float:
+        return self.loans / self.seconds if self.seconds > 0 else float("inf")
+
+
+def _parse_number(value: str, default: float | None = None) -> float:
+    """Parse a CSV cell, using default for blank cells and NaN for bad ones."""
+    if value.strip() == "" and default is not None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return float("nan")
+
+
+def _parse_column(values: tuple[str, ...], default: float | None = None) -> np.ndarray:
+    """
+    Parse a column of CSV cells in one go, falling back to cell-by-cell parsing
+    only when the column contains blank or malformed cells.
+    """
+    try:
+        return np.array(values, dtype=np.float64)
+    except ValueError:
+        return np.array([_parse_number(value, default) for value in values])
+
+
+def process_chunk(rows: list[list[str]]) -> tuple[list[list], int]:
+    """
+    Parse, calculate and format one chunk of raw CSV rows.
+
+    This is the unit of work handed to each worker process.
+
+    :param rows: raw CSV rows in INPUT_COLUMNS order; a blank deposit means 0.0.
+    :return: a tuple (output_rows, number_of_failed_loans).
+    """
+    price, years, annual_interest_rate, deposit = zip(*rows) if rows else ((),) * 4
+    monthly_repayment, error_code = calculate_monthly_repayment_batch(
+        _parse_column(price),
+        _parse_column(years),
+        _parse_column(annual_interest_rate),
+        _parse_column(deposit, default=0.0),
+    )
+
+    output_rows = [
+        [*row, "" if code else repayment, code]
+        for row, repayment, code in zip(
+            rows, monthly_repayment.tolist(), error_code.tolist()
+        )
+    ]
+    return output_rows, int(np.count_nonzero(error_code))
+
+
+def _read_chunks(reader: Iterator[list[str]], chunk_size: int) -> Iterator[list]:
+    """Split a CSV reader into lists of at most chunk_size rows."""
+    while chunk := list(islice(reader, chunk_size)):
+        yield chunk
+
+
+def _process_chunks(
+    chunks: Iterator[list], workers: int
+) -> Iterator[tuple[list[list], int]]:
+    """
+    Process chunks in order, sharding them across a process pool if workers > 1.
+
+    At most two chunks per worker are in flight, so memory stays bounded no matter
+    how large the input file is.
+    """
+    if workers <= 1:
+        yield from map(process_chunk, chunks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(process_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_portfolio(
+    input_path: str,
+    output_path: str,
+    workers: int = 1,
+    chunk_size: int = 100_000,
+) -> PortfolioSummary:
+    """
+    Calculate the monthly repayment of every loan in a CSV file.
+
+    :param input_path: the CSV file of loans, with a header row.
+    :param output_path: the CSV file to write results to.
+    :param workers: the number of worker processes; 1 runs in this process.
+    :param chunk_size: the number of loans per chunk (and per bulk write).
+    :return: a PortfolioSummary with the number of loans, failures and run time.
+    :raises ValueError: if the input file is missing a required column.
+    """
+    start = time.perf_counter()
+    loans = failed = 0
+
+    with open(input_path, newline="") as input_file:
+        reader = csv.reader(input_file)
+        header = [column.strip() for column in next(reader, [])]
+        missing = [column for column in INPUT_COLUMNS[:3] if column not in header]
+        if missing:
+            raise ValueError(f"Missing input columns: {', '.join(missing)}")
+        # Reorder the input columns once so workers can rely on positions.
+        positions = [
+            header.index(column) if column in header else None
+            for column in INPUT_COLUMNS
+        ]
+        ordered_rows = (
+            [row[i] if i is not None and i < len(row) else "" for i in positions]
+            for row in reader
+        )
+
+        # The output is only opened, and truncated, once the input is known to be
+        # usable.
+        with open(output_path, "w", newline="") as output_file:
+            writer = csv.writer(output_file)
+            writer.writerow(OUTPUT_COLUMNS)
+
+            results = _process_chunks(_read_chunks(ordered_rows, chunk_size), workers)
+            for output_rows, chunk_failed in results:
+                writer.writerows(output_rows)
+                loans += len(output_rows)
+                failed += chunk_failed
+
+    summary = PortfolioSummary(loans, failed, time.perf_counter() - start)
+    logger.info(
+        "Processed %d loans (%d failed) in %.2f s: %.0f loans/second",
+        summary.loans,
+        summary.failed,
+        summary.seconds,
+        summary.loans_per_second,
+    )
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Calculate monthly repayments for a portfolio of car loans."
+    )
+    parser.add_argument("input", help="CSV file of loans")
+    parser.add_argument("output", help="CSV file to write results to")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    summary = run_portfolio(args.input, args.output, args.workers, args.chunk_size)
+    print(
+        f"Processed {summary.loans} loans ({summary.failed} failed) in "
+        f"{summary.seconds:.2f} s: {summary.loans_per_second:,.0f} loans/second"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import pytest
+from amortization import amortization_schedule_block, iter_amortization_schedule
+from car_repayment import calculate_monthly_repayment
+
+
+def test_iter_amortization_schedule_pays_off_loan():
+    """
+    Test that the schedule has one row per month, a constant payment,
+    and a balance that reaches zero after the last payment.
+    """
+    rows = list(iter_amortization_schedule(30000.0, 5.0, 5.0, 5000.0))
+    payment = calculate_monthly_repayment(30000.0, 5.0, 5.0, 5000.0)
+
+    assert len(rows) == 60
+    assert [row.month for row in rows] == list(range(1, 61))
+    assert all(row.payment == pytest.approx(payment) for row in rows)
+    assert rows[0].interest == pytest.approx(25000.0 * 0.05 / 12)
+    assert sum(row.principal for row in rows) == pytest.approx(25000.0)
+    assert rows[-1].balance == pytest.approx(0.0, abs=1e-6)
+
+
+def test_iter_amortization_schedule_zero_interest():
+    """
+    Test that with a zero interest rate every payment is pure principal.
+    """
+    rows = list(iter_amortization_schedule(12000.0, 1.0, 0.0))
+    assert all(row.interest == 0 for row in rows)
+    assert rows[5].balance == pytest.approx(6000.0)
+
+
+def test_iter_amortization_schedule_invalid_input():
+    """
+    Test that invalid loans and fractional terms raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        list(iter_amortization_schedule(15000, 5, 5, 20000))
+    with pytest.raises(ValueError):
+        list(iter_amortization_schedule(15000, 1.01, 5))
+
+
+def test_amortization_schedule_block_matches_generator():
+    """
+    Test that the columnar block for a portfolio matches the lazy schedules,
+    with shorter loans padded with zeros.
+    """
+    loans = [(30000.0, 5.0, 5.0, 5000.0), (12000.0, 1.0, 0.0, 0.0)]
+    block = amortization_schedule_block(*zip(*loans))
+
+    assert block["balance"].shape == (2, 60)
+    for i, loan in enumerate(loans):
+        for row in iter_amortization_schedule(*loan):
+            column = row.month - 1
+            assert block["month"][i, column] == row.month
+            assert block["payment"][i, column] == pytest.approx(row.payment)
+            assert block["interest"][i, column] == pytest.approx(row.interest)
+            assert block["principal"][i, column] == pytest.approx(row.principal)
+            assert block["balance"][i, column] == pytest.approx(row.balance, abs=1e-6)
+    assert (block["payment"][1, 12:] == 0).all()
+
+
+def test_amortization_schedule_block_invalid_input():
+    """
+    Test that a single invalid loan in the portfolio raises a ValueError.
+    """
+    with pytest.raises(ValueError, match="Price cannot be negative"):
+        amortization_schedule_block([20000, -10000], 5, 5)
+    with pytest.raises(ValueError):
+        amortization_schedule_block([20000, 15000], 5, 5, [0, 20000])
+    with pytest.raises(ValueError):
+        amortization_schedule_block([20000, 15000], [5, 0], 5)
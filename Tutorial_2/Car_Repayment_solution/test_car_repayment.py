@@ -1,4 +1,11 @@
+import importlib
+import os
+import subprocess
+import sys
+
+import car_repayment
 import pytest
+from call_metrics import CallMetrics, set_metrics_hook
 from car_repayment import calculate_monthly_repayment, get_user_input
 
 
@@ -63,3 +70,54 @@ def test_get_user_input_invalid(monkeypatch):
     monkeypatch.setattr("builtins.input", lambda _: next(inputs))
     with pytest.raises(ValueError):
         get_user_input()
+
+
+def test_import_does_not_configure_root_logger():
+    """
+    Test that importing the module leaves logging configuration to the application.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import logging, car_repayment; print(logging.getLogger().handlers)",
+        ],
+        cwd=directory,
+        env={**os.environ, "PYTHONPATH": os.path.dirname(directory)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_import_does_not_change_sys_path():
+    """
+    Test that importing the module leaves sys.path to the application.
+    """
+    path = list(sys.path)
+    importlib.reload(car_repayment)
+    assert sys.path == path
+
+
+def test_metrics_hook_counts_calls_and_failures():
+    """
+    Test that an installed CallMetrics collector records calls, validation
+    failures and latencies, and that removing it stops collection.
+    """
+    metrics = CallMetrics()
+    set_metrics_hook(metrics)
+    try:
+        calculate_monthly_repayment(30000.0, 5.0, 5.0, 5000.0)
+        with pytest.raises(ValueError):
+            calculate_monthly_repayment(-10000, 5, 5, 0)
+    finally:
+        set_metrics_hook(None)
+    calculate_monthly_repayment(30000.0, 5.0, 5.0, 5000.0)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["calls"] == 2
+    assert snapshot["calls_by_function"] == {"calculate_monthly_repayment": 2}
+    assert snapshot["validation_failures"] == 1
+    assert sum(snapshot["latency_histogram"].values()) == 2
@@ -0,0 +1,98 @@
+import pytest
+from car_repayment import calculate_monthly_repayment
+from car_repayment_solvers import (
+    solve_affordable_price,
+    solve_interest_rate,
+    solve_interest_rate_batch,
+    solve_required_deposit,
+    solve_term,
+    solve_term_batch,
+)
+
+
+def test_solve_affordable_price_round_trip():
+    """
+    Test that the affordable price gives back the monthly repayment it was solved for,
+    with and without interest.
+    """
+    price = solve_affordable_price(5000.0, 5.0, 10.0, 20000.0)
+    assert calculate_monthly_repayment(price, 5.0, 10.0, 20000.0) == pytest.approx(
+        5000.0
+    )
+    assert solve_affordable_price(1000.0, 2.0, 0.0) == pytest.approx(24000.0)
+
+
+def test_solve_required_deposit():
+    """
+    Test the required deposit, and that no deposit is needed when the repayment
+    already covers the full price.
+    """
+    deposit = solve_required_deposit(300000.0, 5000.0, 5.0, 10.0)
+    assert calculate_monthly_repayment(300000.0, 5.0, 10.0, deposit) == pytest.approx(
+        5000.0
+    )
+    assert solve_required_deposit(10000.0, 5000.0, 5.0, 10.0) == 0.0
+
+
+def test_solve_term_round_trip():
+    """
+    Test that the solved term gives back the monthly repayment.
+    """
+    years = solve_term(30000.0, 471.78, 5.0, 5000.0)
+    assert years == pytest.approx(5.0, rel=1e-4)
+    assert solve_term(12000.0, 1000.0, 0.0) == pytest.approx(1.0)
+    assert solve_term_batch([12000.0, 24000.0], 1000.0, 0.0).tolist() == [1.0, 2.0]
+
+
+def test_solve_term_repayment_too_small():
+    """
+    Test that a repayment that does not cover the interest raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        solve_term(100000.0, 500.0, 12.0)
+
+
+def test_solve_interest_rate_round_trip():
+    """
+    Test that the solved rate gives back the monthly repayment, and that the
+    iteration counter is reported.
+    """
+    repayment = calculate_monthly_repayment(30000.0, 5.0, 7.25, 5000.0)
+    rate, iterations, converged = solve_interest_rate(30000.0, repayment, 5.0, 5000.0)
+    assert rate == pytest.approx(7.25)
+    assert converged
+    assert 0 < iterations < 20
+
+
+def test_solve_interest_rate_batch():
+    """
+    Test that the batch solver handles a zero rate and high rates together.
+    """
+    rates = [0.0, 3.5, 29.0, 120.0]
+    repayments = [calculate_monthly_repayment(20000.0, 4.0, rate) for rate in rates]
+    result = solve_interest_rate_batch(20000.0, repayments, 4.0)
+    assert result.value == pytest.approx(rates)
+    assert result.converged.all()
+    assert result.iterations[0] == 0
+
+
+def test_solve_interest_rate_invalid_input():
+    """
+    Test that impossible targets and invalid inputs raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        solve_interest_rate(20000.0, 100.0, 4.0)
+    with pytest.raises(ValueError):
+        solve_interest_rate(-20000.0, 500.0, 4.0)
+    with pytest.raises(ValueError):
+        solve_interest_rate(15000.0, 500.0, 4.0, 20000.0)
+
+
+def test_solve_interest_rate_zero_loan():
+    """
+    Test that a loan of 0 solves to a zero rate with no repayment, and raises a
+    ValueError with one.
+    """
+    assert solve_interest_rate(10000.0, 0.0, 5.0, 10000.0) == (0.0, 0, True)
+    with pytest.raises(ValueError):
+        solve_interest_rate(10000.0, 100.0, 5.0, 10000.0)
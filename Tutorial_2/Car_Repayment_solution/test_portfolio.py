@@ -0,0 +1,98 @@
+import csv
+
+import pytest
+from car_repayment import (
+    DEPOSIT_EXCEEDS_PRICE,
+    INVALID_INPUT,
+    NEGATIVE_PRICE,
+    NEGATIVE_YEARS,
+    NO_PAYMENTS,
+    OK,
+    calculate_monthly_repayment,
+    calculate_monthly_repayment_batch,
+)
+from portfolio import run_portfolio
+
+
+def test_calculate_monthly_repayment_batch_matches_scalar():
+    """
+    Test that valid loans match the scalar calculation, including a zero
+    interest rate and the default deposit.
+    """
+    loans = [(30000.0, 5.0, 5.0, 5000.0), (20000.0, 4.0, 0.0, 2000.0)]
+    repayment, error_code = calculate_monthly_repayment_batch(*zip(*loans))
+
+    assert error_code.tolist() == [OK, OK]
+    for i, loan in enumerate(loans):
+        assert repayment[i] == pytest.approx(calculate_monthly_repayment(*loan))
+
+    repayment, error_code = calculate_monthly_repayment_batch(12000, 1, 0)
+    assert repayment == pytest.approx(1000.0)
+
+
+def test_calculate_monthly_repayment_batch_error_codes():
+    """
+    Test that invalid loans get the error code of the first failing rule
+    and a NaN repayment instead of raising a ValueError.
+    """
+    repayment, error_code = calculate_monthly_repayment_batch(
+        [-10000, 15000, 20000, -5000, 20000, float("nan")],
+        [5, 5, -3, -3, 0, 5],
+        [5, 5, 5, 5, 5, 5],
+        [0, 20000, 0, 0, 0, 0],
+    )
+    assert error_code.tolist() == [
+        NEGATIVE_PRICE,
+        DEPOSIT_EXCEEDS_PRICE,
+        NEGATIVE_YEARS,
+        NEGATIVE_PRICE,
+        NO_PAYMENTS,
+        INVALID_INPUT,
+    ]
+    assert all(value != value for value in repayment.tolist())
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_portfolio(tmp_path, workers):
+    """
+    Test a portfolio run end to end, with and without a process pool.
+    """
+    input_path = tmp_path / "loans.csv"
+    output_path = tmp_path / "results.csv"
+    input_path.write_text(
+        "price,years,annual_interest_rate,deposit\n"
+        "30000,5,5,5000\n"
+        "20000,4,0,\n"
+        "15000,5,5,20000\n"
+        "abc,5,5,0\n"
+    )
+
+    summary = run_portfolio(str(input_path), str(output_path), workers, chunk_size=2)
+
+    assert summary.loans == 4
+    assert summary.failed == 2
+    with open(output_path, newline="") as output_file:
+        rows = list(csv.DictReader(output_file))
+    assert float(rows[0]["monthly_repayment"]) == pytest.approx(471.78, rel=1e-3)
+    assert float(rows[1]["monthly_repayment"]) == pytest.approx(20000 / 48)
+    assert [int(row["error_code"]) for row in rows] == [
+        OK,
+        OK,
+        DEPOSIT_EXCEEDS_PRICE,
+        INVALID_INPUT,
+    ]
+    assert rows[2]["monthly_repayment"] == ""
+
+
+def test_run_portfolio_missing_column(tmp_path):
+    """
+    Test that an input file without a required column raises a ValueError, and
+    leaves an existing output file untouched.
+    """
+    input_path = tmp_path / "loans.csv"
+    input_path.write_text("price,years\n30000,5\n")
+    output_path = tmp_path / "results.csv"
+    output_path.write_text("previous results\n")
+    with pytest.raises(ValueError):
+        run_portfolio(str(input_path), str(output_path))
+    assert output_path.read_text() == "previous results\n"
@@ -0,0 +1,77 @@
+"""
+Benchmark the batch investment calculator against a Python loop over the
+scalar ``calculate_investment_growth`` function.
+
+Usage:
+    python benchmark_investment_batch.py [max_exponent]
+
+Sizes run from 10^3 up to 10^max_exponent rows (default 7). The scalar loop is
+only timed up to 10^5 rows and extrapolated beyond that, since it scales linearly.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# The modules shared by the Tutorial 2 solutions, such as call_metrics.py, live in
+# the directory above this one.
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from investment_batch import calculate_investment_growth_batch
+from investment_calculator import calculate_investment_growth
+
+SCALAR_LOOP_MAX_ROWS = 10**5
+
+
+def make_scenarios(rows: int, seed: int = 0) -> tuple[np.ndarray, ...]:
+    """Generate random scenarios, with roughly 10% zero-return rows."""
+    rng = np.random.default_rng(seed)
+    monthly_investment = rng.uniform(100, 10_000, rows)
+    annual_return = rng.uniform(0, 15, rows)
+    annual_return[rng.random(rows) < 0.1] = 0.0
+    years = rng.integers(1, 41, rows).astype(np.float64)
+    return monthly_investment, annual_return, years
+
+
+def time_scalar_loop(monthly_investment, annual_return, years) -> float:
+    """Return the seconds taken to run the scalar function over every row."""
+    rows = zip(monthly_investment.tolist(), annual_return.tolist(), years.tolist())
+    start = time.perf_counter()
+    for scenario in rows:
+        calculate_investment_growth(*scenario)
+    return time.perf_counter() - start
+
+
+def time_batch(monthly_investment, annual_return, years) -> float:
+    """Return the seconds taken by one batch call."""
+    start = time.perf_counter()
+    calculate_investment_growth_batch(monthly_investment, annual_return, years)
+    return time.perf_counter() - start
+
+
+def main():
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+    print(f"{'rows':>10} {'loop (s)':>12} {'batch (s)':>12} {'speedup':>10}")
+    for exponent in range(3, max_exponent + 1):
+        rows = 10**exponent
+        scenarios = make_scenarios(rows)
+        batch_seconds = time_batch(*scenarios)
+
+        if rows <= SCALAR_LOOP_MAX_ROWS:
+            loop_seconds = time_scalar_loop(*scenarios)
+            loop_label = f"{loop_seconds:12.4f}"
+        else:
+            sample = tuple(column[:SCALAR_LOOP_MAX_ROWS] for column in scenarios)
+            loop_seconds = time_scalar_loop(*sample) * rows / SCALAR_LOOP_MAX_ROWS
+            loop_label = f"{'~' + format(loop_seconds, '.4f'):>12}"
+
+        print(
+            f"{rows:>10} {loop_label} {batch_seconds:12.4f} "
+            f"{loop_seconds / batch_seconds:9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
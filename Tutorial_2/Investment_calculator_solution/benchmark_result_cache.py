@@ -0,0 +1,84 @@
+"""
+Benchmark an interactive what-if sweep over a grid of 100 annual returns and
+480 monthly horizons, with results calculated from scratch, cached in an LRU
+cache, or looked up in a GrowthTable, against one batch call for the whole grid.
+
+Usage:
+    python benchmark_result_cache.py [passes]
+
+Each pass calls calculate_investment_growth once per grid point, like a user
+dragging the sliders across the whole grid; the default is 10 passes. The LRU
+cache starts empty, so its first pass is all misses.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# The modules shared by the Tutorial 2 solutions, such as call_metrics.py, live in
+# the directory above this one.
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from investment_batch import calculate_investment_growth_batch
+from investment_calculator import (
+    GrowthTable,
+    calculate_investment_growth,
+    disable_result_cache,
+    enable_result_cache,
+    result_cache_info,
+    use_growth_table,
+)
+
+MONTHLY_INVESTMENT = 1000
+ANNUAL_RETURNS = [0.25 * step for step in range(1, 101)]
+YEARS = [month / 12 for month in range(1, 481)]
+
+
+def sweep(passes: int) -> float:
+    """Return the seconds taken to run the sweep the given number of times."""
+    start = time.perf_counter()
+    for _ in range(passes):
+        for annual_return in ANNUAL_RETURNS:
+            for years in YEARS:
+                calculate_investment_growth(MONTHLY_INVESTMENT, annual_return, years)
+    return time.perf_counter() - start
+
+
+def batch_sweep(passes: int) -> float:
+    """Return the seconds taken to calculate the whole grid once per pass in a batch."""
+    annual_return, years = np.meshgrid(ANNUAL_RETURNS, YEARS, indexing="ij")
+    start = time.perf_counter()
+    for _ in range(passes):
+        calculate_investment_growth_batch(MONTHLY_INVESTMENT, annual_return, years)
+    return time.perf_counter() - start
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    calls = passes * len(ANNUAL_RETURNS) * len(YEARS)
+    print(
+        f"{len(ANNUAL_RETURNS)} x {len(YEARS)} grid, {passes} passes, {calls:,} calls"
+    )
+
+    disable_result_cache()
+    print(f"{'no cache':<14} {sweep(passes):8.3f} s")
+
+    enable_result_cache(maxsize=len(ANNUAL_RETURNS) * len(YEARS))
+    print(f"{'LRU cache':<14} {sweep(passes):8.3f} s  {result_cache_info()}")
+
+    start = time.perf_counter()
+    table = GrowthTable([MONTHLY_INVESTMENT], ANNUAL_RETURNS, YEARS)
+    build_seconds = time.perf_counter() - start
+    use_growth_table(table)
+    print(
+        f"{'table':<14} {sweep(passes):8.3f} s  "
+        f"(built in {build_seconds:.3f} s, {len(table):,} results)"
+    )
+    disable_result_cache()
+
+    print(f"{'batch':<14} {batch_sweep(passes):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import logging
+from collections.abc import Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+logger = logging.getLogger(__name__)
+
+
+def calculate_investment_growth_batch(
+    monthly_investment: ArrayLike, annual_return: ArrayLike, years: ArrayLike
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the growth of many investment scenarios at once.
+
+    This is the vectorized counterpart of ``calculate_investment_growth``. Each
+    argument may be a scalar or an array; they are broadcast against each other
+    and every element is treated as one scenario with the same semantics as the
+    scalar function:
+      - num_months = years * 12
+      - Investment Amount = monthly_investment * num_months
+      - Expected Amount uses the future value of an annuity formula, except where
+        annual_return is 0, where it equals the Investment Amount.
+      - Wealth Gain = Expected Amount - Investment Amount
+
+    Validation is done once for the whole batch instead of per scenario.
+
+    :param monthly_investment: The monthly amounts invested (in Rands).
+    :param annual_return: The expected annual returns as percentages.
+    :param years: The investment periods in years.
+    :return: A tuple of arrays (investment_amount, expected_amount, wealth_gain).
+    :raises ValueError: If any of the input values are negative.
+    """
+    monthly_investment, annual_return, years = np.broadcast_arrays(
+        np.asarray(monthly_investment, dtype=np.float64),
+        np.asarray(annual_return, dtype=np.float64),
+        np.asarray(years, dtype=np.float64),
+    )
+    logger.debug(
+        "Calculating investment growth for a batch of %d scenarios",
+        monthly_investment.size,
+    )
+
+    if (monthly_investment < 0).any():
+        raise ValueError("Monthly investment must be non-negative.")
+    if (annual_return < 0).any():
+        raise ValueError("Annual return must be non-negative.")
+    if (years < 0).any():
+        raise ValueError("Investment period (years) must be non-negative.")
+
+    num_months = years * 12
+    investment_amount = monthly_investment * num_months
+
+    # Only scenarios with a non-zero return go through the annuity formula; the
+    # rest keep the Investment Amount, exactly like the scalar branch.
+    has_return = annual_return != 0
+    monthly_rate = (annual_return / 100) / 12
+    growth = np.power(
+        1 + monthly_rate, num_months, where=has_return, out=np.ones_like(monthly_rate)
+    )
+    expected_amount = np.divide(
+        monthly_investment * (growth - 1),
+        monthly_rate,
+        where=has_return,
+        out=np.array(investment_amount),
+    )
+
+    wealth_gain = expected_amount - investment_amount
+    return investment_amount, expected_amount, wealth_gain
+
+
+def calculate_investment_growth_table(
+    table: Mapping[str, ArrayLike],
+) -> dict[str, np.ndarray]:
+    """
+    Calculate investment growth for a columnar table of scenarios.
+
+    The table is any mapping with ``monthly_investment``, ``annual_return`` and
+    ``years`` columns (a dict of lists or arrays, a pandas DataFrame, ...).
+
+    :param table: The input columns.
+    :return: A dict with ``investment_amount``, ``expected_amount`` and
+        ``wealth_gain`` columns.
+    :raises KeyError: If one of the input columns is missing.
+    :raises ValueError: If any of the input values are negative.
+    """
+    investment_amount, expected_amount, wealth_gain = calculate_investment_growth_batch(
+        table["monthly_investment"], table["annual_return"], table["years"]
+    )
+    return {
+        "investment_amount": investment_amount,
+        "expected_amount": expected_amount,
+        "wealth_gain": wealth_gain,
+    }
@@ -1,6 +1,22 @@
+import functools
 import logging
+import sys
+from collections.abc import Callable, Iterable
+from pathlib import Path
 
-logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
+import numpy as np
+
+if __name__ == "__main__":
+    # Run as a script: put the modules shared by the Tutorial 2 solutions, such as
+    # call_metrics.py, on the import path. Importers and the tests do it themselves.
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# The metrics hook is shared with the car repayment calculator.
+import call_metrics
+from call_metrics import call_with_metrics
+from investment_batch import calculate_investment_growth_batch
+
+logger = logging.getLogger(__name__)
 
 
 def calculate_investment_growth(
@@ -31,10 +47,34 @@ def calculate_investment_growth(
     :return: A tuple (investment_amount, expected_amount, wealth_gain).
     :raises ValueError: If any of the input values are negative.
     """
-    logging.debug(
-        f"Calculating investment growth with monthly_investment={monthly_investment}, annual_return={annual_return}, years={years}"
+    hook = call_metrics.metrics_hook
+    if hook is None:
+        return _calculate(monthly_investment, annual_return, years)
+    return call_with_metrics(
+        hook,
+        "calculate_investment_growth",
+        _calculate,
+        monthly_investment,
+        annual_return,
+        years,
     )
 
+
+def _calculate_investment_growth(
+    monthly_investment: float, annual_return: float, years: float
+) -> tuple[float, float, float]:
+    """Validate the inputs and apply the future value of an annuity formula."""
+    # Checked once per call so the quiet path skips every debug call below.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(
+            "Calculating investment growth with monthly_investment=%s, "
+            "annual_return=%s, years=%s",
+            monthly_investment,
+            annual_return,
+            years,
+        )
+
     if monthly_investment < 0:
         raise ValueError("Monthly investment must be non-negative.")
     if annual_return < 0:
@@ -44,9 +84,10 @@ def calculate_investment_growth(
 
     num_months = years * 12
     investment_amount = monthly_investment * num_months
-    logging.debug(
-        f"Number of months: {num_months}, Investment Amount: {investment_amount}"
-    )
+    if debug:
+        logger.debug(
+            "Number of months: %s, Investment Amount: %s", num_months, investment_amount
+        )
 
     if annual_return == 0:
         expected_amount = investment_amount
@@ -57,11 +98,100 @@ def calculate_investment_growth(
         )
 
     wealth_gain = expected_amount - investment_amount
-    logging.debug(f"Expected Amount: {expected_amount}, Wealth Gain: {wealth_gain}")
+    if debug:
+        logger.debug(
+            "Expected Amount: %s, Wealth Gain: %s", expected_amount, wealth_gain
+        )
 
     return investment_amount, expected_amount, wealth_gain
 
 
+# Where calculate_investment_growth gets its results from: calculated from
+# scratch by default, or looked up in an LRU cache or a precomputed GrowthTable.
+# Results served from either skip the validation and the debug logging.
+_calculate: Callable[[float, float, float], tuple[float, float, float]] = (
+    _calculate_investment_growth
+)
+
+
+class GrowthTable(dict):
+    """
+    The results of calculate_investment_growth for every point of a grid of
+    monthly investments, annual returns and periods, keyed by
+    (monthly_investment, annual_return, years).
+
+    The whole grid is calculated in one call to the batch API. Scenarios off the
+    grid are calculated one at a time, and not added to the table.
+
+    :raises ValueError: If any of the grid values are negative.
+    """
+
+    def __init__(
+        self,
+        monthly_investments: Iterable[float],
+        annual_returns: Iterable[float],
+        years: Iterable[float],
+    ):
+        grid = np.meshgrid(
+            np.fromiter(monthly_investments, dtype=np.float64),
+            np.fromiter(annual_returns, dtype=np.float64),
+            np.fromiter(years, dtype=np.float64),
+            indexing="ij",
+        )
+        results = calculate_investment_growth_batch(*grid)
+        super().__init__(
+            zip(
+                zip(*(column.ravel().tolist() for column in grid)),
+                zip(*(column.ravel().tolist() for column in results)),
+            )
+        )
+
+    def __missing__(
+        self, key: tuple[float, float, float]
+    ) -> tuple[float, float, float]:
+        return _calculate_investment_growth(*key)
+
+
+def enable_result_cache(maxsize: int = 4096):
+    """
+    Cache the results of calculate_investment_growth in a bounded LRU cache keyed
+    by (monthly_investment, annual_return, years).
+
+    This replaces any cache or table already in use.
+    """
+    global _calculate
+    _calculate = functools.lru_cache(maxsize=maxsize)(_calculate_investment_growth)
+
+
+def use_growth_table(table: GrowthTable):
+    """Look results up in a precomputed table instead of a cache."""
+    global _calculate
+
+    def lookup(monthly_investment, annual_return, years):
+        return table[monthly_investment, annual_return, years]
+
+    _calculate = lookup
+
+
+def disable_result_cache():
+    """Drop any cache or table and calculate every result from scratch."""
+    global _calculate
+    _calculate = _calculate_investment_growth
+
+
+def result_cache_info() -> functools._CacheInfo | None:
+    """Return the LRU cache's hits, misses, maxsize and currsize, if it is enabled."""
+    cache_info = getattr(_calculate, "cache_info", None)
+    return cache_info() if cache_info is not None else None
+
+
+def clear_result_cache():
+    """Invalidate every cached result and reset the cache's stats."""
+    cache_clear = getattr(_calculate, "cache_clear", None)
+    if cache_clear is not None:
+        cache_clear()
+
+
 def get_user_input() -> tuple[float, float, float]:
     """
     Prompt the user to enter the monthly investment amount, expected annual return, and the investment period in years.
@@ -76,11 +206,14 @@ def get_user_input() -> tuple[float, float, float]:
         annual_return = float(input("Enter the expected annual return (in %): "))
         years = float(input("Enter the investment period (in years): "))
     except ValueError as e:
-        logging.error("Invalid input. Please enter numeric values.")
+        logger.error("Invalid input. Please enter numeric values.")
         raise ValueError("Invalid input. Please ensure all inputs are numbers.") from e
 
-    logging.debug(
-        f"User input received: monthly_investment={monthly_investment}, annual_return={annual_return}, years={years}"
+    logger.debug(
+        "User input received: monthly_investment=%s, annual_return=%s, years=%s",
+        monthly_investment,
+        annual_return,
+        years,
     )
     return monthly_investment, annual_return, years
 
@@ -92,6 +225,7 @@ def main():
     Retrieves user input, calculates the investment growth, and displays the results.
     Handles any exceptions from input validation or calculation.
     """
+    logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
     try:
         monthly_investment, annual_return, years = get_user_input()
         investment_amount, expected_amount, wealth_gain = calculate_investment_growth(
@@ -102,7 +236,7 @@ def main():
         print(f"Expected Amount (Rands): {expected_amount:.2f}")
         print(f"Wealth Gain (Rands): {wealth_gain:.2f}")
     except ValueError as e:
-        logging.error(f"Error in calculation: {e}")
+        logger.error("Error in calculation: %s", e)
         print(f"Error: {e}")
 
 
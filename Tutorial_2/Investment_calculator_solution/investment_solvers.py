@@ -0,0 +1,221 @@
+"""
+Inverse solvers for the investment growth formula.
+
+``calculate_investment_growth`` answers "what will my savings grow to?". These
+functions answer the inverse questions, such as "what return do I need to reach
+R1m?", without calling it in a search loop:
+
+  - the monthly investment and the period have closed-form solutions;
+  - the annual return has none, so it is found with a bracketed Newton iteration
+    and the number of iterations is reported alongside the answer.
+
+Every solver has a batched form taking arrays, and a scalar form returning floats.
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# SolverResult and as_arrays are shared with the car repayment solvers. They live in the
+# Tutorial_2 directory, which conftest.py puts on the import path for the tests.
+from solvers_common import SolverResult, as_arrays
+
+
+def _annuity_factor(monthly_rate: np.ndarray, num_months: np.ndarray) -> np.ndarray:
+    """Return expected_amount / monthly_investment, i.e. ((1 + r) ** n - 1) / r."""
+    return np.divide(
+        np.expm1(num_months * np.log1p(monthly_rate)),
+        monthly_rate,
+        where=monthly_rate != 0,
+        out=np.array(num_months),
+    )
+
+
+def solve_monthly_investment_batch(
+    target_amount: ArrayLike, annual_return: ArrayLike, years: ArrayLike
+) -> np.ndarray:
+    """
+    Calculate the monthly investment needed to reach each target amount.
+
+    Formula:
+      monthly_investment = target_amount * monthly_rate / ((1 + monthly_rate) ** num_months - 1)
+    With a zero annual return, monthly_investment = target_amount / num_months.
+
+    :raises ValueError: If any input is negative, or a period is 0.
+    """
+    target_amount, annual_return, years = as_arrays(target_amount, annual_return, years)
+    if (target_amount < 0).any():
+        raise ValueError("Target amount must be non-negative.")
+    if (annual_return < 0).any():
+        raise ValueError("Annual return must be non-negative.")
+    if (years <= 0).any():
+        raise ValueError("Investment period (years) must be positive.")
+
+    monthly_rate = (annual_return / 100) / 12
+    return target_amount / _annuity_factor(monthly_rate, years * 12)
+
+
+def solve_investment_period_batch(
+    target_amount: ArrayLike, monthly_investment: ArrayLike, annual_return: ArrayLike
+) -> np.ndarray:
+    """
+    Calculate the investment period, in years, needed to reach each target amount.
+
+    Formula:
+      num_months = log(1 + target_amount * monthly_rate / monthly_investment) / log(1 + monthly_rate)
+    With a zero annual return, num_months = target_amount / monthly_investment.
+    The result is years = num_months / 12, which need not be a whole number of months.
+
+    :raises ValueError: If any input is negative, or a monthly investment is 0.
+    """
+    target_amount, monthly_investment, annual_return = as_arrays(
+        target_amount, monthly_investment, annual_return
+    )
+    if (target_amount < 0).any():
+        raise ValueError("Target amount must be non-negative.")
+    if (monthly_investment <= 0).any():
+        raise ValueError("Monthly investment must be positive.")
+    if (annual_return < 0).any():
+        raise ValueError("Annual return must be non-negative.")
+
+    monthly_rate = (annual_return / 100) / 12
+    num_months = np.divide(
+        np.log1p(target_amount * monthly_rate / monthly_investment),
+        np.log1p(monthly_rate),
+        where=monthly_rate != 0,
+        out=np.array(target_amount / monthly_investment),
+    )
+    return num_months / 12
+
+
+def solve_annual_return_batch(
+    target_amount: ArrayLike,
+    monthly_investment: ArrayLike,
+    years: ArrayLike,
+    tolerance: float = 1e-12,
+    max_iterations: int = 100,
+) -> SolverResult:
+    """
+    Calculate the annual return (as a percentage) needed to reach each target amount.
+
+    The expected amount grows with the rate, so the root of
+      f(r) = monthly_investment * ((1 + r) ** n - 1) / r - target_amount
+    is bracketed in (0, (target_amount / monthly_investment) ** (1 / (n - 1)) - 1].
+    Newton steps are taken from the usual small-rate approximation and fall back to
+    bisection whenever they would leave the bracket.
+
+    :param tolerance: the change in monthly rate below which a scenario has converged.
+    :param max_iterations: the maximum number of iterations.
+    :return: a SolverResult of arrays (annual_return, iterations, converged).
+    :raises ValueError: If any input is negative, a period is not longer than one
+        month, or a target is below the total amount invested.
+    """
+    target_amount, monthly_investment, years = as_arrays(
+        target_amount, monthly_investment, years
+    )
+    if (target_amount < 0).any():
+        raise ValueError("Target amount must be non-negative.")
+    if (monthly_investment <= 0).any():
+        raise ValueError("Monthly investment must be positive.")
+    num_months = years * 12
+    if (num_months <= 1).any():
+        raise ValueError("Investment period must be longer than one month.")
+    if (target_amount < monthly_investment * num_months).any():
+        raise ValueError(
+            "Target amount cannot be reached with a non-negative annual return."
+        )
+
+    # Targets equal to the amount invested need no return at all.
+    active = target_amount > monthly_investment * num_months
+    rate = np.zeros_like(target_amount)
+    iterations = np.zeros(target_amount.shape, dtype=np.int64)
+    converged = ~active
+
+    low = np.zeros_like(target_amount)
+    high = np.array((target_amount / monthly_investment) ** (1 / (num_months - 1)) - 1)
+    rate[active] = np.minimum(
+        2 * (target_amount / (monthly_investment * num_months) - 1) / (num_months - 1),
+        high / 2,
+    )[active]
+
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        r, n, m = rate[active], num_months[active], monthly_investment[active]
+        growth = np.exp(n * np.log1p(r))
+        factor = np.expm1(n * np.log1p(r)) / r
+        f = m * factor - target_amount[active]
+        derivative = m * (n * growth / (1 + r) - factor) / r
+
+        below = f < 0
+        low[active] = np.where(below, r, low[active])
+        high[active] = np.where(below, high[active], r)
+        candidate = r - f / derivative
+        inside = (candidate > low[active]) & (candidate < high[active])
+        new_rate = np.where(inside, candidate, (low[active] + high[active]) / 2)
+
+        iterations[active] += 1
+        done = np.abs(new_rate - r) <= tolerance * (1 + r)
+        rate[active] = new_rate
+        newly_converged = np.zeros_like(active)
+        newly_converged[active] = done
+        converged |= newly_converged
+        active &= ~newly_converged
+
+    return SolverResult(rate * 12 * 100, iterations, converged)
+
+
+def solve_monthly_investment(
+    target_amount: float, annual_return: float, years: float
+) -> float:
+    """
+    Calculate the monthly investment needed to reach a target amount.
+
+    :param target_amount: The amount to reach (in Rands).
+    :param annual_return: The expected annual return as a percentage.
+    :param years: The investment period in years.
+    :return: The monthly investment (in Rands).
+    :raises ValueError: If any input is negative, or years is 0.
+    """
+    return float(solve_monthly_investment_batch(target_amount, annual_return, years))
+
+
+def solve_investment_period(
+    target_amount: float, monthly_investment: float, annual_return: float
+) -> float:
+    """
+    Calculate the investment period needed to reach a target amount.
+
+    :param target_amount: The amount to reach (in Rands).
+    :param monthly_investment: The monthly amount invested (in Rands).
+    :param annual_return: The expected annual return as a percentage.
+    :return: The investment period in years.
+    :raises ValueError: If any input is negative, or monthly_investment is 0.
+    """
+    return float(
+        solve_investment_period_batch(target_amount, monthly_investment, annual_return)
+    )
+
+
+def solve_annual_return(
+    target_amount: float,
+    monthly_investment: float,
+    years: float,
+    tolerance: float = 1e-12,
+    max_iterations: int = 100,
+) -> SolverResult:
+    """
+    Calculate the annual return needed to reach a target amount.
+
+    :param target_amount: The amount to reach (in Rands).
+    :param monthly_investment: The monthly amount invested (in Rands).
+    :param years: The investment period in years.
+    :param tolerance: The convergence tolerance on the monthly rate.
+    :param max_iterations: The maximum number of iterations.
+    :return: A SolverResult (annual_return, iterations, converged).
+    :raises ValueError: If any input is negative, the period is not longer than one
+        month, or the target is below the total amount invested.
+    """
+    rate, iterations, converged = solve_annual_return_batch(
+        target_amount, monthly_investment, years, tolerance, max_iterations
+    )
+    return SolverResult(float(rate), int(iterations), bool(converged))
@@ -0,0 +1,285 @@
+"""
+Monte Carlo projections of a monthly investment with stochastic returns.
+
+``calculate_investment_growth`` assumes the same return every month. Here every
+path draws its own monthly returns from a distribution instead:
+
+  - "normal": returns are normally distributed around annual_return / 12;
+  - "lognormal": log returns are normally distributed, so a month never loses
+    more than everything;
+  - "bootstrap": returns are resampled from historical monthly returns, e.g. those
+    of Tutorial_4/ibm.csv or Tutorial_4/google_stock_price.csv.
+
+Each month the balance grows by that month's return and then receives the monthly
+investment, which matches the annuity formula when every return is the same.
+The returns of every path and month are drawn as one array, and the balances
+follow from their cumulative product. Paths can be sharded across a process pool
+with independent, reproducible random streams.
+
+Usage:
+    python monte_carlo.py 1000 8 20 [--distribution lognormal]
+    python monte_carlo.py 1000 0 20 --distribution bootstrap --history ../../Tutorial_4/ibm.csv
+
+The bootstrap takes its returns from the history alone, so its annual return
+must be 0.
+"""
+
+import argparse
+import csv
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DISTRIBUTIONS = ("normal", "lognormal", "bootstrap")
+DEFAULT_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+
+
+class SimulationResult(NamedTuple):
+    """
+    Percentile bands of the simulated balance at the end of every year.
+
+    bands[i, j] is the percentiles[i] percentile of the balance after months[j].
+    """
+
+    months: np.ndarray
+    investment_amount: np.ndarray
+    percentiles: tuple[float, ...]
+    bands: np.ndarray
+    mean: np.ndarray
+
+    @property
+    def expected_amount(self) -> dict[float, float]:
+        """The percentiles of the balance at the end of the period."""
+        return dict(zip(self.percentiles, self.bands[:, -1].tolist()))
+
+
+def load_monthly_returns(file_name: str, price_column: str | None = None) -> np.ndarray:
+    """
+    Load a daily price history from a CSV file and return its monthly returns.
+
+    The file needs a ``Date`` column in YYYY-MM-DD format and a price column. The
+    last price of each month is used; by default the price column is ``Close`` if
+    there is one, otherwise ``Price``.
+
+    :param file_name: The CSV file to read.
+    :param price_column: The name of the price column.
+    :return: The monthly returns as fractions (0.01 is 1%).
+    :raises ValueError: If the price column is missing or there are fewer than
+        two months of prices.
+    """
+    month_end_prices = {}
+    with open(file_name, newline="") as csv_file:
+        reader = csv.DictReader(csv_file)
+        if price_column is None:
+            price_column = "Close" if "Close" in reader.fieldnames else "Price"
+        if price_column not in reader.fieldnames:
+            raise ValueError(f"Column '{price_column}' not found in {file_name}.")
+        for row in reader:
+            # Rows are in date order, so the last price seen in a month wins.
+            month_end_prices[row["Date"][:7]] = float(row[price_column])
+
+    prices = np.array([month_end_prices[month] for month in sorted(month_end_prices)])
+    if prices.size < 2:
+        raise ValueError("At least two months of prices are needed.")
+    return prices[1:] / prices[:-1] - 1
+
+
+def _draw_monthly_returns(
+    rng: np.random.Generator,
+    paths: int,
+    num_months: int,
+    distribution: str,
+    annual_return: float,
+    annual_volatility: float,
+    history: np.ndarray | None,
+) -> np.ndarray:
+    """Draw the returns of every path and month, shaped (paths, months)."""
+    size = (paths, num_months)
+    if distribution == "bootstrap":
+        return rng.choice(history, size=size)
+
+    monthly_volatility = (annual_volatility / 100) / np.sqrt(12)
+    if distribution == "normal":
+        return rng.normal((annual_return / 100) / 12, monthly_volatility, size)
+
+    # Lognormal: pick the log-return mean so the average monthly growth factor
+    # matches the annual return compounded monthly.
+    mean_log_return = np.log1p((annual_return / 100) / 12) - monthly_volatility**2 / 2
+    return np.expm1(rng.normal(mean_log_return, monthly_volatility, size))
+
+
+def _simulate_shard(
+    seed: np.random.SeedSequence,
+    paths: int,
+    monthly_investment: float,
+    num_months: int,
+    distribution: str,
+    annual_return: float,
+    annual_volatility: float,
+    history: np.ndarray | None,
+) -> np.ndarray:
+    """
+    Simulate one shard of paths and return their balances at the end of every
+    year, as an array of shape (paths, years).
+
+    With growth_k the growth factor of month k and G_t = growth_1 * ... * growth_t,
+    the balance after month t is monthly_investment * G_t * (1 / G_1 + ... + 1 / G_t),
+    so every month is computed at once from cumulative products and sums.
+    """
+    rng = np.random.default_rng(seed)
+    growth = 1 + _draw_monthly_returns(
+        rng, paths, num_months, distribution, annual_return, annual_volatility, history
+    )
+    cumulative_growth = np.cumprod(growth, axis=1)
+    balances = monthly_investment * cumulative_growth
+    balances *= np.cumsum(1 / cumulative_growth, axis=1)
+    return balances[:, 11::12]
+
+
+def simulate_investment_growth(
+    monthly_investment: float,
+    years: int,
+    annual_return: float | None = None,
+    annual_volatility: float = 15.0,
+    distribution: str = "normal",
+    history: np.ndarray | None = None,
+    paths: int = 10_000,
+    percentiles: tuple[float, ...] = DEFAULT_PERCENTILES,
+    seed: int | None = None,
+    workers: int = 1,
+) -> SimulationResult:
+    """
+    Simulate the growth of a monthly investment over many random return paths.
+
+    Paths are split into one shard per worker, each with its own random stream
+    spawned from the seed, so a given seed and number of workers always give the
+    same result. Each shard holds the returns of all its paths and months at
+    once, a few arrays of paths * years * 12 * 8 bytes divided by the number of
+    workers.
+
+    :param monthly_investment: The monthly amount invested (in Rands).
+    :param years: The investment period in whole years.
+    :param annual_return: The expected annual return as a percentage, 0 by
+        default (normal and lognormal distributions). The bootstrap draws its
+        returns from the history alone and rejects any annual return but None.
+    :param annual_volatility: The annual standard deviation of returns as a
+        percentage (normal and lognormal distributions).
+    :param distribution: One of "normal", "lognormal" or "bootstrap".
+    :param history: Historical monthly returns to resample ("bootstrap" only), for
+        example from load_monthly_returns.
+    :param paths: The number of paths to simulate.
+    :param percentiles: The percentiles of the balance to report.
+    :param seed: The seed of the random number generator.
+    :param workers: The number of worker processes; 1 runs in this process.
+    :return: A SimulationResult with the yearly percentile bands.
+    :raises ValueError: If any input is invalid.
+    """
+    if monthly_investment < 0:
+        raise ValueError("Monthly investment must be non-negative.")
+    if years <= 0 or years != int(years):
+        raise ValueError("Investment period (years) must be a positive whole number.")
+    if annual_volatility < 0:
+        raise ValueError("Annual volatility must be non-negative.")
+    if paths <= 0:
+        raise ValueError("The number of paths must be positive.")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Distribution must be one of {', '.join(DISTRIBUTIONS)}.")
+    if distribution == "bootstrap" and (history is None or len(history) == 0):
+        raise ValueError("The bootstrap distribution needs a history of returns.")
+    if distribution == "bootstrap" and annual_return is not None:
+        raise ValueError(
+            "The bootstrap distribution takes its returns from the history, "
+            "not an annual return."
+        )
+    if annual_return is None:
+        annual_return = 0.0
+
+    num_months = int(years) * 12
+    workers = max(1, min(workers, paths))
+    shard_size, remainder = divmod(paths, workers)
+    shard_paths = [shard_size + (shard < remainder) for shard in range(workers)]
+    shard_seeds = np.random.SeedSequence(seed).spawn(workers)
+    shard_args = [
+        (
+            shard_seed,
+            shard_size,
+            monthly_investment,
+            num_months,
+            distribution,
+            annual_return,
+            annual_volatility,
+            None if history is None else np.asarray(history, dtype=np.float64),
+        )
+        for shard_seed, shard_size in zip(shard_seeds, shard_paths)
+    ]
+    logger.debug(
+        "Simulating %d paths over %d months in %d shards", paths, num_months, workers
+    )
+
+    if workers == 1:
+        shards = [_simulate_shard(*shard_args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shards = list(executor.map(_simulate_shard, *zip(*shard_args)))
+    year_end_balances = np.concatenate(shards)
+
+    months = np.arange(12, num_months + 1, 12)
+    return SimulationResult(
+        months=months,
+        investment_amount=monthly_investment * months,
+        percentiles=tuple(percentiles),
+        bands=np.percentile(year_end_balances, percentiles, axis=0),
+        mean=year_end_balances.mean(axis=0),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate a monthly investment with random returns."
+    )
+    parser.add_argument("monthly_investment", type=float)
+    parser.add_argument("annual_return", type=float, help="in %% per year")
+    parser.add_argument("years", type=int)
+    parser.add_argument("--volatility", type=float, default=15.0, help="in %% per year")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="normal")
+    parser.add_argument(
+        "--history", help="CSV price history for --distribution bootstrap"
+    )
+    parser.add_argument("--paths", type=int, default=10_000)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    annual_return = args.annual_return
+    if args.distribution == "bootstrap":
+        if annual_return != 0:
+            parser.error(
+                "annual_return must be 0 with --distribution bootstrap, which takes "
+                "its returns from --history"
+            )
+        annual_return = None
+
+    history = load_monthly_returns(args.history) if args.history else None
+    result = simulate_investment_growth(
+        args.monthly_investment,
+        args.years,
+        annual_return=annual_return,
+        annual_volatility=args.volatility,
+        distribution=args.distribution,
+        history=history,
+        paths=args.paths,
+        seed=args.seed,
+        workers=args.workers,
+    )
+
+    print(f"Investment Amount (Rands): {result.investment_amount[-1]:.2f}")
+    for percentile, amount in result.expected_amount.items():
+        print(f"Expected Amount, P{percentile:g} (Rands): {amount:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from investment_batch import (
+    calculate_investment_growth_batch,
+    calculate_investment_growth_table,
+)
+from investment_calculator import calculate_investment_growth
+
+
+def test_calculate_investment_growth_batch_matches_scalar():
+    """
+    Test that every scenario in a batch matches the scalar calculation,
+    including scenarios with a zero annual return or a zero period.
+    """
+    monthly_investment = [1000, 500, 0, 1500, 250.5]
+    annual_return = [12, 0, 8, 7.5, 0]
+    years = [10, 5, 3, 0, 2.5]
+
+    inv_amt, exp_amt, wealth_gain = calculate_investment_growth_batch(
+        monthly_investment, annual_return, years
+    )
+
+    for i, scenario in enumerate(zip(monthly_investment, annual_return, years)):
+        expected = calculate_investment_growth(*scenario)
+        assert inv_amt[i] == pytest.approx(expected[0])
+        assert exp_amt[i] == pytest.approx(expected[1])
+        assert wealth_gain[i] == pytest.approx(expected[2])
+
+
+def test_calculate_investment_growth_batch_broadcasts_scalars():
+    """
+    Test that scalar arguments are broadcast against array arguments.
+    """
+    inv_amt, exp_amt, wealth_gain = calculate_investment_growth_batch(1000, [0, 12], 10)
+    assert inv_amt.shape == (2,)
+    assert exp_amt[0] == pytest.approx(120000)
+    assert wealth_gain[0] == pytest.approx(0)
+    assert exp_amt[1] == pytest.approx(calculate_investment_growth(1000, 12, 10)[1])
+
+
+def test_calculate_investment_growth_batch_all_scalars():
+    """
+    Test that a batch of one scenario given as scalars matches the scalar calculation.
+    """
+    for scenario in [(1000, 12, 10), (500, 0, 5)]:
+        result = calculate_investment_growth_batch(*scenario)
+        assert result == pytest.approx(calculate_investment_growth(*scenario))
+
+
+def test_calculate_investment_growth_batch_invalid_input():
+    """
+    Test that a single negative value anywhere in the batch raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        calculate_investment_growth_batch([1000, -1000], [10, 10], [5, 5])
+    with pytest.raises(ValueError):
+        calculate_investment_growth_batch([1000, 1000], [10, -10], [5, 5])
+    with pytest.raises(ValueError):
+        calculate_investment_growth_batch([1000, 1000], [10, 10], [5, -5])
+
+
+def test_calculate_investment_growth_table():
+    """
+    Test the columnar entry point with a dict of columns.
+    """
+    table = {
+        "monthly_investment": np.array([1000.0, 500.0]),
+        "annual_return": np.array([12.0, 0.0]),
+        "years": np.array([10.0, 5.0]),
+    }
+    result = calculate_investment_growth_table(table)
+    assert set(result) == {"investment_amount", "expected_amount", "wealth_gain"}
+    assert result["expected_amount"][1] == pytest.approx(30000)
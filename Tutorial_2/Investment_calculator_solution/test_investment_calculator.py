@@ -1,5 +1,17 @@
+import logging
+
 import pytest
-from investment_calculator import calculate_investment_growth, get_user_input
+from call_metrics import CallMetrics, set_metrics_hook
+from investment_calculator import (
+    GrowthTable,
+    calculate_investment_growth,
+    clear_result_cache,
+    disable_result_cache,
+    enable_result_cache,
+    get_user_input,
+    result_cache_info,
+    use_growth_table,
+)
 
 
 def test_calculate_investment_growth_normal():
@@ -79,3 +91,77 @@ def test_get_user_input_invalid(monkeypatch):
     monkeypatch.setattr("builtins.input", lambda prompt: next(inputs))
     with pytest.raises(ValueError):
         get_user_input()
+
+
+def test_calculate_investment_growth_debug_logging(caplog):
+    """
+    Test that the calculation steps are logged at DEBUG level when enabled.
+    """
+    with caplog.at_level(logging.DEBUG, logger="investment_calculator"):
+        calculate_investment_growth(1000, 12, 10)
+    assert "Expected Amount" in caplog.text
+
+
+def test_metrics_hook_counts_calls_and_failures():
+    """
+    Test that an installed CallMetrics collector records calls, validation
+    failures and latencies, and that removing it stops collection.
+    """
+    metrics = CallMetrics()
+    set_metrics_hook(metrics)
+    try:
+        calculate_investment_growth(1000, 12, 10)
+        with pytest.raises(ValueError):
+            calculate_investment_growth(-1000, 10, 5)
+    finally:
+        set_metrics_hook(None)
+    calculate_investment_growth(1000, 12, 10)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["calls"] == 2
+    assert snapshot["calls_by_function"] == {"calculate_investment_growth": 2}
+    assert snapshot["validation_failures"] == 1
+    assert sum(snapshot["latency_histogram"].values()) == 2
+
+
+def test_result_cache_hits_and_invalidation():
+    """
+    Test that repeated scenarios hit the LRU cache, give the same results as
+    uncached calls, and that clearing the cache resets it.
+    """
+    expected = calculate_investment_growth(1000, 12, 10)
+    enable_result_cache(maxsize=8)
+    try:
+        assert calculate_investment_growth(1000, 12, 10) == expected
+        assert calculate_investment_growth(1000, 12, 10) == expected
+        with pytest.raises(ValueError):
+            calculate_investment_growth(-1000, 12, 10)
+        info = result_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 1)
+
+        clear_result_cache()
+        assert result_cache_info().currsize == 0
+    finally:
+        disable_result_cache()
+    assert result_cache_info() is None
+
+
+def test_growth_table():
+    """
+    Test that a precomputed table gives the same results as the calculator on and
+    off its grid, including a zero return.
+    """
+    table = GrowthTable([1000, 2000], [0, 6, 12], [5, 10])
+    assert len(table) == 12
+
+    scenarios = [(1000, 12, 10), (2000, 0, 5), (1000, 7, 3)]
+    expected = [calculate_investment_growth(*scenario) for scenario in scenarios]
+    use_growth_table(table)
+    try:
+        for scenario, result in zip(scenarios, expected):
+            assert calculate_investment_growth(*scenario) == pytest.approx(result)
+        with pytest.raises(ValueError):
+            calculate_investment_growth(-1000, 12, 10)
+    finally:
+        disable_result_cache()
+    assert len(table) == 12
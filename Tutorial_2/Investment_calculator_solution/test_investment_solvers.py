@@ -0,0 +1,68 @@
+import pytest
+from investment_calculator import calculate_investment_growth
+from investment_solvers import (
+    solve_annual_return,
+    solve_annual_return_batch,
+    solve_investment_period,
+    solve_monthly_investment,
+)
+
+
+def test_solve_monthly_investment_round_trip():
+    """
+    Test that the solved monthly investment reaches the target, with and without
+    a return.
+    """
+    monthly_investment = solve_monthly_investment(1_000_000, 10, 20)
+    assert calculate_investment_growth(monthly_investment, 10, 20)[1] == pytest.approx(
+        1_000_000
+    )
+    assert solve_monthly_investment(120000, 0, 10) == pytest.approx(1000)
+
+
+def test_solve_investment_period_round_trip():
+    """
+    Test that the solved period reaches the target.
+    """
+    years = solve_investment_period(1_000_000, 2000, 12)
+    assert calculate_investment_growth(2000, 12, years)[1] == pytest.approx(1_000_000)
+    assert solve_investment_period(120000, 1000, 0) == pytest.approx(10)
+
+
+def test_solve_annual_return_round_trip():
+    """
+    Test that the solved return reaches the target, and that the iteration
+    counter is reported.
+    """
+    expected_amount = calculate_investment_growth(1500, 8.5, 25)[1]
+    annual_return, iterations, converged = solve_annual_return(
+        expected_amount, 1500, 25
+    )
+    assert annual_return == pytest.approx(8.5)
+    assert converged
+    assert 0 < iterations < 20
+
+
+def test_solve_annual_return_batch():
+    """
+    Test the batch solver over zero, small and very large returns.
+    """
+    returns = [0.0, 0.5, 12.0, 60.0]
+    targets = [calculate_investment_growth(1000, r, 30)[1] for r in returns]
+    result = solve_annual_return_batch(targets, 1000, 30)
+    assert result.value == pytest.approx(returns)
+    assert result.converged.all()
+    assert result.iterations[0] == 0
+
+
+def test_solve_annual_return_invalid_input():
+    """
+    Test that a target below the amount invested, or invalid inputs,
+    raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        solve_annual_return(100_000, 1000, 10)
+    with pytest.raises(ValueError):
+        solve_annual_return(1_000_000, -1000, 10)
+    with pytest.raises(ValueError):
+        solve_annual_return(1_000_000, 1000, 0)
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+from investment_calculator import calculate_investment_growth
+from monte_carlo import (
+    _draw_monthly_returns,
+    _simulate_shard,
+    load_monthly_returns,
+    simulate_investment_growth,
+)
+
+
+def test_simulate_investment_growth_without_volatility():
+    """
+    Test that with zero volatility every path matches the deterministic calculation.
+    """
+    result = simulate_investment_growth(1000, 10, annual_return=12, annual_volatility=0)
+    _, expected_amount, _ = calculate_investment_growth(1000, 12, 10)
+
+    assert result.months.tolist() == list(range(12, 121, 12))
+    assert result.investment_amount[-1] == pytest.approx(120000)
+    assert result.bands[:, -1] == pytest.approx([expected_amount] * 5)
+    assert result.mean[-1] == pytest.approx(expected_amount)
+
+
+@pytest.mark.parametrize("distribution", ["normal", "lognormal"])
+def test_simulate_investment_growth_is_seedable(distribution):
+    """
+    Test that a seed reproduces the same bands, and that the bands are ordered.
+    """
+    kwargs = dict(
+        annual_return=8, distribution=distribution, paths=2000, seed=42, workers=1
+    )
+    first = simulate_investment_growth(500, 5, **kwargs)
+    second = simulate_investment_growth(500, 5, **kwargs)
+
+    assert np.array_equal(first.bands, second.bands)
+    assert (np.diff(first.bands[:, -1]) > 0).all()
+
+
+@pytest.mark.parametrize("distribution", ["normal", "lognormal"])
+def test_simulate_shard_matches_month_by_month(distribution):
+    """
+    Test that the balances computed from cumulative products match those of
+    growing every path one month at a time on the same returns.
+    """
+    args = (distribution, 8, 30, None)
+    returns = _draw_monthly_returns(np.random.default_rng(5), 50, 36, *args)
+    balance = np.zeros(50)
+    year_end_balances = []
+    for month in range(36):
+        balance = balance * (1 + returns[:, month]) + 1000
+        if month % 12 == 11:
+            year_end_balances.append(balance)
+
+    balances = _simulate_shard(5, 50, 1000, 36, *args)
+    assert balances.shape == (50, 3)
+    assert balances == pytest.approx(np.column_stack(year_end_balances))
+
+
+def test_simulate_investment_growth_with_workers():
+    """
+    Test that sharding paths across a process pool is reproducible too.
+    """
+    kwargs = dict(annual_return=8, paths=1000, seed=7, workers=2)
+    first = simulate_investment_growth(500, 3, **kwargs)
+    second = simulate_investment_growth(500, 3, **kwargs)
+    assert np.array_equal(first.bands, second.bands)
+
+
+def test_simulate_investment_growth_bootstrap(tmp_path):
+    """
+    Test bootstrapping from a price history that grows 1% every month.
+    """
+    csv_path = tmp_path / "prices.csv"
+    rows = [f"2020-{month:02d}-28,{100 * 1.01 ** month}" for month in range(1, 13)]
+    csv_path.write_text("Date,Price\n" + "\n".join(rows) + "\n")
+
+    history = load_monthly_returns(str(csv_path))
+    assert history == pytest.approx([0.01] * 11)
+
+    result = simulate_investment_growth(
+        1000, 2, distribution="bootstrap", history=history, paths=100, seed=1
+    )
+    _, expected_amount, _ = calculate_investment_growth(1000, 12, 2)
+    assert result.expected_amount[50.0] == pytest.approx(expected_amount)
+
+
+def test_simulate_investment_growth_invalid_input():
+    """
+    Test that invalid inputs raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        simulate_investment_growth(-1000, 10)
+    with pytest.raises(ValueError):
+        simulate_investment_growth(1000, 2.5)
+    with pytest.raises(ValueError):
+        simulate_investment_growth(1000, 10, distribution="uniform")
+    with pytest.raises(ValueError):
+        simulate_investment_growth(1000, 10, distribution="bootstrap")
+    with pytest.raises(ValueError, match="not an annual return"):
+        simulate_investment_growth(
+            1000, 10, annual_return=8, distribution="bootstrap", history=[0.01]
+        )
@@ -0,0 +1,77 @@
+"""
+Optional instrumentation shared by the Tutorial 2 calculators,
+Car_Repayment_solution/car_repayment.py and
+Investment_calculator_solution/investment_calculator.py.
+
+One hook, installed with set_metrics_hook(), is called as
+hook(function_name, seconds, failed) after every instrumented call. Without a
+hook, the calculators do no timing at all.
+"""
+
+import bisect
+import time
+from collections.abc import Callable
+
+MetricsHook = Callable[[str, float, bool], None]
+
+metrics_hook: MetricsHook | None = None
+
+
+class CallMetrics:
+    """
+    Collect call counts, validation failures and a latency histogram.
+
+    Install an instance with set_metrics_hook() and read snapshot() to scrape the
+    numbers, instead of parsing log text.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2)):
+        self.buckets = buckets
+        self.calls = 0
+        self.calls_by_function: dict[str, int] = {}
+        self.validation_failures = 0
+        self.total_seconds = 0.0
+        # One count per bucket upper bound, plus one for slower calls.
+        self.histogram = [0] * (len(buckets) + 1)
+
+    def __call__(self, function_name: str, seconds: float, failed: bool):
+        self.calls += 1
+        self.calls_by_function[function_name] = (
+            self.calls_by_function.get(function_name, 0) + 1
+        )
+        self.validation_failures += failed
+        self.total_seconds += seconds
+        self.histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+
+    def snapshot(self) -> dict:
+        """Return the collected numbers as a plain dict."""
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {
+            "calls": self.calls,
+            "calls_by_function": dict(self.calls_by_function),
+            "validation_failures": self.validation_failures,
+            "total_seconds": self.total_seconds,
+            "latency_histogram": dict(zip(bounds, self.histogram)),
+        }
+
+
+def set_metrics_hook(hook: MetricsHook | None):
+    """Install (or, with None, remove) the instrumentation hook."""
+    global metrics_hook
+    metrics_hook = hook
+
+
+def call_with_metrics(hook: MetricsHook, function_name: str, function, *args):
+    """
+    Call function(*args) and report its latency to hook under function_name.
+
+    A ValueError is reported as a validation failure and re-raised.
+    """
+    start = time.perf_counter()
+    try:
+        result = function(*args)
+    except ValueError:
+        hook(function_name, time.perf_counter() - start, True)
+        raise
+    hook(function_name, time.perf_counter() - start, False)
+    return result
@@ -0,0 +1,25 @@
+"""
+Helpers shared by the inverse solvers of both Tutorial 2 exercises,
+Car_Repayment_solution/car_repayment_solvers.py and
+Investment_calculator_solution/investment_solvers.py.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+class SolverResult(NamedTuple):
+    """The answer of an iterative solver and what it cost to find it."""
+
+    value: float | np.ndarray
+    iterations: int | np.ndarray
+    converged: bool | np.ndarray
+
+
+def as_arrays(*columns: ArrayLike) -> list[np.ndarray]:
+    """Convert each column to float64 and broadcast them against each other."""
+    return np.broadcast_arrays(
+        *(np.asarray(column, dtype=np.float64) for column in columns)
+    )
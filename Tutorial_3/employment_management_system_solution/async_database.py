@@ -0,0 +1,247 @@
+"""
+Async access to the employee database, for asyncio applications.
+
+AsyncEmployeeDatabase mirrors the functions of database.py as coroutines:
+
+  - writes are queued to a single writer thread, which commits every write that
+    is waiting in one transaction (a group commit), so concurrent writers share
+    the cost of each commit instead of queueing for the database lock;
+  - reads run on a small thread pool, each thread with a connection from a
+    ConnectionPool, so queries do not block the event loop or the writer.
+
+A write's coroutine returns only once its transaction has committed. Each write
+runs in its own savepoint, so a failing write raises in its caller without
+undoing the others committed with it.
+
+    async with AsyncEmployeeDatabase("employees.db") as db:
+        employee_id = await db.insert_employee("Alice", "IT", 1000.0, "2024-01-01")
+        employees = await db.query_employees_by_department("IT")
+"""
+
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+
+import database
+from pool import ConnectionPool
+
+# A write takes a connection and returns the value its coroutine resolves to.
+Write = Callable[[sqlite3.Connection], object]
+
+
+class AsyncEmployeeDatabase:
+    """
+    Coroutine versions of the database.py functions, backed by one writer
+    thread and a pool of reader threads.
+    """
+
+    def __init__(
+        self,
+        db_file: str,
+        readers: int = 4,
+        profile: str | None = "performance",
+        max_batch: int = 1000,
+    ):
+        """
+        :param db_file: The SQLite database file; the schema is migrated on open.
+        :param readers: The number of reader threads and connections.
+        :param profile: The connection profile (see CONNECTION_PROFILES). The
+            default, "performance", uses WAL so readers never wait for the writer.
+        :param max_batch: The most writes committed in one transaction.
+        """
+        self.db_file = db_file
+        self.readers = readers
+        self.profile = profile
+        self.max_batch = max_batch
+        self._writes = queue.Queue()
+        self._writer = None
+        self._read_pool = None
+        self._read_executor = None
+        self.commits = 0
+
+    async def open(self):
+        """Migrate the schema and start the writer and reader threads."""
+        started = Future()
+        self._writer = threading.Thread(
+            target=self._write_loop, args=(started,), name="employee-db-writer"
+        )
+        self._writer.start()
+        await asyncio.wrap_future(started)
+        self._read_pool = ConnectionPool(
+            self.db_file, max_size=self.readers, profile=self.profile
+        )
+        self._read_executor = ThreadPoolExecutor(
+            self.readers, thread_name_prefix="employee-db-reader"
+        )
+
+    async def close(self):
+        """Commit the queued writes, then stop the threads and close connections."""
+        if self._writer is not None:
+            self._writes.put(None)
+            await asyncio.to_thread(self._writer.join)
+            self._writer = None
+        if self._read_executor is not None:
+            self._read_executor.shutdown()
+            self._read_pool.close()
+            self._read_executor = self._read_pool = None
+
+    async def __aenter__(self) -> "AsyncEmployeeDatabase":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _write_loop(self, started: Future):
+        try:
+            conn = database.create_connection(self.db_file, self.profile)
+            database.create_table(conn)
+        except Exception as e:
+            started.set_exception(e)
+            return
+        started.set_result(None)
+
+        stopping = False
+        while not stopping:
+            batch = [self._writes.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                # close() was called: commit what came before it, then stop.
+                stopping = True
+                batch = [item for item in batch if item is not None]
+            if batch:
+                self._commit_batch(conn, batch)
+        conn.close()
+
+    def _commit_batch(self, conn: sqlite3.Connection, batch: list[tuple]):
+        """Run a batch of writes in one transaction, each in its own savepoint."""
+        # Writes whose coroutine was cancelled while queued are dropped; the rest
+        # can no longer be cancelled.
+        batch = [
+            (write, future)
+            for write, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not batch:
+            return
+        outcomes = []
+        try:
+            conn.execute("BEGIN IMMEDIATE;")
+            for write, future in batch:
+                conn.execute("SAVEPOINT write;")
+                try:
+                    outcomes.append((future, write(conn), None))
+                    conn.execute("RELEASE write;")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO write;")
+                    conn.execute("RELEASE write;")
+                    outcomes.append((future, None, e))
+            conn.commit()
+            self.commits += 1
+            logging.debug(f"Group-committed {len(batch)} employee writes.")
+        except sqlite3.Error as e:
+            logging.error(f"Error committing employee writes: {e}")
+            if conn.in_transaction:
+                conn.rollback()
+            outcomes = [(future, None, e) for _, future in batch]
+
+        for future, result, error in outcomes:
+            # A future that cannot take its outcome must not stop the writer thread.
+            try:
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+            except InvalidStateError as e:
+                logging.error(f"Error delivering an employee write's outcome: {e}")
+
+    async def _write(self, write: Write):
+        if self._writer is None:
+            raise RuntimeError("The database is not open.")
+        future = Future()
+        self._writes.put((write, future))
+        return await asyncio.wrap_future(future)
+
+    async def _read(self, function: Callable, *args):
+        if self._read_executor is None:
+            raise RuntimeError("The database is not open.")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._read_executor, self._read_pool.run, function, *args
+        )
+
+    async def insert_employee(
+        self, name: str, department: str, salary: float, hire_date: str
+    ) -> int:
+        """Insert a new employee record and return its employee_id."""
+        employee = (name, department, salary, hire_date)
+        return await self._write(
+            lambda conn: conn.execute(database.INSERT_EMPLOYEE_SQL, employee).lastrowid
+        )
+
+    async def insert_employees_bulk(
+        self, employees: Iterable[tuple[str, str, float, str]]
+    ) -> int:
+        """
+        Insert many (name, department, salary, hire_date) records together, and
+        return how many were inserted.
+        """
+        employees = list(employees)
+        return await self._write(
+            lambda conn: conn.executemany(
+                database.INSERT_EMPLOYEE_SQL, employees
+            ).rowcount
+        )
+
+    async def update_employee(
+        self,
+        employee_id: int,
+        name: str,
+        department: str,
+        salary: float,
+        hire_date: str,
+    ) -> int:
+        """Update an employee record and return the number of rows changed."""
+        employee = (employee_id, name, department, salary, hire_date)
+        return await self._write(
+            lambda conn: conn.execute(database.UPDATE_EMPLOYEE_SQL, employee).rowcount
+        )
+
+    async def delete_employee(self, employee_id: int) -> int:
+        """Delete an employee record and return the number of rows deleted."""
+        return await self._write(
+            lambda conn: conn.execute(
+                database.DELETE_EMPLOYEE_SQL, (employee_id,)
+            ).rowcount
+        )
+
+    async def query_employees_by_department(self, department: str) -> list[tuple]:
+        return await self._read(database.query_employees_by_department, department)
+
+    async def query_all_employees_sorted_by_hire_date(self) -> list[tuple]:
+        return await self._read(database.query_all_employees_sorted_by_hire_date)
+
+    async def query_employees_page_by_hire_date(
+        self, page_size: int = 20, after: tuple[str, int] | None = None
+    ) -> list[tuple]:
+        return await self._read(
+            database.query_employees_page_by_hire_date, page_size, after
+        )
+
+    async def calculate_average_salary_by_department(self, department: str) -> float:
+        return await self._read(
+            database.calculate_average_salary_by_department, department
+        )
+
+    async def query_department_salary_stats(
+        self,
+    ) -> list[database.DepartmentSalaryStats]:
+        return await self._read(database.query_department_salary_stats)
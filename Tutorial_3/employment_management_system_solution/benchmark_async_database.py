@@ -0,0 +1,106 @@
+"""
+Benchmark requests/sec of the async employee database layer against calling the
+database.py functions through asyncio.to_thread, at 1 to 256 concurrent
+coroutines.
+
+Usage:
+    python benchmark_async_database.py [requests]
+
+Each coroutine alternates one insert with four average-salary lookups until the
+given number of requests (default 4,000) has been made in total. The to_thread
+baseline opens a connection per request, as sqlite3 connections cannot be
+shared between the executor's threads. Both use the "performance" profile.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from async_database import AsyncEmployeeDatabase
+from benchmark_profiles import DEPARTMENTS
+from database import (
+    calculate_average_salary_by_department,
+    create_connection,
+    create_table,
+    insert_employee,
+)
+
+PROFILE = "performance"
+READS_PER_WRITE = 4
+
+
+def to_thread_request(database: str, i: int):
+    conn = create_connection(database, PROFILE)
+    try:
+        if i % (READS_PER_WRITE + 1) == 0:
+            insert_employee(
+                conn, f"Employee {i}", DEPARTMENTS[i % 100], 1.0, "2024-01-01"
+            )
+        else:
+            calculate_average_salary_by_department(conn, DEPARTMENTS[i % 100])
+    finally:
+        conn.close()
+
+
+async def run_to_thread(database: str, requests: int, concurrency: int):
+    async def worker(offset: int):
+        for i in range(offset, requests, concurrency):
+            await asyncio.to_thread(to_thread_request, database, i)
+
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+
+
+async def run_async_layer(database: str, requests: int, concurrency: int):
+    async def worker(db: AsyncEmployeeDatabase, offset: int):
+        for i in range(offset, requests, concurrency):
+            department = DEPARTMENTS[i % 100]
+            if i % (READS_PER_WRITE + 1) == 0:
+                await db.insert_employee(f"Employee {i}", department, 1.0, "2024-01-01")
+            else:
+                await db.calculate_average_salary_by_department(department)
+
+    async with AsyncEmployeeDatabase(database, profile=PROFILE) as db:
+        await asyncio.gather(*(worker(db, offset) for offset in range(concurrency)))
+        return db.commits
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000
+    logging.disable(logging.WARNING)
+
+    print(
+        f"{'coroutines':>10} {'to_thread (req/s)':>18} {'async layer (req/s)':>20}"
+        f" {'writes/commit':>14}"
+    )
+    concurrency = 1
+    while concurrency <= 256:
+        with tempfile.TemporaryDirectory() as directory:
+            baseline_db = os.path.join(directory, "baseline.db")
+            conn = create_connection(baseline_db, PROFILE)
+            create_table(conn)
+            conn.close()
+            start = time.perf_counter()
+            asyncio.run(run_to_thread(baseline_db, requests, concurrency))
+            baseline = requests / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            commits = asyncio.run(
+                run_async_layer(
+                    os.path.join(directory, "async.db"), requests, concurrency
+                )
+            )
+            layer = requests / (time.perf_counter() - start)
+
+        writes = len(range(0, requests, READS_PER_WRITE + 1))
+        print(
+            f"{concurrency:>10} {baseline:18.0f} {layer:20.0f}"
+            f" {writes / commits:14.1f}"
+        )
+        concurrency *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark the per-row employee functions against the bulk ones on an on-disk
+database, where every per-row commit pays for its own sync to disk.
+
+Usage:
+    python benchmark_database.py [rows]
+
+The default is 20,000 rows.
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from database import (
+    create_connection,
+    create_table,
+    delete_employee,
+    delete_employees_bulk,
+    insert_employee,
+    insert_employees_bulk,
+)
+
+DEPARTMENTS = ["Engineering", "Finance", "HR", "Marketing", "Operations", "Sales"]
+
+
+def generate_employees(rows: int):
+    """Yield synthetic (name, department, salary, hire_date) records."""
+    for i in range(rows):
+        yield (
+            f"Employee {i}",
+            DEPARTMENTS[i % len(DEPARTMENTS)],
+            30_000.0 + (i * 7919) % 120_000,
+            f"{2000 + i % 25}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        )
+
+
+def report(label: str, rows: int, seconds: float):
+    print(
+        f"{label:<24} {rows:>10,} rows {seconds:9.3f} s {rows / seconds:12,.0f} rows/s"
+    )
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    # The per-row functions log every call at DEBUG; keep the output readable.
+    logging.disable(logging.DEBUG)
+
+    with tempfile.TemporaryDirectory() as directory:
+        conn = create_connection(os.path.join(directory, "employees.db"))
+        create_table(conn)
+
+        start = time.perf_counter()
+        for employee in generate_employees(rows):
+            insert_employee(conn, *employee)
+        report("insert_employee loop", rows, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for employee_id in range(1, rows + 1):
+            delete_employee(conn, employee_id)
+        report("delete_employee loop", rows, time.perf_counter() - start)
+
+        result = insert_employees_bulk(conn, generate_employees(rows))
+        report("insert_employees_bulk", result.rows, result.seconds)
+
+        result = delete_employees_bulk(conn, range(rows + 1, 2 * rows + 1))
+        report("delete_employees_bulk", result.rows, result.seconds)
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
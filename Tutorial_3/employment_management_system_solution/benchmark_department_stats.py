@@ -0,0 +1,100 @@
+"""
+Benchmark polling the salary stats of every department, with and without the
+department_salary_stats summary table.
+
+Usage:
+    python benchmark_department_stats.py [rows]
+
+The default is 1,000,000 employees spread over 250 departments, stored in a
+temporary on-disk database. A poll asks for the average salary of every
+department, as a dashboard would. The cost of the triggers is reported as the
+bulk insert time with and without them.
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from benchmark_indexes import generate_employees
+from database import (
+    calculate_average_salary_by_department,
+    create_connection,
+    insert_employees_bulk,
+    migrate_schema,
+    query_department_salary_stats,
+)
+
+REPEATS = 5
+
+
+def time_polls(conn) -> dict[str, float]:
+    """Return the average seconds taken by one poll of every department."""
+    departments = [
+        department
+        for (department,) in conn.execute(
+            "SELECT DISTINCT department FROM employees;"
+        ).fetchall()
+    ]
+    polls = {
+        "AVG per department": lambda: [
+            conn.execute(
+                "SELECT AVG(salary) FROM employees WHERE department = ?;",
+                (department,),
+            ).fetchone()
+            for department in departments
+        ],
+        "GROUP BY all departments": lambda: conn.execute(
+            """
+            SELECT department, COUNT(*), SUM(salary), MIN(salary), MAX(salary)
+            FROM employees GROUP BY department;
+        """
+        ).fetchall(),
+        "summary per department": lambda: [
+            calculate_average_salary_by_department(conn, department)
+            for department in departments
+        ],
+        "summary, one call": lambda: query_department_salary_stats(conn),
+    }
+    timings = {}
+    for label, poll in polls.items():
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            poll()
+        timings[label] = (time.perf_counter() - start) / REPEATS
+    return timings
+
+
+def time_bulk_insert(directory: str, rows: int, target_version: int):
+    """Return a connection to a new database filled with rows, and the seconds taken."""
+    conn = create_connection(os.path.join(directory, f"employees_{target_version}.db"))
+    migrate_schema(conn, target_version=target_version)
+    result = insert_employees_bulk(conn, generate_employees(rows))
+    return conn, result.seconds
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Version 2 has the indexes but not the summary table and its triggers.
+        conn, without_triggers = time_bulk_insert(directory, rows, target_version=2)
+        conn.close()
+        conn, with_triggers = time_bulk_insert(directory, rows, target_version=None)
+        timings = time_polls(conn)
+        conn.close()
+
+    print(f"{rows:,} employees")
+    print(
+        f"bulk insert: {without_triggers:.2f} s without triggers, "
+        f"{with_triggers:.2f} s with triggers"
+    )
+    print(f"{'poll':<26} {'latency (ms)':>14}")
+    for label, seconds in timings.items():
+        print(f"{label:<26} {seconds * 1000:14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark the employee queries before and after the indexes are created.
+
+Usage:
+    python benchmark_indexes.py [rows]
+
+The default is 1,000,000 employees spread over 250 departments, stored in a
+temporary on-disk database. Listing every employee by hire date reads the whole
+table either way; the index pays off when only the first rows are needed.
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from database import (
+    create_connection,
+    insert_employees_bulk,
+    migrate_schema,
+    query_all_employees_sorted_by_hire_date,
+    query_employees_by_department,
+)
+
+REPEATS = 5
+DEPARTMENTS = 250
+
+
+def generate_employees(rows: int):
+    """Yield synthetic (name, department, salary, hire_date) records."""
+    for i in range(rows):
+        yield (
+            f"Employee {i}",
+            f"Department {i * 7919 % DEPARTMENTS}",
+            30_000.0 + (i * 7919) % 120_000,
+            f"{2000 + i % 25}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        )
+
+
+def time_queries(conn) -> dict[str, float]:
+    """Return the average seconds taken by each employee query."""
+    department = "Department 0"
+    queries = {
+        "by department": lambda: query_employees_by_department(conn, department),
+        # The raw average over the employees: calculate_average_salary_by_department
+        # reads the department_salary_stats summary, which has no use for indexes.
+        "average salary": lambda: conn.execute(
+            "SELECT AVG(salary) FROM employees WHERE department = ?;", (department,)
+        ).fetchone(),
+        "first 100 by hire date": lambda: conn.execute(
+            "SELECT * FROM employees ORDER BY hire_date ASC LIMIT 100;"
+        ).fetchall(),
+        "all by hire date": lambda: query_all_employees_sorted_by_hire_date(conn),
+    }
+    timings = {}
+    for label, query in queries.items():
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            query()
+        timings[label] = (time.perf_counter() - start) / REPEATS
+    return timings
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    logging.disable(logging.DEBUG)
+
+    with tempfile.TemporaryDirectory() as directory:
+        conn = create_connection(os.path.join(directory, "employees.db"))
+        # Only the first migration: the table without its indexes.
+        migrate_schema(conn, target_version=1)
+        insert_employees_bulk(conn, generate_employees(rows))
+
+        before = time_queries(conn)
+        start = time.perf_counter()
+        migrate_schema(conn, target_version=2)
+        print(
+            f"{rows:,} employees, indexes built in {time.perf_counter() - start:.2f} s"
+        )
+        after = time_queries(conn)
+        conn.close()
+
+    print(f"{'query':<24} {'no index (s)':>14} {'indexed (s)':>14} {'speedup':>9}")
+    for label in before:
+        print(
+            f"{label:<24} {before[label]:14.4f} {after[label]:14.4f} "
+            f"{before[label] / after[label]:8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark how employee queries scale with threads, opening a connection per call
+versus checking one out of a ConnectionPool.
+
+Usage:
+    python benchmark_pool.py [calls_per_thread] [max_threads]
+
+Each thread looks up the average salary of random departments in a database of
+100,000 employees, using the "performance" profile. Thread counts double from 1
+up to max_threads (default 16); the pool has one connection per thread.
+"""
+
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from benchmark_profiles import DEPARTMENTS
+from database import (
+    calculate_average_salary_by_department,
+    create_connection,
+    create_table,
+    insert_employees_bulk,
+)
+from pool import ConnectionPool
+
+PROFILE = "performance"
+
+
+def connect_per_call(database: str, calls: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(calls):
+        conn = create_connection(database, PROFILE)
+        calculate_average_salary_by_department(conn, rng.choice(DEPARTMENTS))
+        conn.close()
+
+
+def pooled(pool: ConnectionPool, calls: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(calls):
+        pool.run(calculate_average_salary_by_department, rng.choice(DEPARTMENTS))
+
+
+def time_threads(target, args: tuple, threads: int) -> float:
+    """Run target in each thread and return the seconds until all finish."""
+    workers = [
+        threading.Thread(target=target, args=(*args, seed)) for seed in range(threads)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    max_threads = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "employees.db")
+        conn = create_connection(database, PROFILE)
+        create_table(conn)
+        insert_employees_bulk(
+            conn,
+            (
+                (
+                    f"Employee {i}",
+                    DEPARTMENTS[i % len(DEPARTMENTS)],
+                    50_000.0,
+                    "2020-01-01",
+                )
+                for i in range(100_000)
+            ),
+        )
+        conn.close()
+
+        print(f"{'threads':>8} {'per call (calls/s)':>20} {'pool (calls/s)':>16}")
+        threads = 1
+        while threads <= max_threads:
+            per_call = time_threads(connect_per_call, (database, calls), threads)
+            with ConnectionPool(database, max_size=threads, profile=PROFILE) as pool:
+                pool_seconds = time_threads(pooled, (pool, calls), threads)
+            total = calls * threads
+            print(f"{threads:>8} {total / per_call:20.0f} {total / pool_seconds:16.0f}")
+            threads *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark a mixed read/write workload under each connection profile.
+
+Usage:
+    python benchmark_profiles.py [seconds] [readers]
+
+One writer thread inserts employees in small transactions while the reader
+threads query random departments, each thread with its own connection, for the
+given number of seconds (default 5) and readers (default 4).
+"""
+
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+from database import (
+    CONNECTION_PROFILES,
+    calculate_average_salary_by_department,
+    create_connection,
+    create_table,
+    insert_employees_bulk,
+)
+
+DEPARTMENTS = [f"Department {i}" for i in range(100)]
+
+
+def writer(database: str, profile: str, stop: threading.Event, counts: dict):
+    conn = create_connection(database, profile)
+    rng = random.Random(0)
+    while not stop.is_set():
+        try:
+            insert_employees_bulk(
+                conn,
+                [
+                    ("New hire", rng.choice(DEPARTMENTS), 50_000.0, "2025-01-01")
+                    for _ in range(10)
+                ],
+            )
+            counts["writes"] += 1
+        except sqlite3.OperationalError:
+            counts["busy"] += 1
+    conn.close()
+
+
+def reader(database: str, profile: str, stop: threading.Event, counts: dict, seed):
+    conn = create_connection(database, profile)
+    rng = random.Random(seed)
+    reads = busy = 0
+    while not stop.is_set():
+        try:
+            calculate_average_salary_by_department(conn, rng.choice(DEPARTMENTS))
+            reads += 1
+        except sqlite3.OperationalError:
+            busy += 1
+    conn.close()
+    with counts["lock"]:
+        counts["reads"] += reads
+        counts["busy"] += busy
+
+
+def run(profile: str, seconds: float, readers: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "employees.db")
+        conn = create_connection(database, profile)
+        create_table(conn)
+        insert_employees_bulk(
+            conn,
+            (
+                (
+                    f"Employee {i}",
+                    DEPARTMENTS[i % len(DEPARTMENTS)],
+                    50_000.0,
+                    "2020-01-01",
+                )
+                for i in range(100_000)
+            ),
+        )
+        conn.close()
+
+        stop = threading.Event()
+        counts = {"writes": 0, "reads": 0, "busy": 0, "lock": threading.Lock()}
+        threads = [
+            threading.Thread(target=writer, args=(database, profile, stop, counts))
+        ]
+        threads += [
+            threading.Thread(target=reader, args=(database, profile, stop, counts, i))
+            for i in range(readers)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        return counts
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    logging.disable(logging.DEBUG)
+
+    print(f"{'profile':<12} {'writes/s':>10} {'reads/s':>10} {'busy errors':>12}")
+    for profile in CONNECTION_PROFILES:
+        counts = run(profile, seconds, readers)
+        print(
+            f"{profile:<12} {counts['writes'] / seconds:10.0f} "
+            f"{counts['reads'] / seconds:10.0f} {counts['busy']:12d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
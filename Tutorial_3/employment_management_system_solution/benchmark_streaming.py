@@ -0,0 +1,76 @@
+"""
+Benchmark the peak memory of listing every employee with fetchall against
+streaming them in fetchmany batches.
+
+Usage:
+    python benchmark_streaming.py [rows]
+
+The default is 5,000,000 employees. Each listing runs in its own process so its
+peak resident set size (RSS) can be measured on its own.
+"""
+
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from database import (
+    create_connection,
+    create_table,
+    insert_employees_bulk,
+    iter_all_employees_sorted_by_hire_date,
+    query_all_employees_sorted_by_hire_date,
+)
+
+
+def list_employees(database: str, mode: str):
+    """Walk every employee once and print the row count, seconds and peak RSS."""
+    logging.disable(logging.DEBUG)
+    conn = create_connection(database)
+    start = time.perf_counter()
+    if mode == "fetchall":
+        rows = len(query_all_employees_sorted_by_hire_date(conn))
+    else:
+        rows = sum(1 for _ in iter_all_employees_sorted_by_hire_date(conn))
+    seconds = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux.
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode:<10} {rows:>12,} rows {seconds:9.2f} s {peak_mb:10.1f} MB peak RSS")
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--list":
+        list_employees(sys.argv[2], sys.argv[3])
+        return
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    logging.disable(logging.DEBUG)
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "employees.db")
+        conn = create_connection(database)
+        create_table(conn)
+        insert_employees_bulk(
+            conn,
+            (
+                (
+                    f"Employee {i}",
+                    f"Department {i % 250}",
+                    50_000.0,
+                    f"20{i % 25:02d}-01-01",
+                )
+                for i in range(rows)
+            ),
+        )
+        conn.close()
+
+        for mode in ("fetchall", "stream"):
+            subprocess.run(
+                [sys.executable, __file__, "--list", database, mode], check=True
+            )
+
+
+if __name__ == "__main__":
+    main()
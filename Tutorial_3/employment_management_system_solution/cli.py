@@ -1,16 +1,48 @@
+"""
+Employee Management System command line.
+
+Run without arguments for the interactive menu, or with a subcommand for batch
+jobs that read and write JSON lines or CSV:
+
+    python cli.py import employees.jsonl
+    python cli.py import --mode update --format csv - < changes.csv
+    python cli.py export --format csv -o employees.csv
+    python cli.py query --department Sales
+    python cli.py stats
+"""
+
+import argparse
+import contextlib
+import csv
 import datetime
+import json
+import sqlite3
+import sys
+from collections.abc import Iterable, Iterator
 
 from database import (
+    CONNECTION_PROFILES,
     calculate_average_salary_by_department,
+    check_department_salary_stats,
     create_connection,
     create_table,
     delete_employee,
+    delete_employees_bulk,
     insert_employee,
-    query_all_employees_sorted_by_hire_date,
+    insert_employees_bulk,
+    iter_all_employees_sorted_by_hire_date,
+    iter_employees_by_department,
+    query_department_salary_stats,
     query_employees_by_department,
+    query_employees_page_by_hire_date,
     update_employee,
+    update_employees_bulk,
 )
 
+PAGE_SIZE = 20
+COLUMNS = ("employee_id", "name", "department", "salary", "hire_date")
+FORMATS = ("jsonl", "csv")
+
 
 def cli_menu():
     """Display the CLI menu options."""
@@ -24,11 +56,8 @@ def cli_menu():
     print("7. Exit")
 
 
-def main():
-    database = "employees.db"
-    conn = create_connection(database)
-    create_table(conn)
-
+def interactive_menu(conn):
+    """Run the interactive menu until the user exits."""
     while True:
         cli_menu()
         choice = input("Select an option (1-7): ")
@@ -68,13 +97,23 @@ def main():
 
         elif choice == "3":
             try:
-                employees = query_all_employees_sorted_by_hire_date(conn)
+                employees = query_employees_page_by_hire_date(conn, PAGE_SIZE)
                 if employees:
                     print("Employees sorted by hire date:")
-                    for emp in employees:
-                        print(emp)
                 else:
                     print("No employee records found.")
+                while employees:
+                    for emp in employees:
+                        print(emp)
+                    if len(employees) < PAGE_SIZE:
+                        break
+                    if input("Press Enter for more, or q to stop: ") == "q":
+                        break
+                    # The next page starts after the last (hire_date, employee_id).
+                    last = employees[-1]
+                    employees = query_employees_page_by_hire_date(
+                        conn, PAGE_SIZE, after=(last[4], last[0])
+                    )
             except Exception as e:
                 print(f"Error querying employees: {e}")
 
@@ -130,8 +169,207 @@ def main():
         else:
             print("Invalid option. Please choose a number between 1 and 7.")
 
-    conn.close()
+
+def _file_format(path: str, file_format: str | None) -> str:
+    """Return the explicit format, or guess it from the file extension."""
+    if file_format is not None:
+        return file_format
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+@contextlib.contextmanager
+def _open(path: str, mode: str):
+    """Open path for text I/O, where "-" means stdin or stdout."""
+    if path == "-":
+        yield sys.stdin if mode == "r" else sys.stdout
+    else:
+        with open(path, mode, newline="", encoding="utf-8") as file:
+            yield file
+
+
+def read_records(file, file_format: str) -> Iterator[tuple[int, dict]]:
+    """Yield (line_number, record) for every JSON line or CSV row of file."""
+    if file_format == "csv":
+        # Line 1 is the header.
+        yield from enumerate(csv.DictReader(file), start=2)
+        return
+    for line_number, line in enumerate(file, start=1):
+        if line.strip():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {line_number}: invalid JSON ({e.msg}).")
+            if not isinstance(record, dict):
+                raise ValueError(f"Line {line_number}: expected a JSON object.")
+            yield line_number, record
+
+
+def parse_employee(record: dict, line_number: int, mode: str) -> tuple:
+    """
+    Convert a record to the row expected by the bulk function for mode: the
+    employee_id for "delete", (name, department, salary, hire_date) for "insert"
+    and (employee_id, name, department, salary, hire_date) for "update".
+
+    :raises ValueError: If a field is missing or invalid, naming the line.
+    """
+    fields = {"insert": COLUMNS[1:], "update": COLUMNS, "delete": COLUMNS[:1]}[mode]
+    missing = [field for field in fields if record.get(field) in (None, "")]
+    if missing:
+        raise ValueError(f"Line {line_number}: missing {', '.join(missing)}.")
+    try:
+        row = {field: record[field] for field in fields}
+        if "employee_id" in row:
+            row["employee_id"] = int(row["employee_id"])
+        if "salary" in row:
+            row["salary"] = float(row["salary"])
+        if "hire_date" in row:
+            datetime.datetime.strptime(row["hire_date"], "%Y-%m-%d")
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Line {line_number}: {e}.")
+    if mode == "delete":
+        return row["employee_id"]
+    return tuple(row.values())
+
+
+def write_records(rows: Iterable[tuple], file, file_format: str, columns=COLUMNS):
+    """Write rows to file as JSON lines or as CSV with a header."""
+    if file_format == "csv":
+        writer = csv.writer(file)
+        writer.writerow(columns)
+        writer.writerows(rows)
+    else:
+        for row in rows:
+            file.write(json.dumps(dict(zip(columns, row))) + "\n")
+
+
+def import_employees(conn, args) -> int:
+    bulk_functions = {
+        "insert": insert_employees_bulk,
+        "update": update_employees_bulk,
+        "delete": delete_employees_bulk,
+    }
+    file_format = _file_format(args.file, args.format)
+    with _open(args.file, "r") as file:
+        rows = (
+            parse_employee(record, line_number, args.mode)
+            for line_number, record in read_records(file, file_format)
+        )
+        # The whole file is written in one transaction, so a bad line rolls
+        # back everything before it.
+        result = bulk_functions[args.mode](conn, rows, chunk_size=args.chunk_size)
+    print(
+        json.dumps(
+            {
+                "mode": args.mode,
+                "rows": result.rows,
+                "seconds": round(result.seconds, 6),
+                "rows_per_second": round(result.rows_per_second),
+            }
+        )
+    )
+    return 0
+
+
+def export_employees(conn, args) -> int:
+    with _open(args.output, "w") as file:
+        write_records(
+            iter_all_employees_sorted_by_hire_date(conn),
+            file,
+            _file_format(args.output, args.format),
+        )
+    return 0
+
+
+def query_employees(conn, args) -> int:
+    write_records(
+        iter_employees_by_department(conn, args.department),
+        sys.stdout,
+        args.format or "jsonl",
+    )
+    return 0
+
+
+def department_stats(conn, args) -> int:
+    if args.check:
+        mismatched = check_department_salary_stats(conn)
+        print(json.dumps({"consistent": not mismatched, "mismatched": mismatched}))
+        return 1 if mismatched else 0
+
+    stats = query_department_salary_stats(conn)
+    if args.department is not None:
+        stats = [row for row in stats if row.department == args.department]
+    columns = (*stats[0]._fields, "average_salary") if stats else ()
+    write_records(
+        ((*row, row.average_salary) for row in stats),
+        sys.stdout,
+        args.format or "jsonl",
+        columns=columns,
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Employee Management System")
+    parser.add_argument("--database", default="employees.db")
+    parser.add_argument("--profile", choices=CONNECTION_PROFILES)
+    subparsers = parser.add_subparsers(dest="command")
+
+    import_parser = subparsers.add_parser(
+        "import", help="insert, update or delete employees from a file"
+    )
+    import_parser.add_argument(
+        "file", nargs="?", default="-", help="JSON lines or CSV; - for stdin"
+    )
+    import_parser.add_argument(
+        "--mode", choices=("insert", "update", "delete"), default="insert"
+    )
+    import_parser.add_argument("--format", choices=FORMATS)
+    import_parser.add_argument("--chunk-size", type=int, default=10_000)
+    import_parser.set_defaults(handler=import_employees)
+
+    export_parser = subparsers.add_parser(
+        "export", help="write all employees, sorted by hire date"
+    )
+    export_parser.add_argument("-o", "--output", default="-")
+    export_parser.add_argument("--format", choices=FORMATS)
+    export_parser.set_defaults(handler=export_employees)
+
+    query_parser = subparsers.add_parser(
+        "query", help="write the employees of a department"
+    )
+    query_parser.add_argument("--department", required=True)
+    query_parser.add_argument("--format", choices=FORMATS)
+    query_parser.set_defaults(handler=query_employees)
+
+    stats_parser = subparsers.add_parser(
+        "stats", help="write the salary stats of every department"
+    )
+    stats_parser.add_argument("--department")
+    stats_parser.add_argument("--format", choices=FORMATS)
+    stats_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="compare the stats with the employees table instead",
+    )
+    stats_parser.set_defaults(handler=department_stats)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    conn = create_connection(args.database, args.profile)
+    try:
+        create_table(conn)
+        if args.command is None:
+            interactive_menu(conn)
+            return 0
+        return args.handler(conn, args)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,55 +1,286 @@
 import logging
+import os
 import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import NamedTuple
 
 logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
 
 
-def create_connection(db_file: str) -> sqlite3.Connection:
-    """Create a connection to the SQLite database specified by db_file."""
+class BulkResult(NamedTuple):
+    """Number of rows written by a bulk operation, and how long it took."""
+
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+
+class DepartmentSalaryStats(NamedTuple):
+    """Salary aggregates of one department, from department_salary_stats."""
+
+    department: str
+    employee_count: int
+    salary_sum: float
+    salary_min: float
+    salary_max: float
+
+    @property
+    def average_salary(self) -> float:
+        return self.salary_sum / self.employee_count
+
+
+def _chunks(rows: Iterable, chunk_size: int) -> Iterator[list]:
+    """Split an iterable into lists of at most chunk_size rows."""
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def _executemany_in_transaction(
+    conn: sqlite3.Connection, sql: str, rows: Iterable, chunk_size: int
+) -> BulkResult:
+    """
+    Run executemany over rows in chunks, all inside a single transaction that is
+    committed once at the end, or rolled back entirely if any chunk fails.
+    """
+    start = time.perf_counter()
+    affected = 0
+    with conn:
+        cursor = conn.cursor()
+        for chunk in _chunks(rows, chunk_size):
+            cursor.executemany(sql, chunk)
+            affected += cursor.rowcount
+    return BulkResult(affected, time.perf_counter() - start)
+
+
+# Named connection profiles: the PRAGMAs create_connection applies to every new
+# connection. "performance" lets readers run concurrently with a writer (WAL),
+# syncs to disk only at checkpoints, and gives SQLite more memory to work with.
+CONNECTION_PROFILES = {
+    "default": {},
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # Negative sizes are in KiB: 64 MiB.
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+# The profile used when create_connection is not given one.
+PROFILE_ENVIRONMENT_VARIABLE = "EMPLOYEE_DB_PROFILE"
+
+
+def create_connection(
+    db_file: str,
+    profile: str | None = None,
+    cached_statements: int = 128,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
+    """
+    Create a connection to the SQLite database specified by db_file.
+
+    The PRAGMAs of the named profile (see CONNECTION_PROFILES) are applied to the
+    connection. Without a profile, the EMPLOYEE_DB_PROFILE environment variable
+    picks one, falling back to "default". cached_statements sets how many
+    prepared statements the connection keeps, and check_same_thread=False lets
+    it be handed from one thread to another, as ConnectionPool does.
+    """
+    if profile is None:
+        profile = os.environ.get(PROFILE_ENVIRONMENT_VARIABLE, "default")
+    if profile not in CONNECTION_PROFILES:
+        raise ValueError(f"Unknown connection profile: {profile}")
     try:
-        conn = sqlite3.connect(db_file)
-        logging.debug(f"Connected to database: {db_file}")
+        conn = sqlite3.connect(
+            db_file,
+            cached_statements=cached_statements,
+            check_same_thread=check_same_thread,
+        )
+        for pragma, value in CONNECTION_PROFILES[profile].items():
+            conn.execute(f"PRAGMA {pragma} = {value};")
+        logging.debug(f"Connected to database: {db_file} (profile: {profile})")
         return conn
     except sqlite3.Error as e:
         logging.error(f"Error connecting to database: {e}")
         raise
 
 
-def create_table(conn: sqlite3.Connection):
-    """Create the employees table if it doesn't already exist."""
+# Schema migrations, applied in order. PRAGMA user_version records how many have
+# been applied to a database, so each one runs exactly once.
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS employees (
+        employee_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        department TEXT NOT NULL,
+        salary REAL NOT NULL,
+        hire_date TEXT NOT NULL
+    );
+    """,
+    # The (department, salary) index also serves lookups by department alone, and
+    # covers AVG(salary) by department without touching the table, so a separate
+    # department index would only slow down writes.
+    """
+    CREATE INDEX IF NOT EXISTS idx_employees_department_salary
+        ON employees (department, salary);
+    CREATE INDEX IF NOT EXISTS idx_employees_hire_date ON employees (hire_date);
+    """,
+    # Per-department salary aggregates, kept in step with employees by triggers so
+    # that every write path (including the bulk functions and raw SQL) updates
+    # them. Count and sum change incrementally; after a delete or update the min
+    # and max are looked up again, which the (department, salary) index answers
+    # with a single seek.
+    """
+    CREATE TABLE IF NOT EXISTS department_salary_stats (
+        department TEXT PRIMARY KEY,
+        employee_count INTEGER NOT NULL,
+        salary_sum REAL NOT NULL,
+        salary_min REAL NOT NULL,
+        salary_max REAL NOT NULL
+    );
+    INSERT INTO department_salary_stats
+        SELECT department, COUNT(*), SUM(salary), MIN(salary), MAX(salary)
+        FROM employees GROUP BY department;
+
+    CREATE TRIGGER IF NOT EXISTS employees_stats_after_insert
+    AFTER INSERT ON employees
+    BEGIN
+        INSERT INTO department_salary_stats
+            VALUES (NEW.department, 1, NEW.salary, NEW.salary, NEW.salary)
+        ON CONFLICT (department) DO UPDATE SET
+            employee_count = employee_count + 1,
+            salary_sum = salary_sum + excluded.salary_sum,
+            salary_min = MIN(salary_min, excluded.salary_min),
+            salary_max = MAX(salary_max, excluded.salary_max);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS employees_stats_after_delete
+    AFTER DELETE ON employees
+    BEGIN
+        DELETE FROM department_salary_stats
+            WHERE department = OLD.department AND employee_count = 1;
+        UPDATE department_salary_stats SET
+            employee_count = employee_count - 1,
+            salary_sum = salary_sum - OLD.salary,
+            salary_min = (SELECT MIN(salary) FROM employees
+                          WHERE department = OLD.department),
+            salary_max = (SELECT MAX(salary) FROM employees
+                          WHERE department = OLD.department)
+            WHERE department = OLD.department;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS employees_stats_after_update
+    AFTER UPDATE OF department, salary ON employees
+    BEGIN
+        DELETE FROM department_salary_stats
+            WHERE department = OLD.department AND employee_count = 1
+                AND OLD.department <> NEW.department;
+        UPDATE department_salary_stats SET
+            employee_count = employee_count - 1,
+            salary_sum = salary_sum - OLD.salary,
+            salary_min = (SELECT MIN(salary) FROM employees
+                          WHERE department = OLD.department),
+            salary_max = (SELECT MAX(salary) FROM employees
+                          WHERE department = OLD.department)
+            WHERE department = OLD.department;
+        INSERT INTO department_salary_stats
+            VALUES (NEW.department, 1, NEW.salary, NEW.salary, NEW.salary)
+        ON CONFLICT (department) DO UPDATE SET
+            employee_count = employee_count + 1,
+            salary_sum = salary_sum + excluded.salary_sum,
+            salary_min = MIN(salary_min, excluded.salary_min),
+            salary_max = MAX(salary_max, excluded.salary_max);
+    END;
+    """,
+]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the number of schema migrations applied to the database."""
+    return conn.execute("PRAGMA user_version;").fetchone()[0]
+
+
+def migrate_schema(conn: sqlite3.Connection, target_version: int | None = None):
+    """
+    Apply any schema migrations the database is missing, up to target_version
+    (by default, all of them). Each migration runs in its own transaction.
+    """
+    if target_version is None:
+        target_version = len(MIGRATIONS)
     try:
+        current_version = get_schema_version(conn)
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS employees (
-                employee_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                department TEXT NOT NULL,
-                salary REAL NOT NULL,
-                hire_date TEXT NOT NULL
-            );
-        """
-        )
-        conn.commit()
+        for version in range(current_version + 1, target_version + 1):
+            cursor.executescript(
+                f"BEGIN; {MIGRATIONS[version - 1]} PRAGMA user_version = {version}; COMMIT;"
+            )
+            logging.debug(f"Migrated employees schema to version {version}.")
+    except sqlite3.Error as e:
+        logging.error(f"Error migrating schema: {e}")
+        conn.rollback()
+        raise
+
+
+def create_table(conn: sqlite3.Connection):
+    """Create the employees table and its indexes if they don't already exist."""
+    try:
+        migrate_schema(conn)
         logging.debug("Employees table created or already exists.")
     except sqlite3.Error as e:
         logging.error(f"Error creating table: {e}")
         raise
 
 
+def explain_query_plan(
+    conn: sqlite3.Connection, sql: str, parameters: tuple = ()
+) -> list[str]:
+    """
+    Return the steps of SQLite's query plan for sql, such as
+    "SEARCH employees USING INDEX idx_employees_hire_date (hire_date>?)".
+    """
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+    return [detail for _, _, _, detail in rows]
+
+
+def uses_index(
+    conn: sqlite3.Connection, sql: str, index_name: str, parameters: tuple = ()
+) -> bool:
+    """Return True if SQLite's query plan for sql uses the given index."""
+    return any(
+        f"INDEX {index_name}" in step
+        for step in explain_query_plan(conn, sql, parameters)
+    )
+
+
+# The single-row writes, shared by the functions below and by async_database.py.
+INSERT_EMPLOYEE_SQL = """
+    INSERT INTO employees (name, department, salary, hire_date)
+    VALUES (?, ?, ?, ?);
+"""
+# Parameters: (employee_id, name, department, salary, hire_date).
+UPDATE_EMPLOYEE_SQL = """
+    UPDATE employees
+    SET name = ?2, department = ?3, salary = ?4, hire_date = ?5
+    WHERE employee_id = ?1;
+"""
+DELETE_EMPLOYEE_SQL = """
+    DELETE FROM employees WHERE employee_id = ?;
+"""
+
+
 def insert_employee(
     conn: sqlite3.Connection, name: str, department: str, salary: float, hire_date: str
 ):
     """Insert a new employee record into the employees table."""
     try:
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO employees (name, department, salary, hire_date)
-            VALUES (?, ?, ?, ?);
-        """,
-            (name, department, salary, hire_date),
-        )
+        cursor.execute(INSERT_EMPLOYEE_SQL, (name, department, salary, hire_date))
         conn.commit()
         logging.debug(f"Inserted employee: {name}, {department}, {salary}, {hire_date}")
     except sqlite3.Error as e:
@@ -68,7 +299,7 @@ def query_employees_by_department(conn: sqlite3.Connection, department: str):
             (department,),
         )
         results = cursor.fetchall()
-        logging.debug(f"Queried employees in department '{department}': {results}")
+        logging.debug(f"Queried {len(results)} employees in department '{department}'.")
         return results
     except sqlite3.Error as e:
         logging.error(f"Error querying employees: {e}")
@@ -92,6 +323,96 @@ def query_all_employees_sorted_by_hire_date(conn: sqlite3.Connection):
         raise
 
 
+def _iter_rows(cursor: sqlite3.Cursor, batch_size: int) -> Iterator[tuple]:
+    """Yield the rows of an executed query, fetching batch_size rows at a time."""
+    while rows := cursor.fetchmany(batch_size):
+        yield from rows
+
+
+def iter_employees_by_department(
+    conn: sqlite3.Connection, department: str, batch_size: int = 1000
+) -> Iterator[tuple]:
+    """
+    Stream employee records by department, holding at most batch_size rows in
+    memory at a time.
+    """
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT * FROM employees WHERE department = ?;
+        """,
+            (department,),
+        )
+        logging.debug(f"Streaming employees in department '{department}'.")
+        yield from _iter_rows(cursor, batch_size)
+    except sqlite3.Error as e:
+        logging.error(f"Error querying employees: {e}")
+        raise
+
+
+def iter_all_employees_sorted_by_hire_date(
+    conn: sqlite3.Connection, batch_size: int = 1000
+) -> Iterator[tuple]:
+    """
+    Stream all employee records sorted by hire_date (then employee_id), holding at
+    most batch_size rows in memory at a time.
+    """
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT * FROM employees ORDER BY hire_date ASC, employee_id ASC;
+        """
+        )
+        logging.debug("Streaming all employees sorted by hire_date.")
+        yield from _iter_rows(cursor, batch_size)
+    except sqlite3.Error as e:
+        logging.error(f"Error querying employees: {e}")
+        raise
+
+
+def query_employees_page_by_hire_date(
+    conn: sqlite3.Connection,
+    page_size: int = 20,
+    after: tuple[str, int] | None = None,
+) -> list[tuple]:
+    """
+    Return one page of employee records sorted by hire_date, then employee_id.
+
+    Pages are keyset-paginated: pass the (hire_date, employee_id) of the last row
+    of the previous page as after, and the next page starts right behind it. Every
+    page is read straight from the hire_date index, however deep it is.
+    """
+    try:
+        cursor = conn.cursor()
+        if after is None:
+            cursor.execute(
+                """
+                SELECT * FROM employees
+                ORDER BY hire_date ASC, employee_id ASC
+                LIMIT ?;
+            """,
+                (page_size,),
+            )
+        else:
+            cursor.execute(
+                """
+                SELECT * FROM employees
+                WHERE (hire_date, employee_id) > (?, ?)
+                ORDER BY hire_date ASC, employee_id ASC
+                LIMIT ?;
+            """,
+                (*after, page_size),
+            )
+        results = cursor.fetchall()
+        logging.debug(f"Queried a page of {len(results)} employees after {after}.")
+        return results
+    except sqlite3.Error as e:
+        logging.error(f"Error querying employees: {e}")
+        raise
+
+
 def update_employee(
     conn: sqlite3.Connection,
     employee_id: int,
@@ -104,12 +425,7 @@ def update_employee(
     try:
         cursor = conn.cursor()
         cursor.execute(
-            """
-            UPDATE employees
-            SET name = ?, department = ?, salary = ?, hire_date = ?
-            WHERE employee_id = ?;
-        """,
-            (name, department, salary, hire_date, employee_id),
+            UPDATE_EMPLOYEE_SQL, (employee_id, name, department, salary, hire_date)
         )
         conn.commit()
         logging.debug(f"Updated employee with ID {employee_id}.")
@@ -122,12 +438,7 @@ def delete_employee(conn: sqlite3.Connection, employee_id: int):
     """Delete an employee record by employee_id."""
     try:
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            DELETE FROM employees WHERE employee_id = ?;
-        """,
-            (employee_id,),
-        )
+        cursor.execute(DELETE_EMPLOYEE_SQL, (employee_id,))
         conn.commit()
         logging.debug(f"Deleted employee with ID {employee_id}.")
     except sqlite3.Error as e:
@@ -138,19 +449,188 @@ def delete_employee(conn: sqlite3.Connection, employee_id: int):
 def calculate_average_salary_by_department(
     conn: sqlite3.Connection, department: str
 ) -> float:
-    """Calculate and return the average salary for a given department."""
+    """
+    Return the average salary for a given department, read from the
+    department_salary_stats summary rather than averaged over the employees.
+    """
     try:
         cursor = conn.cursor()
         cursor.execute(
             """
-            SELECT AVG(salary) FROM employees WHERE department = ?;
+            SELECT salary_sum / employee_count FROM department_salary_stats
+            WHERE department = ?;
         """,
             (department,),
         )
-        result = cursor.fetchone()[0]
-        avg_salary = result if result is not None else 0.0
+        row = cursor.fetchone()
+        avg_salary = row[0] if row is not None else 0.0
         logging.debug(f"Average salary in department '{department}': {avg_salary}")
         return avg_salary
     except sqlite3.Error as e:
         logging.error(f"Error calculating average salary: {e}")
         raise
+
+
+def query_department_salary_stats(
+    conn: sqlite3.Connection,
+) -> list[DepartmentSalaryStats]:
+    """
+    Return the salary stats of every department in one query, ordered by
+    department. Departments without employees are not listed.
+    """
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT department, employee_count, salary_sum, salary_min, salary_max
+            FROM department_salary_stats ORDER BY department;
+        """
+        )
+        stats = [DepartmentSalaryStats(*row) for row in cursor.fetchall()]
+        logging.debug(f"Loaded salary stats for {len(stats)} departments.")
+        return stats
+    except sqlite3.Error as e:
+        logging.error(f"Error querying department salary stats: {e}")
+        raise
+
+
+def check_department_salary_stats(
+    conn: sqlite3.Connection, tolerance: float = 1e-6
+) -> list[str]:
+    """
+    Compare department_salary_stats with aggregates computed from the employees
+    table, and return the departments whose stats differ (or are missing on
+    either side). Sums are compared with a relative tolerance, since they are
+    updated incrementally in floating point. This scans the whole table.
+    """
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT department, COUNT(*), SUM(salary), MIN(salary), MAX(salary)
+            FROM employees GROUP BY department;
+        """
+        )
+        expected = {row[0]: row for row in cursor.fetchall()}
+        actual = {
+            stats.department: stats for stats in query_department_salary_stats(conn)
+        }
+
+        mismatched = []
+        for department in sorted(expected.keys() | actual.keys()):
+            if department not in expected or department not in actual:
+                mismatched.append(department)
+                continue
+            _, count, total, low, high = expected[department]
+            stats = actual[department]
+            if (
+                stats.employee_count != count
+                or stats.salary_min != low
+                or stats.salary_max != high
+                or abs(stats.salary_sum - total) > tolerance * max(1.0, abs(total))
+            ):
+                mismatched.append(department)
+        if mismatched:
+            logging.warning(
+                f"Salary stats out of date for {len(mismatched)} departments."
+            )
+        return mismatched
+    except sqlite3.Error as e:
+        logging.error(f"Error checking department salary stats: {e}")
+        raise
+
+
+def rebuild_department_salary_stats(conn: sqlite3.Connection):
+    """Recompute department_salary_stats from the employees table."""
+    try:
+        with conn:
+            conn.execute("DELETE FROM department_salary_stats;")
+            conn.execute(
+                """
+                INSERT INTO department_salary_stats
+                    SELECT department, COUNT(*), SUM(salary), MIN(salary), MAX(salary)
+                    FROM employees GROUP BY department;
+            """
+            )
+        logging.debug("Department salary stats rebuilt.")
+    except sqlite3.Error as e:
+        logging.error(f"Error rebuilding department salary stats: {e}")
+        raise
+
+
+def insert_employees_bulk(
+    conn: sqlite3.Connection,
+    employees: Iterable[tuple[str, str, float, str]],
+    chunk_size: int = 10_000,
+) -> BulkResult:
+    """
+    Insert many (name, department, salary, hire_date) records in one transaction.
+
+    employees may be any iterable, including a generator; it is consumed in chunks
+    of chunk_size rows, so it is never held in memory all at once.
+    """
+    try:
+        result = _executemany_in_transaction(
+            conn,
+            INSERT_EMPLOYEE_SQL,
+            employees,
+            chunk_size,
+        )
+        logging.debug(
+            f"Bulk inserted {result.rows} employees "
+            f"({result.rows_per_second:.0f} rows/sec)."
+        )
+        return result
+    except sqlite3.Error as e:
+        logging.error(f"Error bulk inserting employees: {e}")
+        raise
+
+
+def update_employees_bulk(
+    conn: sqlite3.Connection,
+    employees: Iterable[tuple[int, str, str, float, str]],
+    chunk_size: int = 10_000,
+) -> BulkResult:
+    """
+    Update many (employee_id, name, department, salary, hire_date) records in one
+    transaction. The result counts the rows that were actually updated.
+    """
+    try:
+        result = _executemany_in_transaction(
+            conn,
+            UPDATE_EMPLOYEE_SQL,
+            employees,
+            chunk_size,
+        )
+        logging.debug(
+            f"Bulk updated {result.rows} employees "
+            f"({result.rows_per_second:.0f} rows/sec)."
+        )
+        return result
+    except sqlite3.Error as e:
+        logging.error(f"Error bulk updating employees: {e}")
+        raise
+
+
+def delete_employees_bulk(
+    conn: sqlite3.Connection, employee_ids: Iterable[int], chunk_size: int = 10_000
+) -> BulkResult:
+    """
+    Delete many employee records by employee_id in one transaction. The result
+    counts the rows that were actually deleted.
+    """
+    try:
+        result = _executemany_in_transaction(
+            conn,
+            DELETE_EMPLOYEE_SQL,
+            ((employee_id,) for employee_id in employee_ids),
+            chunk_size,
+        )
+        logging.debug(
+            f"Bulk deleted {result.rows} employees "
+            f"({result.rows_per_second:.0f} rows/sec)."
+        )
+        return result
+    except sqlite3.Error as e:
+        logging.error(f"Error bulk deleting employees: {e}")
+        raise
@@ -0,0 +1,173 @@
+import logging
+import queue
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TypeVar
+
+from database import create_connection
+
+T = TypeVar("T")
+
+
+class ConnectionPool:
+    """
+    A bounded pool of SQLite connections that can be shared between threads.
+
+    At most max_size connections are open at once. A thread checks one out with
+    ``with pool.connection() as conn:`` and can pass it to any function in
+    database.py; nested checkouts in the same thread reuse its connection, so
+    helpers that take a pool can call each other without deadlocking. Idle
+    connections are reused most-recently-first and pass a ``SELECT 1`` health
+    check before being handed out; a connection that fails it is replaced.
+
+    Every connection opens db_file separately, so ":memory:" gives each one its
+    own empty database; use a file for a shared pool.
+    """
+
+    def __init__(
+        self,
+        db_file: str,
+        max_size: int = 5,
+        profile: str | None = None,
+        cached_statements: int = 128,
+        timeout: float | None = 30.0,
+    ):
+        """
+        :param db_file: The SQLite database to connect to.
+        :param max_size: The maximum number of open connections.
+        :param profile: The connection profile (see CONNECTION_PROFILES).
+        :param cached_statements: The prepared statement cache size per connection.
+        :param timeout: Seconds to wait for a free connection, or None to wait
+            forever.
+        :raises ValueError: If max_size is not positive or the profile is unknown.
+        """
+        if max_size <= 0:
+            raise ValueError("The pool size must be positive.")
+        self.db_file = db_file
+        self.max_size = max_size
+        self.profile = profile
+        self.cached_statements = cached_statements
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._idle = queue.LifoQueue()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open = 0
+        self._closed = False
+        # Fail early on a bad profile or path rather than on the first checkout.
+        self._idle.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = create_connection(
+            self.db_file,
+            self.profile,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+        )
+        with self._lock:
+            self._open += 1
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection):
+        with self._lock:
+            self._open -= 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1;").fetchone()
+            return True
+        except sqlite3.Error as e:
+            logging.warning(f"Discarding unhealthy pooled connection: {e}")
+            return False
+
+    def _checkout(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("The connection pool is closed.")
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(
+                f"No connection became free within {self.timeout} seconds."
+            )
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+                if self._is_healthy(conn):
+                    return conn
+                self._discard(conn)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _checkin(self, conn: sqlite3.Connection):
+        try:
+            if conn.in_transaction:
+                # Never hand the next thread a half-finished transaction.
+                conn.rollback()
+            if self._closed:
+                self._discard(conn)
+            else:
+                self._idle.put(conn)
+        except sqlite3.Error:
+            self._discard(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a connection for the current thread, for the with block."""
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self._checkout()
+        self._local.conn, self._local.depth = conn, 1
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._checkin(conn)
+
+    def run(self, function: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Call one of the database.py functions with a pooled connection, e.g.
+        ``pool.run(query_employees_by_department, "IT")``.
+        """
+        with self.connection() as conn:
+            return function(conn, *args, **kwargs)
+
+    @property
+    def open_connections(self) -> int:
+        """The number of connections currently open, idle or checked out."""
+        return self._open
+
+    def close(self):
+        """
+        Close the idle connections. Checked-out connections are closed when they
+        are returned, and further checkouts raise a RuntimeError.
+        """
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        logging.debug(f"Connection pool for {self.db_file} closed.")
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,96 @@
+import asyncio
+import sqlite3
+
+import pytest
+from async_database import AsyncEmployeeDatabase
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    return str(tmp_path / "employees.db")
+
+
+def test_concurrent_writes_are_group_committed(db_file):
+    """
+    Test that concurrent inserts all land, sharing fewer commits than writes,
+    and that reads see them.
+    """
+
+    async def scenario():
+        async with AsyncEmployeeDatabase(db_file, readers=2) as db:
+            employee_ids = await asyncio.gather(
+                *(
+                    db.insert_employee(f"Employee {i}", "IT", 1000.0, "2024-01-01")
+                    for i in range(200)
+                )
+            )
+            employees = await db.query_employees_by_department("IT")
+            average = await db.calculate_average_salary_by_department("IT")
+            return db.commits, employee_ids, employees, average
+
+    commits, employee_ids, employees, average = asyncio.run(scenario())
+    assert sorted(employee_ids) == list(range(1, 201))
+    assert len(employees) == 200
+    assert average == 1000.0
+    assert commits < 200
+
+
+def test_failed_write_does_not_undo_the_batch(db_file):
+    """
+    Test that a write violating a constraint raises in its own caller only.
+    """
+
+    async def scenario():
+        async with AsyncEmployeeDatabase(db_file) as db:
+            results = await asyncio.gather(
+                db.insert_employee("Alice", "IT", 1000.0, "2024-01-01"),
+                db.insert_employee("Bob", None, 1000.0, "2024-01-01"),
+                db.insert_employees_bulk([("Carol", "HR", 2000.0, "2024-01-01")] * 3),
+                return_exceptions=True,
+            )
+            updated = await db.update_employee(1, "Alice", "HR", 1500.0, "2024-01-01")
+            deleted = await db.delete_employee(99)
+            stats = await db.query_department_salary_stats()
+            return results, updated, deleted, stats
+
+    results, updated, deleted, stats = asyncio.run(scenario())
+    assert results[0] == 1
+    assert isinstance(results[1], sqlite3.IntegrityError)
+    assert results[2] == 3
+    assert (updated, deleted) == (1, 0)
+    assert [(row.department, row.employee_count) for row in stats] == [("HR", 4)]
+
+
+def test_cancelled_write_does_not_stop_the_writer(db_file):
+    """
+    Test that a write cancelled while queued is dropped, and that the writes
+    after it still complete.
+    """
+
+    async def scenario():
+        async with AsyncEmployeeDatabase(db_file) as db:
+            # Hold the write lock so the writer thread waits on its first batch.
+            blocker = sqlite3.connect(db_file)
+            blocker.execute("BEGIN IMMEDIATE;")
+            first = asyncio.create_task(
+                db.insert_employee("Alice", "IT", 1000.0, "2024-01-01")
+            )
+            await asyncio.sleep(0.1)
+            cancelled = asyncio.create_task(
+                db.insert_employee("Bob", "IT", 1000.0, "2024-01-01")
+            )
+            await asyncio.sleep(0.1)
+            cancelled.cancel()
+            blocker.rollback()
+            blocker.close()
+
+            await first
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            await asyncio.wait_for(
+                db.insert_employee("Carol", "IT", 1000.0, "2024-01-01"), timeout=5
+            )
+            return await db.query_employees_by_department("IT")
+
+    employees = asyncio.run(scenario())
+    assert [employee[1] for employee in employees] == ["Alice", "Carol"]
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+from cli import main
+
+ALICE = {"name": "Alice", "department": "IT", "salary": 1000, "hire_date": "2024-02-01"}
+BOB = {"name": "Bob", "department": "HR", "salary": 2000, "hire_date": "2023-01-01"}
+
+
+@pytest.fixture
+def database(tmp_path):
+    """The path of an empty employees database."""
+    return str(tmp_path / "employees.db")
+
+
+def write_lines(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return str(path)
+
+
+def read_json_lines(text: str) -> list[dict]:
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_import_export_and_query(database, tmp_path, capsys):
+    """
+    Test importing JSON lines, exporting them as CSV and querying a department.
+    """
+    employees = write_lines(
+        tmp_path / "employees.jsonl", [ALICE, {**BOB, "salary": "2000.5"}]
+    )
+    assert main(["--database", database, "import", employees]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["mode"], summary["rows"]) == ("insert", 2)
+
+    output = tmp_path / "employees.csv"
+    assert main(["--database", database, "export", "-o", str(output)]) == 0
+    assert output.read_text().splitlines() == [
+        "employee_id,name,department,salary,hire_date",
+        "2,Bob,HR,2000.5,2023-01-01",
+        "1,Alice,IT,1000.0,2024-02-01",
+    ]
+
+    assert main(["--database", database, "query", "--department", "IT"]) == 0
+    assert read_json_lines(capsys.readouterr().out) == [
+        {
+            "employee_id": 1,
+            "name": "Alice",
+            "department": "IT",
+            "salary": 1000.0,
+            "hire_date": "2024-02-01",
+        }
+    ]
+
+
+def test_import_updates_from_csv_on_stdin(database, tmp_path, capsys, monkeypatch):
+    """
+    Test updating employees from CSV on stdin, then reading the stats.
+    """
+    employees = write_lines(tmp_path / "employees.jsonl", [ALICE])
+    main(["--database", database, "import", employees])
+
+    changes = tmp_path / "changes.csv"
+    changes.write_text(
+        "employee_id,name,department,salary,hire_date\n1,Alice,IT,3000,2024-02-01\n"
+    )
+    with open(changes) as stdin:
+        monkeypatch.setattr("sys.stdin", stdin)
+        argv = ["--database", database, "import", "--mode", "update", "--format", "csv"]
+        assert main(argv) == 0
+    capsys.readouterr()
+
+    assert main(["--database", database, "stats"]) == 0
+    assert read_json_lines(capsys.readouterr().out) == [
+        {
+            "department": "IT",
+            "employee_count": 1,
+            "salary_sum": 3000.0,
+            "salary_min": 3000.0,
+            "salary_max": 3000.0,
+            "average_salary": 3000.0,
+        }
+    ]
+    assert main(["--database", database, "stats", "--check"]) == 0
+
+
+def test_import_rejects_invalid_lines(database, tmp_path, capsys):
+    """
+    Test that an invalid line fails the import, naming the line, and that none
+    of the lines before it are kept.
+    """
+    employees = write_lines(
+        tmp_path / "employees.jsonl", [ALICE, {**BOB, "hire_date": "01/01/2023"}]
+    )
+    assert main(["--database", database, "import", employees]) == 1
+    assert "Line 2" in capsys.readouterr().err
+
+    for not_an_object in [[1, 2], "x"]:
+        employees = write_lines(tmp_path / "employees.jsonl", [ALICE, not_an_object])
+        assert main(["--database", database, "import", employees]) == 1
+        assert "Line 2: expected a JSON object" in capsys.readouterr().err
+
+    assert main(["--database", database, "export"]) == 0
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,256 @@
+import sqlite3
+
+import pytest
+from database import (
+    MIGRATIONS,
+    PROFILE_ENVIRONMENT_VARIABLE,
+    DepartmentSalaryStats,
+    calculate_average_salary_by_department,
+    check_department_salary_stats,
+    create_connection,
+    create_table,
+    delete_employees_bulk,
+    explain_query_plan,
+    get_schema_version,
+    insert_employee,
+    insert_employees_bulk,
+    iter_all_employees_sorted_by_hire_date,
+    iter_employees_by_department,
+    query_all_employees_sorted_by_hire_date,
+    query_employees_by_department,
+    query_department_salary_stats,
+    query_employees_page_by_hire_date,
+    rebuild_department_salary_stats,
+    update_employee,
+    update_employees_bulk,
+    uses_index,
+)
+
+
+@pytest.fixture
+def conn():
+    """An in-memory database with an empty employees table."""
+    conn = create_connection(":memory:")
+    create_table(conn)
+    yield conn
+    conn.close()
+
+
+def test_insert_employees_bulk_from_generator(conn):
+    """
+    Test that a generator of employees is inserted across several chunks.
+    """
+    employees = (
+        (f"Employee {i}", "Sales" if i % 2 else "IT", 1000.0 * i, "2024-01-01")
+        for i in range(25)
+    )
+    result = insert_employees_bulk(conn, employees, chunk_size=10)
+
+    assert result.rows == 25
+    assert result.rows_per_second > 0
+    assert len(query_employees_by_department(conn, "Sales")) == 12
+    assert len(query_employees_by_department(conn, "IT")) == 13
+
+
+def test_insert_employees_bulk_rolls_back_on_error(conn):
+    """
+    Test that a failing chunk rolls back every chunk of the bulk insert.
+    """
+    employees = [("Alice", "IT", 1000.0, "2024-01-01")] * 10
+    employees.append(("Bob", None, 1000.0, "2024-01-01"))
+    with pytest.raises(sqlite3.IntegrityError):
+        insert_employees_bulk(conn, employees, chunk_size=5)
+    assert query_all_employees_sorted_by_hire_date(conn) == []
+
+
+def test_update_and_delete_employees_bulk(conn):
+    """
+    Test bulk updates and deletes, counting only the rows that exist.
+    """
+    insert_employee(conn, "Alice", "IT", 1000.0, "2024-01-01")
+    insert_employee(conn, "Bob", "IT", 2000.0, "2023-01-01")
+
+    result = update_employees_bulk(
+        conn,
+        [
+            (1, "Alice", "Sales", 1500.0, "2024-01-01"),
+            (99, "Nobody", "Sales", 0.0, "2024-01-01"),
+        ],
+    )
+    assert result.rows == 1
+    assert query_employees_by_department(conn, "Sales") == [
+        (1, "Alice", "Sales", 1500.0, "2024-01-01")
+    ]
+
+    result = delete_employees_bulk(conn, iter([1, 2, 99]))
+    assert result.rows == 2
+    assert query_all_employees_sorted_by_hire_date(conn) == []
+
+
+def test_create_table_migrates_existing_database(tmp_path):
+    """
+    Test that create_table adds the indexes to a database created before they
+    existed, and that running it again is a no-op.
+    """
+    conn = create_connection(str(tmp_path / "employees.db"))
+    conn.execute(MIGRATIONS[0])
+    insert_employee(conn, "Alice", "IT", 1000.0, "2024-01-01")
+    assert get_schema_version(conn) == 0
+
+    create_table(conn)
+    create_table(conn)
+    assert get_schema_version(conn) == len(MIGRATIONS)
+    assert len(query_employees_by_department(conn, "IT")) == 1
+    assert query_department_salary_stats(conn) == [
+        DepartmentSalaryStats("IT", 1, 1000.0, 1000.0, 1000.0)
+    ]
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    "sql, parameters, index_name",
+    [
+        (
+            "SELECT * FROM employees WHERE department = ?;",
+            ("IT",),
+            "idx_employees_department_salary",
+        ),
+        (
+            "SELECT * FROM employees ORDER BY hire_date ASC;",
+            (),
+            "idx_employees_hire_date",
+        ),
+        (
+            "SELECT AVG(salary) FROM employees WHERE department = ?;",
+            ("IT",),
+            "idx_employees_department_salary",
+        ),
+    ],
+)
+def test_employee_queries_use_indexes(conn, sql, parameters, index_name):
+    """
+    Test that the employee queries are answered from an index rather than a
+    full table scan.
+    """
+    assert uses_index(conn, sql, index_name, parameters), explain_query_plan(
+        conn, sql, parameters
+    )
+
+
+def test_streaming_queries_match_fetchall(conn):
+    """
+    Test that the streaming variants return the same rows as the fetchall ones,
+    across several fetchmany batches.
+    """
+    insert_employees_bulk(
+        conn,
+        ((f"Employee {i}", "IT", 1000.0, f"2024-01-{28 - i:02d}") for i in range(25)),
+    )
+    assert list(iter_employees_by_department(conn, "IT", batch_size=4)) == (
+        query_employees_by_department(conn, "IT")
+    )
+    assert list(iter_all_employees_sorted_by_hire_date(conn, batch_size=4)) == (
+        query_all_employees_sorted_by_hire_date(conn)
+    )
+
+
+def test_query_employees_page_by_hire_date(conn):
+    """
+    Test that walking the keyset pages visits every employee once, in hire date
+    order, including employees hired on the same day.
+    """
+    insert_employees_bulk(
+        conn,
+        (
+            (f"Employee {i}", "IT", 1000.0, f"2024-01-{1 + i % 3:02d}")
+            for i in range(10)
+        ),
+    )
+    seen = []
+    page = query_employees_page_by_hire_date(conn, page_size=4)
+    while page:
+        seen.extend(page)
+        last = page[-1]
+        page = query_employees_page_by_hire_date(
+            conn, page_size=4, after=(last[4], last[0])
+        )
+    assert seen == list(iter_all_employees_sorted_by_hire_date(conn))
+
+
+def test_create_connection_performance_profile(tmp_path):
+    """
+    Test that the performance profile's PRAGMAs are applied on connect.
+    """
+    conn = create_connection(str(tmp_path / "employees.db"), "performance")
+    assert conn.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous;").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store;").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA busy_timeout;").fetchone()[0] == 5000
+    conn.close()
+
+
+def test_create_connection_profile_from_environment(tmp_path, monkeypatch):
+    """
+    Test that the profile can be picked per environment, and that unknown
+    profiles are rejected.
+    """
+    monkeypatch.setenv(PROFILE_ENVIRONMENT_VARIABLE, "performance")
+    conn = create_connection(str(tmp_path / "employees.db"))
+    assert conn.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+    conn.close()
+
+    with pytest.raises(ValueError):
+        create_connection(str(tmp_path / "employees.db"), "turbo")
+
+
+def test_department_salary_stats_follow_every_write(conn):
+    """
+    Test that the department stats stay consistent through single and bulk
+    inserts, updates that move employees between departments, and deletes.
+    """
+    insert_employee(conn, "Alice", "IT", 1000.0, "2024-01-01")
+    insert_employees_bulk(
+        conn,
+        [
+            ("Bob", "IT", 3000.0, "2024-01-01"),
+            ("Carol", "Sales", 2000.0, "2024-01-01"),
+            ("Dan", "Sales", 4000.0, "2024-01-01"),
+        ],
+    )
+    assert query_department_salary_stats(conn) == [
+        DepartmentSalaryStats("IT", 2, 4000.0, 1000.0, 3000.0),
+        DepartmentSalaryStats("Sales", 2, 6000.0, 2000.0, 4000.0),
+    ]
+    assert calculate_average_salary_by_department(conn, "IT") == 2000.0
+
+    update_employee(conn, 2, "Bob", "Sales", 5000.0, "2024-01-01")
+    update_employees_bulk(conn, [(1, "Alice", "IT", 1500.0, "2024-01-01")])
+    delete_employees_bulk(conn, [3])
+    assert query_department_salary_stats(conn) == [
+        DepartmentSalaryStats("IT", 1, 1500.0, 1500.0, 1500.0),
+        DepartmentSalaryStats("Sales", 2, 9000.0, 4000.0, 5000.0),
+    ]
+    assert check_department_salary_stats(conn) == []
+
+    delete_employees_bulk(conn, [1])
+    assert [stats.department for stats in query_department_salary_stats(conn)] == [
+        "Sales"
+    ]
+    assert calculate_average_salary_by_department(conn, "IT") == 0.0
+
+
+def test_check_and_rebuild_department_salary_stats(conn):
+    """
+    Test that the consistency checker reports stats changed behind the triggers'
+    back, and that rebuilding them fixes it.
+    """
+    insert_employees_bulk(
+        conn,
+        [("Alice", "IT", 1000.0, "2024-01-01"), ("Bob", "HR", 2000.0, "2024-01-01")],
+    )
+    conn.execute("UPDATE department_salary_stats SET salary_sum = 0;")
+    conn.execute("DELETE FROM department_salary_stats WHERE department = 'HR';")
+    assert check_department_salary_stats(conn) == ["HR", "IT"]
+
+    rebuild_department_salary_stats(conn)
+    assert check_department_salary_stats(conn) == []
@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+from database import (
+    create_table,
+    insert_employee,
+    query_all_employees_sorted_by_hire_date,
+    query_employees_by_department,
+)
+from pool import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """A pool of two connections to a file database with an employees table."""
+    pool = ConnectionPool(str(tmp_path / "employees.db"), max_size=2)
+    pool.run(create_table)
+    yield pool
+    pool.close()
+
+
+def test_nested_checkouts_reuse_the_thread_connection(pool):
+    """
+    Test that a thread checking out twice gets the same connection back, and
+    that the connection is reused after it is returned.
+    """
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert inner is outer
+    with pool.connection() as conn:
+        assert conn is outer
+    assert pool.open_connections == 1
+
+
+def test_pool_is_bounded(pool):
+    """
+    Test that a checkout waits for a free connection and times out when none is
+    returned.
+    """
+    pool.timeout = 0.1
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold_connection():
+        with pool.connection():
+            held.set()
+            release.wait()
+
+    threads = [threading.Thread(target=hold_connection) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+        held.wait()
+        held.clear()
+    with pytest.raises(TimeoutError):
+        with pool.connection():
+            pass
+    assert pool.open_connections == 2
+
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert pool.run(query_all_employees_sorted_by_hire_date) == []
+
+
+def test_unhealthy_connection_is_replaced(pool):
+    """
+    Test that a connection failing the health check is discarded, and that an
+    unfinished transaction is rolled back when a connection is returned.
+    """
+    with pool.connection() as conn:
+        conn.execute(
+            "INSERT INTO employees (name, department, salary, hire_date) "
+            "VALUES ('Alice', 'IT', 1000.0, '2024-01-01');"
+        )
+    assert pool.run(query_employees_by_department, "IT") == []
+
+    conn.close()
+    with pool.connection() as replacement:
+        assert replacement is not conn
+    assert pool.open_connections == 1
+
+
+def test_threads_share_the_pool(pool):
+    """
+    Test that many threads can write through a small pool.
+    """
+
+    def insert_employees(thread_id: int):
+        for i in range(20):
+            pool.run(
+                insert_employee, f"Employee {thread_id}-{i}", "IT", 1000.0, "2024-01-01"
+            )
+
+    threads = [
+        threading.Thread(target=insert_employees, args=(thread_id,))
+        for thread_id in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(pool.run(query_employees_by_department, "IT")) == 160
+    assert pool.open_connections <= pool.max_size
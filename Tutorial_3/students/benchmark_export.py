@@ -0,0 +1,117 @@
+"""
+Benchmark the peak memory and throughput of exporting the Students table with
+fetchall, as the original script did, against the streaming export.
+
+Usage:
+    python benchmark_export.py [rows]
+
+The default is 5,000,000 students. Each export runs in its own process so its
+peak resident set size (RSS) can be measured on its own; for the parallel
+export this is the largest of the parent and its worker processes.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+from export_data_to_csv import export_to_csv
+
+MODES = {
+    "fetchall": ("students.csv", 1),
+    "stream": ("students.csv", 1),
+    "stream gzip": ("students.csv.gz", 1),
+    "4 parts": ("students.csv", 4),
+    "4 parts gzip": ("students.csv.gz", 4),
+}
+
+
+def export_fetchall(file_name: str, database: str) -> tuple[int, int]:
+    """The original export: fetch every row, then write them."""
+    with sqlite3.connect(database) as connection:
+        cursor = connection.cursor()
+        cursor.execute("SELECT * FROM Students;")
+        students = cursor.fetchall()
+        with open(file_name, "w", newline="") as csv_file:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(["ID", "Name", "Age", "Email"])
+            csv_writer.writerows(students)
+    connection.close()
+    return len(students), os.path.getsize(file_name)
+
+
+def run_export(database: str, mode: str, directory: str):
+    """
+    Run one export and print its throughput, in rows/s and in MB/s of output
+    (compressed, for gzip), and its peak RSS.
+    """
+    base_name, parts = MODES[mode]
+    file_name = os.path.join(directory, base_name)
+    start = time.perf_counter()
+    if mode == "fetchall":
+        rows, size = export_fetchall(file_name, database)
+    else:
+        # Keep the export's own summary line out of the report.
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = export_to_csv(file_name, database, parts=parts)
+        rows, size = result.rows, result.bytes
+    seconds = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux.
+    peak_mb = (
+        max(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        )
+        / 1024
+    )
+    print(
+        f"{mode:<14} {size / 1024**2:8.1f} MB {seconds:7.2f} s "
+        f"{rows / seconds:9.0f} rows/s {size / 1024**2 / seconds:6.1f} MB/s "
+        f"{peak_mb:8.1f} MB peak RSS"
+    )
+
+
+def main():
+    if len(sys.argv) == 5 and sys.argv[1] == "--export":
+        run_export(*sys.argv[2:])
+        return
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "students.db")
+        with sqlite3.connect(database) as connection:
+            connection.execute(
+                """
+                CREATE TABLE Students (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    age INTEGER,
+                    email TEXT
+                );
+                """
+            )
+            connection.executemany(
+                "INSERT INTO Students (name, age, email) VALUES (?, ?, ?);",
+                (
+                    (f"Student {i}", 18 + i % 8, f"student{i}@example.com")
+                    for i in range(rows)
+                ),
+            )
+        connection.close()
+
+        print(f"{rows:,} students")
+        for mode in MODES:
+            subprocess.run(
+                [sys.executable, __file__, "--export", database, mode, directory],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
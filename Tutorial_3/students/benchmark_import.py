@@ -0,0 +1,116 @@
+"""
+Benchmark importing a large CSV file into the Students table, row by row as the
+original script did, and in chunks with executemany.
+
+Usage:
+    python benchmark_import.py [rows]
+
+The default is 10,000,000 rows (a CSV file of about 400 MB), which takes several
+minutes. Each import runs into a new temporary database, either without indexes,
+with an index on email maintained during the load, or with that index dropped
+and rebuilt around the load.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from import_data_from_csv import import_from_csv
+
+
+def create_students_table(database: str, with_index: bool):
+    with sqlite3.connect(database) as connection:
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS Students (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                age INTEGER,
+                email TEXT
+            );
+            """
+        )
+        if with_index:
+            connection.execute("CREATE INDEX idx_students_email ON Students (email);")
+    connection.close()
+
+
+def write_csv(file_name: str, rows: int):
+    with open(file_name, "w", newline="") as csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(["Name", "Age", "Email"])
+        csv_writer.writerows(
+            (f"Student {i}", 18 + i % 8, f"student{i * 7919 % rows}@example.com")
+            for i in range(rows)
+        )
+
+
+def import_row_by_row(file_name: str, database: str) -> float:
+    """Return the rows/sec of the original one-execute-per-row import."""
+    start = time.perf_counter()
+    with sqlite3.connect(database) as connection:
+        cursor = connection.cursor()
+        with open(file_name, "r") as csv_file:
+            csv_reader = csv.reader(csv_file)
+            next(csv_reader)
+            rows = 0
+            for row in csv_reader:
+                cursor.execute(
+                    "INSERT INTO Students (name, age, email) VALUES (?, ?, ?);",
+                    (row[0], row[1], row[2]),
+                )
+                rows += 1
+        connection.commit()
+    connection.close()
+    return rows / (time.perf_counter() - start)
+
+
+def import_chunked(file_name: str, database: str, rebuild_indexes: bool) -> float:
+    """Return the rows/sec of import_from_csv."""
+    # Keep the per-chunk progress lines out of the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = import_from_csv(file_name, database, rebuild_indexes=rebuild_indexes)
+    return result.rows_per_second
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    runs = {
+        ("no index", "row by row"): (False, import_row_by_row),
+        ("no index", "executemany"): (
+            False,
+            lambda file_name, database: import_chunked(file_name, database, False),
+        ),
+        ("index maintained", "row by row"): (True, import_row_by_row),
+        ("index maintained", "executemany"): (
+            True,
+            lambda file_name, database: import_chunked(file_name, database, False),
+        ),
+        ("index rebuilt", "executemany"): (
+            True,
+            lambda file_name, database: import_chunked(file_name, database, True),
+        ),
+    }
+
+    print(f"{rows:,} rows")
+    print(f"{'email index':<18} {'import':<12} {'rows/sec':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "students.csv")
+        write_csv(file_name, rows)
+        for run, ((index, method), (with_index, import_file)) in enumerate(
+            runs.items()
+        ):
+            database = os.path.join(directory, f"students_{run}.db")
+            create_students_table(database, with_index)
+            rows_per_second = import_file(file_name, database)
+            os.remove(database)
+            print(f"{index:<18} {method:<12} {rows_per_second:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark bulk updates and deletes of students against the per-row loop of
+update_record.py and delete_record.py.
+
+Usage:
+    python benchmark_mutations.py [students] [changes]
+
+The default is 1,000,000 students, made by generate_synthetic_data.py, and
+100,000 changes, at most one per student: age updates keyed by email and
+deletes keyed by id. Without an index every per-row update scans the table, so
+that loop only runs on the first 200 changes and its rate is given for those.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+from bulk_mutate_students import (
+    bulk_delete_students,
+    bulk_update_students,
+    create_student_indexes,
+)
+from generate_synthetic_data import load_into_sqlite
+
+UNINDEXED_MAX_CHANGES = 200
+
+
+def update_row_by_row(database: str, changes: list[tuple]) -> float:
+    """Return the rows/sec of one UPDATE per change, keyed by email."""
+    start = time.perf_counter()
+    with sqlite3.connect(database) as connection:
+        cursor = connection.cursor()
+        for email, age in changes:
+            cursor.execute("UPDATE Students SET age = ? WHERE email = ?;", (age, email))
+        connection.commit()
+    connection.close()
+    return len(changes) / (time.perf_counter() - start)
+
+
+def delete_row_by_row(database: str, ids: list[int]) -> float:
+    """Return the rows/sec of one DELETE per id."""
+    start = time.perf_counter()
+    with sqlite3.connect(database) as connection:
+        cursor = connection.cursor()
+        for student_id in ids:
+            cursor.execute("DELETE FROM Students WHERE id = ?;", (student_id,))
+        connection.commit()
+    connection.close()
+    return len(ids) / (time.perf_counter() - start)
+
+
+def write_csv(file_name: str, header: list[str], rows: list[tuple]):
+    with open(file_name, "w", newline="") as csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(header)
+        csv_writer.writerows(rows)
+
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    # Each change is to a different student.
+    changes = min(changes, students)
+
+    with tempfile.TemporaryDirectory() as directory:
+        original = os.path.join(directory, "students.db")
+        load_into_sqlite("students", students, original)
+        sample = random.Random(0).sample(range(1, students + 1), changes)
+        with sqlite3.connect(original) as connection:
+            emails = dict(connection.execute("SELECT id, email FROM Students;"))
+        connection.close()
+        updates = [(emails[student_id], 99) for student_id in sample]
+        updates_file = os.path.join(directory, "updates.csv")
+        write_csv(updates_file, ["email", "age"], updates)
+        deletes_file = os.path.join(directory, "deletes.csv")
+        write_csv(deletes_file, ["id"], [(student_id,) for student_id in sample])
+
+        def fresh_copy(indexed: bool) -> str:
+            database = os.path.join(directory, "copy.db")
+            shutil.copyfile(original, database)
+            if indexed:
+                with sqlite3.connect(database) as connection:
+                    create_student_indexes(connection)
+                connection.close()
+            return database
+
+        results = {}
+        results["update, row by row, no index"] = update_row_by_row(
+            fresh_copy(False), updates[:UNINDEXED_MAX_CHANGES]
+        )
+        results["update, row by row, indexed"] = update_row_by_row(
+            fresh_copy(True), updates
+        )
+        database = fresh_copy(True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = bulk_update_students(updates_file, database, key="email")
+        results["update, bulk"] = result.rows_per_second
+
+        results["delete, row by row"] = delete_row_by_row(fresh_copy(True), sample)
+        database = fresh_copy(True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = bulk_delete_students(deletes_file, database, key="id")
+        results["delete, bulk"] = result.rows_per_second
+
+    print(f"{students:,} students, {changes:,} changes")
+    print(f"{'mutation':<32} {'rows/sec':>12}")
+    for label, rows_per_second in results.items():
+        print(f"{label:<32} {rows_per_second:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Update or delete many students at once from a CSV file.
+
+update_record.py and delete_record.py change one student per statement. Here the
+rows of the file are staged in a temporary table, chunk by chunk, and each chunk
+is applied with a single set-based statement:
+
+    UPDATE Students SET ... FROM staged WHERE Students.<key> = staged.key;
+    DELETE FROM Students WHERE <key> IN (SELECT key FROM staged);
+
+Students are matched by id, name or email. Matching by name or email uses the
+indexes created by create_student_indexes; without them every chunk would scan
+the whole table.
+
+Usage:
+    python bulk_mutate_students.py update changes.csv --key email
+    python bulk_mutate_students.py delete leavers.csv --key id
+
+An update file has the key column and the columns to change, e.g.
+"email,age"; a delete file only needs the key column.
+"""
+
+import argparse
+import csv
+import sqlite3
+import time
+from itertools import islice
+from typing import NamedTuple
+
+KEYS = ("id", "name", "email")
+COLUMNS = ("name", "age", "email")
+
+
+class MutationResult(NamedTuple):
+    """Number of students changed by a bulk mutation, and how long it took."""
+
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+
+def create_student_indexes(connection: sqlite3.Connection):
+    """Index the name and email columns, which students are looked up by."""
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_students_name ON Students (name);"
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_students_email ON Students (email);"
+    )
+    connection.commit()
+
+
+def _complete_rows(chunk: list[list[str]], first_row: int, width: int) -> list:
+    """
+    Return the rows of chunk without its blank lines.
+
+    :raises ValueError: if a row does not have width columns, numbering the data
+        rows of the file from 0.
+    """
+    # Checking the widths with map(len) keeps the common case out of Python loops.
+    if set(map(len, chunk)) == {width}:
+        return chunk
+    for row_number, row in enumerate(chunk, start=first_row):
+        if row and len(row) != width:
+            raise ValueError(
+                f"Row {row_number} has {len(row)} columns, but the header has {width}."
+            )
+    return [row for row in chunk if row]
+
+
+def _read_chunks(file_name: str, key: str, chunk_size: int):
+    """
+    Yield the CSV header's value columns once, then lists of rows, without blank
+    lines.
+
+    :raises ValueError: if a row does not have as many columns as the header.
+    """
+    with open(file_name, "r", newline="") as csv_file:
+        csv_reader = csv.reader(csv_file)
+        header = [column.strip().lower() for column in next(csv_reader)]
+        if key not in header:
+            raise ValueError(f"The file has no '{key}' column.")
+        # Only the key is matched on; every other column is a value to set, so an
+        # id column with another key would rewrite primary keys.
+        unknown = [column for column in header if column not in COLUMNS + (key,)]
+        if unknown:
+            raise ValueError(f"Cannot set Students columns: {', '.join(unknown)}")
+
+        # Put the key first, followed by the columns to set.
+        order = [header.index(key)] + [
+            index for index, column in enumerate(header) if column != key
+        ]
+        yield [header[index] for index in order[1:]]
+        first_row = 0
+        while chunk := list(islice(csv_reader, chunk_size)):
+            rows = _complete_rows(chunk, first_row, len(header))
+            first_row += len(chunk)
+            # Empty cells become NULL, as in import_data_from_csv.py
+            yield [[row[index] or None for index in order] for row in rows]
+
+
+def bulk_update_students(
+    file_name: str,
+    database: str = "my_database.db",
+    key: str = "id",
+    chunk_size: int = 50_000,
+) -> MutationResult:
+    """
+    Update the students listed in a CSV file and return how many rows changed.
+
+    Each chunk of the file is one transaction. A key matching several students
+    (e.g. a shared name) updates all of them, as update_record.py does.
+
+    :raises ValueError: If key is not id, name or email, a column other than the
+        key is not name, age or email, or a row does not have as many columns as
+        the header. The chunks before that row stay committed.
+    """
+    if key not in KEYS:
+        raise ValueError(f"Key must be one of {', '.join(KEYS)}.")
+    start = time.perf_counter()
+    chunks = _read_chunks(file_name, key, chunk_size)
+    columns = next(chunks)
+    if not columns:
+        raise ValueError("The file has no columns to update.")
+
+    assignments = ", ".join(f"{column} = staged.{column}" for column in columns)
+    placeholders = ", ".join("?" * (len(columns) + 1))
+    updated = 0
+    with sqlite3.connect(database) as connection:
+        create_student_indexes(connection)
+        cursor = connection.cursor()
+        cursor.execute(f"CREATE TEMP TABLE staged_updates (key, {', '.join(columns)});")
+        for chunk in chunks:
+            cursor.executemany(
+                f"INSERT INTO staged_updates VALUES ({placeholders});", chunk
+            )
+            cursor.execute(
+                f"""
+                UPDATE Students SET {assignments}
+                FROM staged_updates AS staged
+                WHERE Students.{key} = staged.key;
+                """
+            )
+            updated += cursor.rowcount
+            cursor.execute("DELETE FROM staged_updates;")
+            connection.commit()
+            print(f"Updated {updated} students.")
+        cursor.execute("DROP TABLE staged_updates;")
+    connection.close()
+    return MutationResult(updated, time.perf_counter() - start)
+
+
+def bulk_delete_students(
+    file_name: str,
+    database: str = "my_database.db",
+    key: str = "id",
+    chunk_size: int = 50_000,
+) -> MutationResult:
+    """
+    Delete the students listed in a CSV file and return how many were deleted.
+    Each chunk of the file is one transaction.
+
+    :raises ValueError: If key is not id, name or email, a column other than the
+        key is not name, age or email, or a row does not have as many columns as
+        the header. The chunks before that row stay committed.
+    """
+    if key not in KEYS:
+        raise ValueError(f"Key must be one of {', '.join(KEYS)}.")
+    start = time.perf_counter()
+    chunks = _read_chunks(file_name, key, chunk_size)
+    next(chunks)  # Other columns are ignored
+
+    deleted = 0
+    with sqlite3.connect(database) as connection:
+        create_student_indexes(connection)
+        cursor = connection.cursor()
+        cursor.execute("CREATE TEMP TABLE staged_keys (key PRIMARY KEY);")
+        for chunk in chunks:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO staged_keys VALUES (?);",
+                ((row[0],) for row in chunk),
+            )
+            cursor.execute(
+                f"DELETE FROM Students WHERE {key} IN (SELECT key FROM staged_keys);"
+            )
+            deleted += cursor.rowcount
+            cursor.execute("DELETE FROM staged_keys;")
+            connection.commit()
+            print(f"Deleted {deleted} students.")
+        cursor.execute("DROP TABLE staged_keys;")
+    connection.close()
+    return MutationResult(deleted, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Update or delete many students from a CSV file."
+    )
+    parser.add_argument("action", choices=("update", "delete"))
+    parser.add_argument("file_name")
+    parser.add_argument("--database", default="my_database.db")
+    parser.add_argument("--key", choices=KEYS, default="id")
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    mutate = bulk_update_students if args.action == "update" else bulk_delete_students
+    result = mutate(args.file_name, args.database, args.key, args.chunk_size)
+    print(f"Done in {result.seconds:.2f} s ({result.rows_per_second:.0f} rows/sec).")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,11 @@ with sqlite3.connect("my_database.db") as connection:
     # Execute the SQL command
     cursor.execute(create_table_query)
 
+    # Index the columns students are looked up by, so that updates and deletes
+    # by name or email don't scan the whole table
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_students_name ON Students (name);")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_students_email ON Students (email);")
+
     # Commit the changes
     connection.commit()
 
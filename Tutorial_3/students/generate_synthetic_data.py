@@ -0,0 +1,256 @@
+"""
+Generate large volumes of synthetic Students or employees rows for load testing.
+
+Faker makes realistic values but takes microseconds per value, which is hours for
+10^8 rows. Instead, Faker builds a vocabulary of first names, last names and email
+domains once, up front, and rows are drawn from it one column at a time with
+random.choices. Rows are generated in fixed-size shards, each with its own seed
+derived from the run's seed, so the output is the same whatever the number of
+worker processes. The rows are loaded straight into SQLite with executemany, or
+written to a CSV file in the format import_data_from_csv.py (Students) or
+``cli.py import`` (employees) reads.
+
+Usage:
+    python generate_synthetic_data.py students 1000000 --database my_database.db
+    python generate_synthetic_data.py employees 10000000 --csv employees.csv --workers 4
+"""
+
+import argparse
+import csv
+import datetime
+import functools
+import gzip
+import random
+import sqlite3
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from faker import Faker
+
+# Rows per shard. Each shard is generated by one task, with its own seed.
+SHARD_SIZE = 100_000
+
+DEPARTMENTS = [
+    "Engineering",
+    "Finance",
+    "HR",
+    "IT",
+    "Legal",
+    "Marketing",
+    "Operations",
+    "Research",
+    "Sales",
+    "Support",
+]
+
+TABLES = {
+    "students": {
+        "create": """
+            CREATE TABLE IF NOT EXISTS Students (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                age INTEGER,
+                email TEXT
+            );
+        """,
+        "insert": "INSERT INTO Students (name, age, email) VALUES (?, ?, ?);",
+        "header": ["Name", "Age", "Email"],
+    },
+    # The same table as the employee management system's first migration, so
+    # its create_table() can add the indexes and summaries later.
+    "employees": {
+        "create": """
+            CREATE TABLE IF NOT EXISTS employees (
+                employee_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                department TEXT NOT NULL,
+                salary REAL NOT NULL,
+                hire_date TEXT NOT NULL
+            );
+        """,
+        "insert": """
+            INSERT INTO employees (name, department, salary, hire_date)
+            VALUES (?, ?, ?, ?);
+        """,
+        "header": ["name", "department", "salary", "hire_date"],
+    },
+}
+
+
+class Vocabulary(NamedTuple):
+    """The values rows are drawn from."""
+
+    first_names: list[str]
+    last_names: list[str]
+    email_domains: list[str]
+    hire_dates: list[str]
+
+
+class GenerationResult(NamedTuple):
+    """Number of rows generated and loaded, and how long it took."""
+
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+
+@functools.lru_cache
+def build_vocabulary(locale: str = "en_US", size: int = 1000, seed: int = 0):
+    """
+    Build a vocabulary with Faker, once per process and set of arguments.
+
+    Each list holds up to size distinct values, sorted so that the vocabulary
+    only depends on the arguments and the Faker version.
+    """
+    fake = Faker(locale)
+    fake.seed_instance(seed)
+    first_date = datetime.date(2000, 1, 1)
+    return Vocabulary(
+        first_names=sorted({fake.first_name() for _ in range(size)}),
+        last_names=sorted({fake.last_name() for _ in range(size)}),
+        email_domains=sorted({fake.free_email_domain() for _ in range(size // 10)}),
+        hire_dates=[
+            (first_date + datetime.timedelta(days=day)).isoformat()
+            for day in range(25 * 365)
+        ],
+    )
+
+
+def generate_shard(
+    table: str, vocabulary: Vocabulary, shard: int, rows: int, seed: int
+) -> list[tuple]:
+    """
+    Generate the rows of one shard. Row numbers start at shard * SHARD_SIZE and
+    appear in the email addresses, which keeps them unique.
+    """
+    rng = random.Random(f"{seed}-{shard}")
+    first_names = rng.choices(vocabulary.first_names, k=rows)
+    last_names = rng.choices(vocabulary.last_names, k=rows)
+    names = [f"{first} {last}" for first, last in zip(first_names, last_names)]
+
+    if table == "students":
+        ages = rng.choices(range(18, 26), k=rows)
+        domains = rng.choices(vocabulary.email_domains, k=rows)
+        start = shard * SHARD_SIZE
+        emails = [
+            f"{first}.{last}{start + i}@{domain}".lower()
+            for i, (first, last, domain) in enumerate(
+                zip(first_names, last_names, domains)
+            )
+        ]
+        return list(zip(names, ages, emails))
+
+    departments = rng.choices(DEPARTMENTS, k=rows)
+    salaries = [
+        float(salary) for salary in rng.choices(range(30_000, 150_001, 500), k=rows)
+    ]
+    hire_dates = rng.choices(vocabulary.hire_dates, k=rows)
+    return list(zip(names, departments, salaries, hire_dates))
+
+
+def _shards(rows: int) -> Iterator[tuple[int, int]]:
+    """Yield (shard, rows in shard) covering rows in total."""
+    for shard, start in enumerate(range(0, rows, SHARD_SIZE)):
+        yield shard, min(SHARD_SIZE, rows - start)
+
+
+def generate_rows(
+    table: str, rows: int, seed: int = 0, workers: int = 1, locale: str = "en_US"
+) -> Iterator[list[tuple]]:
+    """
+    Yield the rows of every shard in order, as lists of up to SHARD_SIZE rows.
+
+    With several workers, at most two shards per worker are in flight, so memory
+    stays bounded however many rows are generated.
+    """
+    if table not in TABLES:
+        raise ValueError(f"Table must be one of {', '.join(TABLES)}.")
+    vocabulary = build_vocabulary(locale, seed=seed)
+
+    if workers <= 1:
+        for shard, shard_rows in _shards(rows):
+            yield generate_shard(table, vocabulary, shard, shard_rows, seed)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for shard, shard_rows in _shards(rows):
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(
+                executor.submit(
+                    generate_shard, table, vocabulary, shard, shard_rows, seed
+                )
+            )
+        while pending:
+            yield pending.popleft().result()
+
+
+def load_into_sqlite(
+    table: str, rows: int, database: str, seed: int = 0, workers: int = 1
+) -> GenerationResult:
+    """Generate rows and insert them into a SQLite database, one shard per commit."""
+    start = time.perf_counter()
+    generated = 0
+    with sqlite3.connect(database) as connection:
+        connection.execute(TABLES[table]["create"])
+        for batch in generate_rows(table, rows, seed, workers):
+            connection.executemany(TABLES[table]["insert"], batch)
+            connection.commit()
+            generated += len(batch)
+    connection.close()
+    return GenerationResult(generated, time.perf_counter() - start)
+
+
+def write_csv(
+    table: str, rows: int, file_name: str, seed: int = 0, workers: int = 1
+) -> GenerationResult:
+    """Generate rows into a CSV file, compressed with gzip if it ends in .gz."""
+    start = time.perf_counter()
+    generated = 0
+    if file_name.endswith(".gz"):
+        csv_file = gzip.open(file_name, "wt", newline="", compresslevel=6)
+    else:
+        csv_file = open(file_name, "w", newline="")
+    with csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(TABLES[table]["header"])
+        for batch in generate_rows(table, rows, seed, workers):
+            csv_writer.writerows(batch)
+            generated += len(batch)
+    return GenerationResult(generated, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic Students or employees rows."
+    )
+    parser.add_argument("table", choices=TABLES)
+    parser.add_argument("rows", type=int)
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--database", help="SQLite database to load the rows into")
+    output.add_argument("--csv", help="CSV file to write (add .gz to compress)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.database:
+        result = load_into_sqlite(
+            args.table, args.rows, args.database, args.seed, args.workers
+        )
+    else:
+        result = write_csv(args.table, args.rows, args.csv, args.seed, args.workers)
+    print(
+        f"Generated {result.rows} {args.table} rows in {result.seconds:.2f} s "
+        f"({result.rows_per_second:.0f} rows/sec)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,221 @@
+import argparse
 import csv
 import sqlite3
+import time
+from itertools import islice
+from typing import NamedTuple
 
+INSERT_QUERY = "INSERT INTO Students (name, age, email) VALUES (?, ?, ?);"
 
-def import_from_csv(file_name):
-    """Import data from a CSV file into the Students table."""
-    with sqlite3.connect("my_database.db") as connection:
+
+class ImportResult(NamedTuple):
+    """How many rows were imported, where to resume, and how long it took."""
+
+    rows: int
+    next_row: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+
+def _students(chunk: list[list[str]], first_row: int, width: int) -> list[tuple]:
+    """
+    Return the rows of chunk, without its blank lines, as (name, age, email)
+    tuples to insert, with the ages converted to int; an empty age becomes NULL.
+
+    :raises ValueError: if a row does not have width columns or its age is not a
+        whole number, naming it the way start_row counts data rows.
+    """
+    # The common case, with no blank lines, no ragged rows and every age filled
+    # in, converts the age column in one map(int) call, out of Python loops.
+    if set(map(len, chunk)) == {width}:
+        names, ages, emails = zip(*chunk)
+        try:
+            return list(zip(names, map(int, ages), emails))
+        except ValueError:
+            pass
+
+    students = []
+    for row_number, row in enumerate(chunk, start=first_row):
+        if not row:
+            continue
+        if len(row) != width:
+            raise ValueError(
+                f"Row {row_number} has {len(row)} columns, but the header has "
+                f"{width}. Resume with start_row={first_row} once it is fixed."
+            )
+        name, age, email = row
+        try:
+            students.append((name, int(age) if age else None, email))
+        except ValueError:
+            raise ValueError(
+                f"Row {row_number} has an age of {age!r}, which is not a whole "
+                f"number. Resume with start_row={first_row} once it is fixed."
+            ) from None
+    return students
+
+
+# Where the SQL of the indexes dropped for a load is kept until they are built
+# again, so that an import killed part way leaves them for the next one to build.
+DROPPED_INDEXES_TABLE = "import_dropped_indexes"
+
+
+def _drop_indexes(cursor: sqlite3.Cursor) -> list[str]:
+    """
+    Drop the indexes on the Students table, recording them in
+    DROPPED_INDEXES_TABLE, and return the SQL of every index waiting to be built
+    again, including any left by an import that never finished.
+    """
+    cursor.execute(
+        f"CREATE TABLE IF NOT EXISTS {DROPPED_INDEXES_TABLE} (sql TEXT NOT NULL);"
+    )
+    cursor.execute(
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = 'Students' AND sql IS NOT NULL;"
+    )
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX "{name}";')
+    cursor.executemany(
+        f"INSERT INTO {DROPPED_INDEXES_TABLE} (sql) VALUES (?);",
+        [(sql,) for _, sql in indexes],
+    )
+    return [
+        sql for (sql,) in cursor.execute(f"SELECT sql FROM {DROPPED_INDEXES_TABLE};")
+    ]
+
+
+def _rebuild_indexes(cursor: sqlite3.Cursor):
+    """Create the indexes recorded by _drop_indexes again, if there are any."""
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?;",
+        (DROPPED_INDEXES_TABLE,),
+    )
+    if cursor.fetchone() is None:
+        return
+    for (sql,) in cursor.execute(
+        f"SELECT sql FROM {DROPPED_INDEXES_TABLE};"
+    ).fetchall():
+        cursor.execute(sql)
+    cursor.execute(f"DROP TABLE {DROPPED_INDEXES_TABLE};")
+
+
+def import_from_csv(
+    file_name: str,
+    database: str = "my_database.db",
+    chunk_size: int = 100_000,
+    start_row: int = 0,
+    rebuild_indexes: bool = False,
+) -> ImportResult:
+    """
+    Import data from a CSV file into the Students table.
+
+    The CSV file (with a Name,Age,Email header) is streamed in chunks of
+    chunk_size rows, each inserted with one executemany call and committed, so the
+    file is never held in memory. Larger chunks mean fewer commits, each of which
+    flushes SQLite's page cache. If an import stops part way, pass the next_row
+    printed for the last committed chunk as start_row to carry on from there.
+    Blank lines are skipped, but still count as rows for start_row and next_row.
+
+    With rebuild_indexes=True, the indexes on Students are dropped before the load
+    and created again after it, which is faster than updating them row by row.
+    They are dropped in the same transaction as the first chunk, and built again
+    if the import fails; if it is killed instead, the next import with
+    rebuild_indexes=True builds them.
+
+    :raises ValueError: if a row does not have as many columns as the header, or
+        its age is not a whole number. The chunks before it stay committed, and
+        the message gives the start_row to resume from.
+    """
+    with sqlite3.connect(database) as connection:
         cursor = connection.cursor()
 
-        # Open the CSV file for reading
-        with open(file_name, "r") as csv_file:
-            csv_reader = csv.reader(csv_file)
-            next(csv_reader)  # Skip the header row
+        if rebuild_indexes:
+            # sqlite3 runs DDL outside a transaction unless one is open, which
+            # would commit the dropped indexes before anything is imported.
+            cursor.execute("BEGIN;")
+            _drop_indexes(cursor)
+        start = time.perf_counter()
+        rows = 0
+        next_row = start_row
+
+        try:
+            # Open the CSV file for reading
+            with open(file_name, "r", newline="") as csv_file:
+                csv_reader = csv.reader(csv_file)
+                width = len(next(csv_reader))  # Skip the header row
+
+                # Skip the rows imported by an earlier run
+                csv_reader = islice(csv_reader, start_row, None)
+
+                while chunk := list(islice(csv_reader, chunk_size)):
+                    students = _students(chunk, next_row, width)
+                    if students:
+                        cursor.executemany(INSERT_QUERY, students)
+                        connection.commit()
+
+                    rows += len(students)
+                    next_row += len(chunk)
+                    print(f"Imported {rows} rows (next_row={next_row}).")
+        except BaseException:
+            # Roll back the chunk that failed, build the indexes again if they
+            # were dropped, and let the original error through either way.
+            connection.rollback()
+            if rebuild_indexes:
+                try:
+                    cursor.execute("BEGIN;")
+                    _rebuild_indexes(cursor)
+                    connection.commit()
+                except sqlite3.Error as e:
+                    connection.rollback()
+                    print(
+                        f"Could not rebuild the indexes ({e}); the next import "
+                        "with rebuild_indexes=True builds them."
+                    )
+            raise
+        else:
+            if rebuild_indexes:
+                if not connection.in_transaction:
+                    cursor.execute("BEGIN;")
+                _rebuild_indexes(cursor)
+                connection.commit()
+
+        result = ImportResult(rows, next_row, time.perf_counter() - start)
+        print(
+            f"Data imported successfully from {file_name} "
+            f"({result.rows_per_second:.0f} rows/sec)."
+        )
+        return result
+
 
-            # Insert each row into the Students table
-            for row in csv_reader:
-                cursor.execute(
-                    "INSERT INTO Students (name, age, email) VALUES (?, ?, ?);",
-                    (row[0], row[1], row[2]),
-                )
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import a CSV file into the Students table."
+    )
+    parser.add_argument("file_name", nargs="?", default="student_data.csv")
+    parser.add_argument("--database", default="my_database.db")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument(
+        "--start-row", type=int, default=0, help="the first data row to import"
+    )
+    parser.add_argument(
+        "--rebuild-indexes",
+        action="store_true",
+        help="drop the indexes during the load and build them afterwards",
+    )
+    args = parser.parse_args()
 
-        connection.commit()
-        print(f"Data imported successfully from {file_name}.")
+    import_from_csv(
+        args.file_name,
+        database=args.database,
+        chunk_size=args.chunk_size,
+        start_row=args.start_row,
+        rebuild_indexes=args.rebuild_indexes,
+    )
 
 
 # Example usage
-import_from_csv("student_data.csv")
+if __name__ == "__main__":
+    main()
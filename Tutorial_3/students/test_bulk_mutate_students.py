@@ -0,0 +1,123 @@
+import sqlite3
+
+import pytest
+from bulk_mutate_students import bulk_delete_students, bulk_update_students
+
+STUDENTS = [
+    ("Alice", 20, "alice@example.com"),
+    ("Bob", 21, "bob@example.com"),
+    ("Carol", 22, "carol@example.com"),
+    ("Bob", 23, "bob2@example.com"),
+]
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = str(tmp_path / "students.db")
+    with sqlite3.connect(database) as connection:
+        connection.execute(
+            """
+            CREATE TABLE Students (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                age INTEGER,
+                email TEXT
+            );
+            """
+        )
+        connection.executemany(
+            "INSERT INTO Students (name, age, email) VALUES (?, ?, ?);", STUDENTS
+        )
+    connection.close()
+    return database
+
+
+def write_csv(path, text: str) -> str:
+    path.write_text(text)
+    return str(path)
+
+
+def read_students(database: str) -> list[tuple]:
+    with sqlite3.connect(database) as connection:
+        students = connection.execute("SELECT * FROM Students ORDER BY id;").fetchall()
+    connection.close()
+    return students
+
+
+@pytest.mark.parametrize(
+    "key, text",
+    [
+        ("id", "id,age\n1,30\n3,32\n99,40\n"),
+        ("name", "age,name\n30,Alice\n32,Carol\n40,Nobody\n"),
+        ("email", "email,age\nalice@example.com,30\ncarol@example.com,32\n"),
+    ],
+)
+def test_bulk_update_by_key(database, tmp_path, key, text):
+    """
+    Test that an update matches students by each supported key, across chunks,
+    and ignores keys that match nobody.
+    """
+    file_name = write_csv(tmp_path / "changes.csv", text)
+    result = bulk_update_students(file_name, database, key=key, chunk_size=1)
+    assert result.rows == 2
+    assert [student[2] for student in read_students(database)] == [30, 21, 32, 23]
+
+
+def test_bulk_update_sets_several_columns_and_nulls(database, tmp_path):
+    """
+    Test that every value column is set, an empty cell becomes NULL, and a
+    shared name updates every student with it.
+    """
+    file_name = write_csv(tmp_path / "changes.csv", "name,age,email\nBob,,\n")
+    assert bulk_update_students(file_name, database, key="name").rows == 2
+    assert read_students(database)[1] == (2, "Bob", None, None)
+    assert read_students(database)[3] == (4, "Bob", None, None)
+
+
+def test_bulk_update_rejects_id_as_a_value(database, tmp_path):
+    """
+    Test that an id column is only accepted as the key, so ids are never set.
+    """
+    file_name = write_csv(tmp_path / "changes.csv", "email,id\nalice@example.com,9\n")
+    with pytest.raises(ValueError, match="Cannot set Students columns: id"):
+        bulk_update_students(file_name, database, key="email")
+    assert read_students(database)[0][0] == 1
+
+
+@pytest.mark.parametrize(
+    "key, text",
+    [
+        ("id", "id\n2\n4\n99\n"),
+        ("name", "name\nBob\nNobody\n"),
+        ("email", "email\nbob@example.com\nbob2@example.com\nbob@example.com\n"),
+    ],
+)
+def test_bulk_delete_by_key(database, tmp_path, key, text):
+    """
+    Test that a delete matches students by each supported key, across chunks,
+    including keys repeated in the file.
+    """
+    file_name = write_csv(tmp_path / "leavers.csv", text)
+    result = bulk_delete_students(file_name, database, key=key, chunk_size=2)
+    assert result.rows == 2
+    assert [student[1] for student in read_students(database)] == ["Alice", "Carol"]
+
+
+@pytest.mark.parametrize(
+    "mutate, text, expected",
+    [
+        (bulk_update_students, "id,age\n1,30\n\n3\n", [30, 21, 22, 23]),
+        (bulk_delete_students, "id,name\n2,Bob\n\n4\n", [20, 22, 23]),
+    ],
+)
+def test_bulk_mutation_skips_blank_and_rejects_short_rows(
+    database, tmp_path, mutate, text, expected
+):
+    """
+    Test that blank lines are skipped and a short row raises a ValueError naming
+    it, after the chunks before it were committed.
+    """
+    file_name = write_csv(tmp_path / "changes.csv", text)
+    with pytest.raises(ValueError, match="Row 2 has 1 columns, but the header has 2"):
+        mutate(file_name, database, key="id", chunk_size=2)
+    assert [student[2] for student in read_students(database)] == expected
@@ -0,0 +1,124 @@
+import csv
+import gzip
+import os
+import sqlite3
+import sys
+
+import pytest
+from export_data_to_csv import export_to_csv, main
+
+STUDENTS = [(f"Student {i}", 18 + i % 8, f"student{i}@example.com") for i in range(25)]
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = str(tmp_path / "students.db")
+    with sqlite3.connect(database) as connection:
+        connection.execute(
+            """
+            CREATE TABLE Students (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                age INTEGER,
+                email TEXT
+            );
+            """
+        )
+        connection.executemany(
+            "INSERT INTO Students (name, age, email) VALUES (?, ?, ?);", STUDENTS
+        )
+    connection.close()
+    return database
+
+
+def read_csv(file_name: str) -> list[list[str]]:
+    opener = gzip.open if file_name.endswith(".gz") else open
+    with opener(file_name, "rt", newline="") as csv_file:
+        return list(csv.reader(csv_file))
+
+
+def test_export_all_columns_in_batches(database, tmp_path):
+    """
+    Test that every row and column is exported in id order, whatever the batch
+    size.
+    """
+    file_name = str(tmp_path / "students.csv")
+    result = export_to_csv(file_name, database, batch_size=4)
+    rows = read_csv(file_name)
+    assert result.rows == 25
+    assert rows[0] == ["ID", "Name", "Age", "Email"]
+    assert rows[1] == ["1", "Student 0", "18", "student0@example.com"]
+    assert len(rows) == 26
+
+
+def test_export_gzip(database, tmp_path):
+    """
+    Test that a .gz file name writes a gzip-compressed file with the same rows.
+    """
+    plain, compressed = str(tmp_path / "plain.csv"), str(tmp_path / "students.csv.gz")
+    export_to_csv(plain, database)
+    export_to_csv(compressed, database)
+    with open(compressed, "rb") as gzip_file:
+        assert gzip_file.read(2) == b"\x1f\x8b"
+    assert read_csv(compressed) == read_csv(plain)
+
+
+def test_export_columns_and_where(database, tmp_path):
+    """
+    Test that only the chosen columns of the rows matching the condition are
+    exported, and that an unknown column raises a ValueError.
+    """
+    file_name = str(tmp_path / "students.csv")
+    result = export_to_csv(
+        file_name,
+        database,
+        columns=["email", "age"],
+        where="age >= ?",
+        parameters=(24,),
+    )
+    rows = read_csv(file_name)
+    assert rows[0] == ["Email", "Age"]
+    assert result.rows == len(rows) - 1 == 6
+    assert all(int(age) >= 24 for _, age in rows[1:])
+
+    with pytest.raises(ValueError):
+        export_to_csv(file_name, database, columns=["email", "password"])
+
+
+def test_export_parts(database, tmp_path):
+    """
+    Test that a parted export splits the selected rows into disjoint part files
+    which together hold the same rows as a single export.
+    """
+    single = str(tmp_path / "single.csv")
+    export_to_csv(single, database, where="age != 20")
+    result = export_to_csv(
+        str(tmp_path / "students.csv"), database, where="age != 20", parts=3
+    )
+
+    assert [os.path.basename(name) for name in result.files] == [
+        "students.part0.csv",
+        "students.part1.csv",
+        "students.part2.csv",
+    ]
+    parts = [read_csv(name) for name in result.files]
+    assert all(part[0] == ["ID", "Name", "Age", "Email"] for part in parts)
+    assert [row for part in parts for row in part[1:]] == read_csv(single)[1:]
+    assert result.rows == len(read_csv(single)) - 1
+
+
+def test_main_where(database, tmp_path, monkeypatch):
+    """
+    Test the command line with gzip, --columns and a literal --where condition.
+    """
+    file_name = str(tmp_path / "students.csv.gz")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["export_data_to_csv.py", file_name, "--database", database]
+        + ["--columns", "name", "--where", "age = 18"],
+    )
+    main()
+    assert read_csv(file_name) == [["Name"]] + [
+        [name] for name, age, _ in STUDENTS if age == 18
+    ]
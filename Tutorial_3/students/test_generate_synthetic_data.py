@@ -0,0 +1,67 @@
+import csv
+import sqlite3
+
+import pytest
+from generate_synthetic_data import (
+    SHARD_SIZE,
+    generate_rows,
+    load_into_sqlite,
+    write_csv,
+)
+
+# Enough rows for three shards, the last one partial.
+ROWS = 2 * SHARD_SIZE + 123
+
+
+@pytest.mark.parametrize("table", ["students", "employees"])
+def test_same_rows_for_any_number_of_workers(table):
+    """
+    Test that a seed gives the same rows in the same order with 1 or 3 workers,
+    and that another seed gives different rows.
+    """
+    one_worker = [row for shard in generate_rows(table, ROWS, seed=7) for row in shard]
+    three_workers = [
+        row for shard in generate_rows(table, ROWS, seed=7, workers=3) for row in shard
+    ]
+    assert len(one_worker) == ROWS
+    assert one_worker == three_workers
+    assert next(generate_rows(table, 10, seed=8)) != one_worker[:10]
+
+
+def test_student_emails_are_unique():
+    """
+    Test that row numbers keep student emails unique across shards.
+    """
+    emails = [row[2] for shard in generate_rows("students", ROWS) for row in shard]
+    assert len(set(emails)) == ROWS
+
+
+def test_load_into_sqlite_and_write_csv(tmp_path):
+    """
+    Test that the rows loaded into SQLite and written to CSV are the generated
+    ones, whatever the number of workers.
+    """
+    database = str(tmp_path / "students.db")
+    file_name = str(tmp_path / "students.csv")
+    assert load_into_sqlite("students", 1000, database, seed=3).rows == 1000
+    assert write_csv("students", 1000, file_name, seed=3, workers=2).rows == 1000
+
+    with sqlite3.connect(database) as connection:
+        loaded = connection.execute(
+            "SELECT name, age, email FROM Students ORDER BY id;"
+        ).fetchall()
+    connection.close()
+    with open(file_name, newline="") as csv_file:
+        written = list(csv.reader(csv_file))
+
+    assert written[0] == ["Name", "Age", "Email"]
+    assert [(name, int(age), email) for name, age, email in written[1:]] == loaded
+    assert loaded == next(generate_rows("students", 1000, seed=3))
+
+
+def test_unknown_table():
+    """
+    Test that a table other than students or employees raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        next(generate_rows("teachers", 10))
@@ -0,0 +1,183 @@
+import sqlite3
+
+import import_data_from_csv
+import pytest
+from import_data_from_csv import import_from_csv
+
+STUDENTS = [
+    ("Alice", "20", "alice@example.com"),
+    ("Bob", "", "bob@example.com"),
+    ("Carol", "22", "carol@example.com"),
+    ("Dave", "23", "dave@example.com"),
+    ("Erin", "24", "erin@example.com"),
+]
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = str(tmp_path / "students.db")
+    with sqlite3.connect(database) as connection:
+        connection.execute(
+            """
+            CREATE TABLE Students (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                age INTEGER,
+                email TEXT
+            );
+            """
+        )
+        connection.execute("CREATE INDEX idx_students_name ON Students (name);")
+        connection.execute("CREATE INDEX idx_students_email ON Students (email);")
+    connection.close()
+    return database
+
+
+def write_csv(path, lines: list[str]) -> str:
+    path.write_text("Name,Age,Email\n" + "".join(line + "\n" for line in lines))
+    return str(path)
+
+
+def read_students(database: str) -> list[tuple]:
+    with sqlite3.connect(database) as connection:
+        students = connection.execute(
+            "SELECT name, age, email FROM Students ORDER BY id;"
+        ).fetchall()
+    connection.close()
+    return students
+
+
+def index_names(cursor: sqlite3.Cursor) -> list[str]:
+    return [
+        row[0]
+        for row in cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' ORDER BY name;"
+        )
+    ]
+
+
+def test_import_in_chunks(database, tmp_path):
+    """
+    Test that every row is imported across several chunks, with an empty age
+    stored as NULL.
+    """
+    file_name = write_csv(tmp_path / "students.csv", [",".join(s) for s in STUDENTS])
+    result = import_from_csv(file_name, database, chunk_size=2)
+    assert (result.rows, result.next_row) == (5, 5)
+    assert read_students(database)[:2] == [
+        ("Alice", 20, "alice@example.com"),
+        ("Bob", None, "bob@example.com"),
+    ]
+
+
+def test_import_resumes_from_start_row(database, tmp_path):
+    """
+    Test that an import given the next_row of an earlier one carries on from
+    there, and that blank lines are skipped but still counted.
+    """
+    lines = [",".join(s) for s in STUDENTS]
+    file_name = write_csv(tmp_path / "students.csv", lines[:3] + [""] + lines[3:])
+
+    result = import_from_csv(file_name, database, chunk_size=2, start_row=2)
+    assert (result.rows, result.next_row) == (3, 6)
+    assert [student[0] for student in read_students(database)] == [
+        "Carol",
+        "Dave",
+        "Erin",
+    ]
+
+
+def test_import_rejects_ragged_rows(database, tmp_path):
+    """
+    Test that a row without as many columns as the header raises a ValueError
+    naming it, after the chunks before it were committed.
+    """
+    lines = [",".join(s) for s in STUDENTS[:2]] + ["Carol,22"]
+    file_name = write_csv(tmp_path / "students.csv", lines)
+    with pytest.raises(ValueError, match="Row 2 has 2 columns"):
+        import_from_csv(file_name, database, chunk_size=2)
+    assert len(read_students(database)) == 2
+
+
+def test_import_rejects_bad_ages(database, tmp_path):
+    """
+    Test that an age which is not a whole number raises a ValueError naming its
+    row and the start_row to resume from, after the chunks before it were
+    committed, and that resuming from there once it is fixed finishes the import.
+    """
+    lines = [",".join(s) for s in STUDENTS]
+    lines[3] = "Dave,twenty-three,dave@example.com"
+    file_name = write_csv(tmp_path / "students.csv", lines[:2] + [""] + lines[2:])
+    with pytest.raises(ValueError, match="Row 4 has an age of 'twenty-three'.*=4"):
+        import_from_csv(file_name, database, chunk_size=2)
+    assert len(read_students(database)) == 3
+
+    lines[3] = "Dave,23,dave@example.com"
+    file_name = write_csv(tmp_path / "students.csv", lines[:2] + [""] + lines[2:])
+    result = import_from_csv(file_name, database, chunk_size=2, start_row=4)
+    assert (result.rows, result.next_row) == (2, 6)
+    assert read_students(database) == [
+        (name, int(age) if age else None, email) for name, age, email in STUDENTS
+    ]
+
+
+def test_import_rebuilds_indexes(database, tmp_path, monkeypatch):
+    """
+    Test that rebuild_indexes drops the indexes for the load and creates them
+    again afterwards, even when the import fails part way.
+    """
+    indexes_during_load = []
+    drop_indexes = import_data_from_csv._drop_indexes
+
+    def record_drop_indexes(cursor):
+        index_sql = drop_indexes(cursor)
+        indexes_during_load.append(index_names(cursor))
+        return index_sql
+
+    monkeypatch.setattr(import_data_from_csv, "_drop_indexes", record_drop_indexes)
+    good = write_csv(tmp_path / "good.csv", [",".join(s) for s in STUDENTS])
+    bad = write_csv(tmp_path / "bad.csv", ["Frank,25"])
+
+    import_from_csv(good, database, rebuild_indexes=True)
+    with pytest.raises(ValueError):
+        import_from_csv(bad, database, rebuild_indexes=True)
+
+    assert indexes_during_load == [[], []]
+    with sqlite3.connect(database) as connection:
+        assert index_names(connection.cursor()) == [
+            "idx_students_email",
+            "idx_students_name",
+        ]
+    connection.close()
+    assert len(read_students(database)) == 5
+
+
+def test_failed_rebuild_keeps_error(database, tmp_path, monkeypatch):
+    """
+    Test that an import whose indexes cannot be rebuilt after it fails raises its
+    own error, and that the next import with rebuild_indexes builds them.
+    """
+    rebuild_indexes = import_data_from_csv._rebuild_indexes
+
+    def fail_rebuild(cursor):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    lines = [",".join(s) for s in STUDENTS]
+    bad = write_csv(tmp_path / "bad.csv", lines[:2] + ["Carol,22"])
+    monkeypatch.setattr(import_data_from_csv, "_rebuild_indexes", fail_rebuild)
+    with pytest.raises(ValueError, match="Row 2 has 2 columns"):
+        import_from_csv(bad, database, chunk_size=2, rebuild_indexes=True)
+    with sqlite3.connect(database) as connection:
+        assert index_names(connection.cursor()) == []
+    connection.close()
+
+    monkeypatch.setattr(import_data_from_csv, "_rebuild_indexes", rebuild_indexes)
+    good = write_csv(tmp_path / "good.csv", lines[2:])
+    import_from_csv(good, database, rebuild_indexes=True)
+    with sqlite3.connect(database) as connection:
+        assert index_names(connection.cursor()) == [
+            "idx_students_email",
+            "idx_students_name",
+        ]
+    connection.close()
+    assert len(read_students(database)) == 5
@@ -0,0 +1,103 @@
+"""
+Async versions of the hero endpoints, used when HERO_DB_MODE is "async".
+
+They take an AsyncSession on the aiosqlite engine, so a request waiting for
+SQLite yields the event loop to other requests instead of holding one of the
+threadpool's workers. The paths and responses are the same as those of the
+sync endpoints in main.py.
+"""
+
+from typing import Annotated, Literal
+
+from db import AsyncSessionDep
+from fastapi import APIRouter, HTTPException, Query
+from models import Hero, HeroCreate, HeroPage, HeroPublic, HeroUpdate
+from route_helpers import decode_cursor, encode_cursor, search_query
+from sqlmodel import select
+from starlette import status
+
+router = APIRouter()
+
+
+@router.post("/heroes/", response_model=HeroPublic, status_code=status.HTTP_201_CREATED)
+async def create_hero(hero: HeroCreate, session: AsyncSessionDep):
+    db_hero = Hero.model_validate(hero)
+    session.add(db_hero)
+    await session.commit()
+    await session.refresh(db_hero)
+    return db_hero
+
+
+@router.get("/heroes/", response_model=list[HeroPublic], status_code=status.HTTP_200_OK)
+async def read_heroes(
+    session: AsyncSessionDep,
+    offset: int = 0,
+    limit: Annotated[int, Query(le=100)] = 100,
+):
+    heroes = await session.exec(select(Hero).offset(offset).limit(limit))
+    return heroes.all()
+
+
+@router.get("/heroes/page", response_model=HeroPage, status_code=status.HTTP_200_OK)
+async def read_heroes_page(
+    session: AsyncSessionDep,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 100,
+):
+    query = select(Hero).order_by(Hero.id).limit(limit + 1)
+    if cursor is not None:
+        query = query.where(Hero.id > decode_cursor(cursor))
+    heroes = (await session.exec(query)).all()
+    next_cursor = encode_cursor(heroes[limit - 1].id) if len(heroes) > limit else None
+    return {"items": heroes[:limit], "next_cursor": next_cursor}
+
+
+@router.get("/heroes/search", response_model=HeroPage, status_code=status.HTTP_200_OK)
+async def search_heroes(
+    session: AsyncSessionDep,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    prefix: bool = True,  # Match words starting with the last word of q
+    order: Literal["rank", "id"] = "rank",
+    cursor: str | None = None,  # The next_cursor of the previous page, if any
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+):
+    offset = decode_cursor(cursor, "offset") if cursor is not None else 0
+    query = search_query(Hero, q, prefix, order, offset, limit)
+    heroes = (await session.exec(query)).all()
+    next_cursor = (
+        encode_cursor(offset + limit, "offset") if len(heroes) > limit else None
+    )
+    return {"items": heroes[:limit], "next_cursor": next_cursor}
+
+
+@router.get(
+    "/heroes/{hero_id}", response_model=HeroPublic, status_code=status.HTTP_200_OK
+)
+async def read_hero(hero_id: int, session: AsyncSessionDep):
+    hero = await session.get(Hero, hero_id)
+    if not hero:
+        raise HTTPException(status_code=404, detail="Hero not found")
+    return hero
+
+
+@router.patch("/heroes/{hero_id}", response_model=HeroPublic)
+async def update_hero(hero_id: int, hero: HeroUpdate, session: AsyncSessionDep):
+    hero_db = await session.get(Hero, hero_id)
+    if not hero_db:
+        raise HTTPException(status_code=404, detail="Hero not found")
+    hero_data = hero.model_dump(exclude_unset=True)
+    hero_db.sqlmodel_update(hero_data)
+    session.add(hero_db)
+    await session.commit()
+    await session.refresh(hero_db)
+    return hero_db
+
+
+@router.delete("/heroes/{hero_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_hero(hero_id: int, session: AsyncSessionDep):
+    hero = await session.get(Hero, hero_id)
+    if not hero:
+        raise HTTPException(status_code=404, detail="Hero not found")
+    await session.delete(hero)
+    await session.commit()
+    return {"ok": True}
@@ -1,8 +1,26 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
-from db import SessionDep, create_db_and_tables
-from fastapi import FastAPI, HTTPException, Query
-from models import Hero, HeroCreate, HeroPublic, HeroUpdate
+from db import SessionDep, create_db_and_tables, db_mode
+from fastapi import Depends, FastAPI, HTTPException, Query
+from models import (
+    BulkResult,
+    Hero,
+    HeroBulk,
+    HeroCreate,
+    HeroPage,
+    HeroPublic,
+    HeroUpdate,
+)
+from pydantic import ValidationError
+from route_helpers import (
+    decode_cursor,
+    encode_cursor,
+    missing_fields_detail,
+    read_bulk_items,
+    search_query,
+    use_async_routes,
+    validation_detail,
+)
 from sqlmodel import select
 from starlette import status
 
@@ -23,6 +41,81 @@ def create_hero(hero: HeroCreate, session: SessionDep):
     return db_hero
 
 
+@app.post("/heroes/bulk", response_model=list[BulkResult])
+def bulk_heroes(items: Annotated[list, Depends(read_bulk_items)], session: SessionDep):
+    """
+    Create, update and delete many heroes in one transaction. Each item has an
+    action ("create" by default); updates and deletes also need an id. The
+    response has one result per item, in order, with a status such as 201, 200,
+    204, 404 or 422; items that fail are skipped and the rest are committed.
+    """
+    results = []
+    valid_items = []
+    for index, item in enumerate(items):
+        try:
+            valid_items.append((index, HeroBulk.model_validate(item)))
+        except ValidationError as e:
+            results.append(
+                BulkResult(index=index, status=422, detail=validation_detail(e))
+            )
+
+    # Load every hero to update or delete up front, a few thousand ids per query.
+    ids = sorted(
+        {item.id for _, item in valid_items if item.action != "create" and item.id}
+    )
+    heroes = {}
+    for start in range(0, len(ids), 5_000):
+        query = select(Hero).where(Hero.id.in_(ids[start : start + 5_000]))
+        heroes.update((hero.id, hero) for hero in session.exec(query))
+
+    created = []
+    for index, item in valid_items:
+        if item.action == "create":
+            detail = missing_fields_detail(item, ("name", "secret_name"))
+            if detail:
+                results.append(BulkResult(index=index, status=422, detail=detail))
+                continue
+            # The item was validated as a HeroBulk; building the Hero from its
+            # fields does not validate them again.
+            db_hero = Hero(
+                **item.model_dump(
+                    include={"name", "age", "secret_name"}, exclude_none=True
+                )
+            )
+            session.add(db_hero)
+            created.append((index, db_hero))
+            continue
+
+        if item.id is None:
+            detail = "id: Required to update or delete"
+            results.append(BulkResult(index=index, status=422, detail=detail))
+            continue
+        db_hero = heroes.get(item.id)
+        if db_hero is None:
+            results.append(BulkResult(index=index, status=404, detail="Hero not found"))
+        elif item.action == "update":
+            db_hero.sqlmodel_update(
+                item.model_dump(
+                    include={"name", "age", "secret_name"}, exclude_none=True
+                )
+            )
+            session.add(db_hero)
+            results.append(BulkResult(index=index, status=200, id=item.id))
+        else:
+            session.delete(db_hero)
+            del heroes[item.id]
+            results.append(BulkResult(index=index, status=204, id=item.id))
+
+    # One flush inserts the new heroes together and assigns their ids, instead of
+    # a commit and a refresh per hero.
+    session.flush()
+    results.extend(
+        BulkResult(index=index, status=201, id=db_hero.id) for index, db_hero in created
+    )
+    session.commit()
+    return sorted(results, key=lambda result: result.index)
+
+
 @app.get("/heroes/", response_model=list[HeroPublic], status_code=status.HTTP_200_OK)
 def read_heroes(
     session: SessionDep,
@@ -33,6 +126,38 @@ def read_heroes(
     return heroes
 
 
+# Keyset pagination: declared before /heroes/{hero_id} so "page" isn't read as an id.
+@app.get("/heroes/page", response_model=HeroPage, status_code=status.HTTP_200_OK)
+def read_heroes_page(
+    session: SessionDep,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 100,
+):
+    query = select(Hero).order_by(Hero.id).limit(limit + 1)
+    if cursor is not None:
+        query = query.where(Hero.id > decode_cursor(cursor))
+    heroes = session.exec(query).all()
+    next_cursor = encode_cursor(heroes[limit - 1].id) if len(heroes) > limit else None
+    return {"items": heroes[:limit], "next_cursor": next_cursor}
+
+
+@app.get("/heroes/search", response_model=HeroPage, status_code=status.HTTP_200_OK)
+def search_heroes(
+    session: SessionDep,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    prefix: bool = True,  # Match words starting with the last word of q
+    order: Literal["rank", "id"] = "rank",
+    cursor: str | None = None,  # The next_cursor of the previous page, if any
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+):
+    offset = decode_cursor(cursor, "offset") if cursor is not None else 0
+    heroes = session.exec(search_query(Hero, q, prefix, order, offset, limit)).all()
+    next_cursor = (
+        encode_cursor(offset + limit, "offset") if len(heroes) > limit else None
+    )
+    return {"items": heroes[:limit], "next_cursor": next_cursor}
+
+
 @app.get("/heroes/{hero_id}", response_model=HeroPublic, status_code=status.HTTP_200_OK)
 def read_hero(hero_id: int, session: SessionDep):
     hero = session.get(Hero, hero_id)
@@ -62,3 +187,10 @@ def delete_hero(hero_id: int, session: SessionDep):
     session.delete(hero)
     session.commit()
     return {"ok": True}
+
+
+if db_mode == "async":
+    # Imported last, as the async routes use the helpers above.
+    from async_routes import router
+
+    use_async_routes(app, router.routes)
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from sqlmodel import Field, SQLModel
 
 
@@ -15,6 +17,11 @@ class HeroPublic(HeroBase):
     id: int
 
 
+class HeroPage(SQLModel):
+    items: list[HeroPublic]
+    next_cursor: str | None = None
+
+
 class HeroCreate(HeroBase):
     secret_name: str
 
@@ -23,3 +30,18 @@ class HeroUpdate(HeroBase):
     name: str | None = None
     age: int | None = None
     secret_name: str | None = None
+
+
+class HeroBulk(SQLModel):
+    action: Literal["create", "update", "delete"] = "create"
+    id: int | None = None
+    name: str | None = None
+    age: int | None = None
+    secret_name: str | None = None
+
+
+class BulkResult(SQLModel):
+    index: int
+    status: int
+    id: int | None = None
+    detail: str | None = None
@@ -0,0 +1,153 @@
+import asyncio
+import json
+
+import async_routes
+import db
+import main
+import pytest
+from db import create_db_and_tables
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from models import Hero
+from route_helpers import use_async_routes
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine
+
+
+def async_app() -> FastAPI:
+    """Return the app as it is served when HERO_DB_MODE is "async"."""
+    app = FastAPI()
+    app.router.routes[:] = main.app.router.routes
+    use_async_routes(app, async_routes.router.routes)
+    return app
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    # Every test gets a database of its own in place of database.db.
+    database = tmp_path / "database.db"
+    engine = create_engine(
+        f"sqlite:///{database}", connect_args={"check_same_thread": False}
+    )
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+    monkeypatch.setattr(db, "engine", engine)
+    monkeypatch.setattr(db, "async_engine", async_engine)
+    yield
+    engine.dispose()
+    asyncio.run(async_engine.dispose())
+
+
+@pytest.fixture(params=["sync", "async"])
+def client(request, database):
+    create_db_and_tables()
+    app = main.app if request.param == "sync" else async_app()
+    with TestClient(app) as client:
+        yield client
+
+
+def hero(name: str) -> dict:
+    return {"name": name, "secret_name": f"secret {name}"}
+
+
+def create_heroes(client: TestClient, *heroes: dict) -> list[int]:
+    results = client.post("/heroes/bulk", json=list(heroes)).json()
+    return [result["id"] for result in results]
+
+
+def search(client: TestClient, q: str) -> list[str]:
+    items = client.get("/heroes/search", params={"q": q, "order": "id"}).json()
+    return [hero["name"] for hero in items["items"]]
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+def test_bulk_statuses(client, ndjson):
+    """
+    Test that a bulk request, as a JSON array or as JSON lines, gets one status
+    per item in order, and that the items which failed leave the rest committed.
+    """
+    hero_id, deleted_id = create_heroes(client, hero("Deadpond"), hero("Rusty-Man"))
+    items = [
+        hero("Spider-Boy"),
+        {"name": "No Secret"},
+        "not an object",
+        {"action": "update", "id": hero_id, "age": 30},
+        {"action": "update", "age": 40},
+        {"action": "delete", "id": deleted_id},
+        {"action": "delete", "id": 999},
+        {"action": "archive", "id": hero_id},
+    ]
+    if ndjson:
+        response = client.post(
+            "/heroes/bulk",
+            content="\n".join(map(json.dumps, items)) + "\n",
+            headers={"content-type": "application/x-ndjson"},
+        )
+    else:
+        response = client.post("/heroes/bulk", json=items)
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["index"] for result in results] == list(range(len(items)))
+    assert [result["status"] for result in results] == [
+        201,
+        422,
+        422,
+        200,
+        422,
+        204,
+        404,
+        422,
+    ]
+    assert results[1]["detail"] == "secret_name: Field required"
+    assert results[4]["detail"] == "id: Required to update or delete"
+    heroes = client.get("/heroes/").json()
+    assert [(hero["id"], hero["name"], hero["age"]) for hero in heroes] == [
+        (hero_id, "Deadpond", 30),
+        (results[0]["id"], "Spider-Boy", None),
+    ]
+
+
+def test_search_follows_writes(client):
+    """
+    Test that search results follow the heroes as they are inserted, updated and
+    deleted, one at a time or in bulk.
+    """
+    hero_id = client.post("/heroes/", json=hero("Captain North")).json()["id"]
+    bulk_id, _ = create_heroes(client, hero("Captain South"), hero("Tarantula"))
+    assert search(client, "captain") == ["Captain North", "Captain South"]
+    assert search(client, "nor") == ["Captain North"]
+
+    client.patch(f"/heroes/{hero_id}", json={"name": "Major North"})
+    client.post(
+        "/heroes/bulk",
+        json=[{"action": "update", "id": bulk_id, "name": "Major South"}],
+    )
+    assert search(client, "captain") == []
+    assert search(client, "major") == ["Major North", "Major South"]
+
+    client.delete(f"/heroes/{hero_id}")
+    client.post("/heroes/bulk", json=[{"action": "delete", "id": bulk_id}])
+    assert search(client, "major") == []
+    assert search(client, "tarantula") == ["Tarantula"]
+
+
+def test_search_index_on_existing_database(database):
+    """
+    Test that starting on a database with heroes but no search index indexes
+    them, and that an index created before its triggers gets them.
+    """
+    SQLModel.metadata.create_all(db.engine)
+    with Session(db.engine) as session:
+        session.add(Hero(**hero("Old Timer")))
+        session.commit()
+    with TestClient(main.app) as client:
+        assert search(client, "old") == ["Old Timer"]
+
+    with db.engine.begin() as connection:
+        for trigger in ["insert", "update", "delete"]:
+            connection.exec_driver_sql(f"DROP TRIGGER hero_fts_after_{trigger};")
+    with TestClient(main.app) as client:
+        client.patch("/heroes/1", json={"name": "New Timer"})
+        client.post("/heroes/", json=hero("Newer Timer"))
+        assert search(client, "old") == []
+        assert search(client, "new") == ["New Timer", "Newer Timer"]
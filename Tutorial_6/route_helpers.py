@@ -0,0 +1,152 @@
+"""
+Route helpers shared by the todo-server and hero apps: cursors, full-text search,
+bulk request bodies and the switch to async routes.
+"""
+
+import base64
+import json
+import re
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.routing import APIRoute
+from pydantic import ValidationError
+from sqlalchemy import literal_column, table
+from sqlmodel import select
+
+
+def encode_cursor(value: int, kind: str = "id") -> str:
+    """
+    Encode the id of the last row on a page as an opaque cursor, or, with kind
+    "offset", the position of the next page of search results.
+    """
+    return base64.urlsafe_b64encode(f"{kind}:{value}".encode()).decode()
+
+
+def decode_cursor(cursor: str, kind: str = "id") -> int:
+    """Return the value encoded in a cursor, or raise a 400 error if it is invalid."""
+    try:
+        prefix, _, value = base64.urlsafe_b64decode(cursor).decode().partition(":")
+        if prefix != kind:
+            raise ValueError(cursor)
+        return int(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def fts_match(q: str, prefix: bool) -> str:
+    """
+    Turn search text into an FTS5 query matching every word of it, the last one
+    as a prefix if prefix is true. Words are quoted, so FTS5 operators in the
+    text are searched for rather than interpreted.
+    """
+    words = [f'"{word}"' for word in re.findall(r"\w+", q)]
+    if not words:
+        raise HTTPException(status_code=422, detail="Nothing to search for")
+    if prefix:
+        words[-1] += "*"
+    return " ".join(words)
+
+
+def search_query(model, q: str, prefix: bool, order: str, offset: int, limit: int):
+    """
+    Select the rows of model matching q in its search index, created by
+    sqlite_setup.create_fts_index, with one more than limit, best first or in id
+    order. Ranking scores every match before the first page can be returned,
+    which takes a while for words in a large share of the rows; in id order,
+    FTS5 returns the matches as it finds them.
+    """
+    # The search index, as a table to join with. FTS5 exposes the rank of each
+    # match, by default its bm25 score, as a hidden column.
+    fts_name = f"{model.__tablename__}_fts"
+    fts = table(fts_name, literal_column("rowid"), literal_column("rank"))
+    query = (
+        select(model)
+        .join(fts, fts.c.rowid == model.id)
+        .where(literal_column(fts_name).op("MATCH")(fts_match(q, prefix)))
+        .offset(offset)
+        .limit(limit + 1)
+    )
+    if order == "rank":
+        return query.order_by(fts.c.rank, fts.c.rowid)
+    return query.order_by(fts.c.rowid)
+
+
+# The most items accepted by one bulk request.
+MAX_BULK_ITEMS = 10_000
+
+
+def _too_many_items() -> HTTPException:
+    return HTTPException(
+        status_code=413, detail=f"At most {MAX_BULK_ITEMS} items per request"
+    )
+
+
+async def _body_lines(request: Request):
+    """Yield the lines of a request body as it streams in."""
+    buffer = b""
+    async for chunk in request.stream():
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            yield line
+    yield buffer
+
+
+async def read_bulk_items(request: Request) -> list:
+    """
+    Read the items of a bulk request: a JSON array, or one JSON item per line when
+    the content type is application/x-ndjson or application/jsonl. JSON lines are
+    parsed as the body streams in, and reading stops with a 413 error as soon as
+    there are more than MAX_BULK_ITEMS of them. A JSON array is read whole before
+    its items are counted.
+    """
+    content_type = request.headers.get("content-type", "")
+    try:
+        if content_type.startswith(("application/x-ndjson", "application/jsonl")):
+            items = []
+            async for line in _body_lines(request):
+                if line.strip():
+                    if len(items) == MAX_BULK_ITEMS:
+                        raise _too_many_items()
+                    items.append(json.loads(line))
+        else:
+            items = json.loads(await request.body())
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=422, detail="Expected a JSON array of items")
+    if len(items) > MAX_BULK_ITEMS:
+        raise _too_many_items()
+    return items
+
+
+def validation_detail(error: ValidationError) -> str:
+    """Summarise a validation error as \"field: message\" pairs."""
+    return "; ".join(
+        f"{'.'.join(map(str, e['loc'])) or 'item'}: {e['msg']}" for e in error.errors()
+    )
+
+
+def missing_fields_detail(item, required: tuple[str, ...]) -> str | None:
+    """
+    Summarise the required fields that a validated bulk item leaves as None, the
+    way validation_detail reports them, or return None if it has them all.
+    """
+    missing = [
+        f"{name}: Field required" for name in required if getattr(item, name) is None
+    ]
+    return "; ".join(missing) or None
+
+
+def use_async_routes(app: FastAPI, routes: list[APIRoute]):
+    """
+    Serve the requests of app with the given async routes instead of the sync
+    routes with the same path and methods. The sync routes without an async
+    version, such as the bulk endpoints, stay as they are.
+    """
+    replaced = {(route.path, method) for route in routes for method in route.methods}
+    app.router.routes[:] = routes + [
+        route
+        for route in app.router.routes
+        if not isinstance(route, APIRoute)
+        or not replaced.intersection((route.path, method) for method in route.methods)
+    ]
@@ -0,0 +1,96 @@
+"""
+SQLite connection and search index setup shared by the todo-server and hero
+apps.
+"""
+
+import os
+
+from sqlalchemy import Engine, event
+
+# Named connection profiles: the PRAGMAs applied to every new SQLite connection.
+# "default" keeps SQLite's own settings. "performance" lets readers run
+# concurrently with a writer (WAL), syncs to disk only at checkpoints, so the
+# last commits can be lost on a power failure, and gives SQLite more memory to
+# work with.
+SQLITE_PROFILES = {
+    "default": {},
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # Negative sizes are in KiB: 64 MiB.
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+
+def use_sqlite_profile(engines: list[Engine], environment_variable: str) -> str:
+    """
+    Apply a profile to every new connection of engines, and return its name.
+
+    The profile is named by environment_variable, falling back to "default" when
+    it is unset or empty.
+
+    :raises ValueError: if the profile is unknown.
+    """
+    profile = os.environ.get(environment_variable) or "default"
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile: {profile}")
+
+    def apply_sqlite_profile(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in SQLITE_PROFILES[profile].items():
+            cursor.execute(f"PRAGMA {pragma} = {value};")
+        cursor.close()
+
+    for engine in engines:
+        event.listen(engine, "connect", apply_sqlite_profile)
+    return profile
+
+
+def create_fts_index(bind: Engine, table: str, column: str):
+    """
+    Create a full-text search index of table.column, named table_fts, and the
+    triggers keeping it in sync, indexing the existing rows once.
+
+    The FTS5 index stores no copy of the text (content=table). The prefix option
+    also indexes the first 2 and 3 characters of every word, so short prefix
+    queries do not have to scan the whole vocabulary. The triggers are created
+    whether or not the index exists, so databases indexed before them get them.
+    """
+    fts = f"{table}_fts"
+    statements = [
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+            {column}, content="{table}", content_rowid="id", prefix="2 3"
+        );
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_after_insert AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts} (rowid, {column}) VALUES (new.id, new.{column});
+        END;
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_after_delete AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {column})
+            VALUES ('delete', old.id, old.{column});
+        END;
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_after_update
+        AFTER UPDATE OF {column} ON {table} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {column})
+            VALUES ('delete', old.id, old.{column});
+            INSERT INTO {fts} (rowid, {column}) VALUES (new.id, new.{column});
+        END;
+        """,
+    ]
+    with bind.begin() as connection:
+        exists = connection.exec_driver_sql(
+            f"SELECT 1 FROM sqlite_master WHERE name = '{fts}';"
+        ).first()
+        for statement in statements:
+            connection.exec_driver_sql(statement)
+        if not exists:
+            connection.exec_driver_sql(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild');")
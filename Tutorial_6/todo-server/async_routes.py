@@ -0,0 +1,187 @@
+"""
+Async versions of the todo endpoints, used when TODO_DB_MODE is "async".
+
+They take an AsyncSession on the aiosqlite engine, so a request waiting for
+SQLite yields the event loop to other requests instead of holding one of the
+threadpool's workers. The paths, responses and cache behaviour are the same as
+those of the sync endpoints in main.py.
+"""
+
+from typing import Annotated, Literal
+
+from db import AsyncSessionDep
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from cache import (
+    etag_response,
+    response_cache,
+    store_json,
+    todo_adapter,
+    todo_list_adapter,
+)
+from models import CreateTodo, Todo, TodoPage, TodoResponse
+from pydantic import TypeAdapter
+from route_helpers import decode_cursor, encode_cursor, search_query
+from sqlmodel import select
+from starlette import status
+
+router = APIRouter()
+
+
+async def cached_json(
+    request: Request, key: str, tags: set[str], read, adapter: TypeAdapter
+) -> Response:
+    """Like main.cached_json, for a coroutine function read."""
+    entry = response_cache.get(key)
+    if entry is None:
+        generation = response_cache.generation
+        entry = store_json(key, tags, await read(), adapter, generation)
+    return etag_response(request, entry)
+
+
+# POST /todos
+@router.post(
+    "/todos/", response_model=TodoResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_todo(todo: CreateTodo, session: AsyncSessionDep):
+    db_todo = Todo.model_validate(todo)
+    session.add(db_todo)
+    await session.commit()
+    await session.refresh(db_todo)
+    response_cache.invalidate("lists", f"title:{db_todo.task_title}")
+    return db_todo
+
+
+# GET /todos
+@router.get(
+    "/todos/", response_model=list[TodoResponse], status_code=status.HTTP_200_OK
+)
+async def read_todos(
+    session: AsyncSessionDep,
+    offset: int = 0,
+    limit: Annotated[int, Query(le=100)] = 100,
+):
+    todos = await session.exec(select(Todo).offset(offset).limit(limit))
+    return todos.all()
+
+
+# GET /todos/page
+@router.get("/todos/page", response_model=TodoPage, status_code=status.HTTP_200_OK)
+async def read_todos_page(
+    session: AsyncSessionDep,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 100,
+):
+    query = select(Todo).order_by(Todo.id).limit(limit + 1)
+    if cursor is not None:
+        query = query.where(Todo.id > decode_cursor(cursor))
+    todos = (await session.exec(query)).all()
+    next_cursor = encode_cursor(todos[limit - 1].id) if len(todos) > limit else None
+    return {"items": todos[:limit], "next_cursor": next_cursor}
+
+
+# GET /todos/search
+@router.get("/todos/search", response_model=TodoPage, status_code=status.HTTP_200_OK)
+async def search_todos(
+    session: AsyncSessionDep,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    prefix: bool = True,  # Match words starting with the last word of q
+    order: Literal["rank", "id"] = "rank",
+    cursor: str | None = None,  # The next_cursor of the previous page, if any
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+):
+    offset = decode_cursor(cursor, "offset") if cursor is not None else 0
+    query = search_query(Todo, q, prefix, order, offset, limit)
+    todos = (await session.exec(query)).all()
+    next_cursor = (
+        encode_cursor(offset + limit, "offset") if len(todos) > limit else None
+    )
+    return {"items": todos[:limit], "next_cursor": next_cursor}
+
+
+# GET /todos/by-title
+@router.get(
+    "/todos/by-title", response_model=TodoResponse, status_code=status.HTTP_200_OK
+)
+async def read_todo_by_title(
+    todo_title: str, request: Request, session: AsyncSessionDep
+):
+    async def read():
+        query = select(Todo).where(Todo.task_title == todo_title)
+        todo = (await session.exec(query)).first()
+        if not todo:
+            raise HTTPException(status_code=404, detail="Todo not found")
+        return todo
+
+    key = f"title:{todo_title}"
+    return await cached_json(request, key, {key}, read, todo_adapter)
+
+
+# GET /todos/completed
+@router.get(
+    "/todos/completed",
+    response_model=list[TodoResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def read_completed_todos(request: Request, session: AsyncSessionDep):
+    async def read():
+        return (await session.exec(select(Todo).where(Todo.completed == True))).all()
+
+    return await cached_json(request, "completed", {"lists"}, read, todo_list_adapter)
+
+
+# GET /todos/incompleted
+@router.get(
+    "/todos/incompleted",
+    response_model=list[TodoResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def read_incompleted_todos(request: Request, session: AsyncSessionDep):
+    async def read():
+        return (await session.exec(select(Todo).where(Todo.completed == False))).all()
+
+    return await cached_json(request, "incompleted", {"lists"}, read, todo_list_adapter)
+
+
+# GET /todos/{todo_id}
+@router.get(
+    "/todos/{todo_id}", response_model=TodoResponse, status_code=status.HTTP_200_OK
+)
+async def read_todo(todo_id: int, request: Request, session: AsyncSessionDep):
+    async def read():
+        todo = await session.get(Todo, todo_id)
+        if not todo:
+            raise HTTPException(status_code=404, detail="Todo not found")
+        return todo
+
+    key = f"todo:{todo_id}"
+    return await cached_json(request, key, {key}, read, todo_adapter)
+
+
+# PATCH /todos/{todo_id}
+@router.patch("/todos/{todo_id}", response_model=TodoResponse)
+async def update_todo(todo_id: int, todo: CreateTodo, session: AsyncSessionDep):
+    todo_db = await session.get(Todo, todo_id)
+    if not todo_db:
+        raise HTTPException(status_code=404, detail="Todo not found")
+    old_title = todo_db.task_title
+    todo_db.sqlmodel_update(todo.model_dump(exclude_unset=True))
+    session.add(todo_db)
+    await session.commit()
+    await session.refresh(todo_db)
+    response_cache.invalidate(
+        f"todo:{todo_id}", "lists", f"title:{old_title}", f"title:{todo_db.task_title}"
+    )
+    return todo_db
+
+
+# DELETE /todos/{todo_id}
+@router.delete("/todos/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_todo(todo_id: int, session: AsyncSessionDep):
+    todo = await session.get(Todo, todo_id)
+    if not todo:
+        raise HTTPException(status_code=404, detail="Todo not found")
+    title = todo.task_title
+    await session.delete(todo)
+    await session.commit()
+    response_cache.invalidate(f"todo:{todo_id}", "lists", f"title:{title}")
+    return None
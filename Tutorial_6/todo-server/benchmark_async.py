@@ -0,0 +1,171 @@
+"""
+Benchmark the todo server with sync endpoints (TODO_DB_MODE=sync) against async
+endpoints on aiosqlite (TODO_DB_MODE=async), at 10 to 1,000 concurrent clients.
+
+Usage:
+    python benchmark_async.py [seconds per run] [rows]
+
+Each mode is served by its own uvicorn process over a temporary database of
+10,000 todos by default, with the "performance" SQLite profile and the response
+cache turned off so that every request reaches SQLite. Each client sends requests back to back: nine in ten
+read a random todo (GET /todos/{id}), the rest create one (POST /todos/).
+Requests that fail, e.g. with a 500 when no database connection is free within
+SQLAlchemy's pool timeout, or take over REQUEST_TIMEOUT seconds are counted as
+errors.
+
+The clients speak HTTP/1.1 over plain asyncio streams, one keep-alive connection
+each: httpx's connection pool is itself the bottleneck beyond a few dozen
+connections. The load is generated by this process, so on a machine with few
+cores it competes with the server for CPU.
+"""
+
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+from benchmark_pagination import fill_database
+
+PORT = 8767
+CONCURRENCY = [10, 100, 1000]
+WRITE_RATIO = 0.1
+# A client gives up on a request, and stops, after this many seconds.
+REQUEST_TIMEOUT = 10
+
+
+def start_server(directory: str, mode: str) -> subprocess.Popen:
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    environment = dict(
+        os.environ,
+        TODO_DB_MODE=mode,
+        TODO_DB_PROFILE="performance",
+        TODO_CACHE_MAX_ENTRIES="0",
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--app-dir", app_dir]
+        # Failed requests are counted by the clients, not logged by the server.
+        + ["--port", str(PORT), "--log-level", "critical", "--backlog", "4096"],
+        cwd=directory,
+        env=environment,
+    )
+    for _ in range(100):
+        if server.poll() is not None:
+            raise RuntimeError(f"The server exited, is port {PORT} in use?")
+        try:
+            httpx.get(f"http://127.0.0.1:{PORT}/todos/page?limit=1")
+            return server
+        except httpx.TransportError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("The server did not start")
+
+
+async def request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    method: str,
+    path: str,
+    body: bytes = b"",
+) -> int:
+    """Send one request on a keep-alive connection and return its status code."""
+    head = (
+        f"{method} {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    )
+    writer.write(head.encode() + body)
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(head.split(b" ", 2)[1])
+
+
+async def client(rows: int, deadline: float, latencies: list[float], errors: list):
+    rng = random.Random()
+    body = json.dumps({"task_title": "Benchmark"}).encode()
+    reader, writer = await asyncio.open_connection("127.0.0.1", PORT)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if rng.random() < WRITE_RATIO:
+                sent = request(reader, writer, "POST", "/todos/", body)
+            else:
+                sent = request(reader, writer, "GET", f"/todos/{rng.randint(1, rows)}")
+            try:
+                status = await asyncio.wait_for(sent, REQUEST_TIMEOUT)
+            except TimeoutError:
+                latencies.append(time.perf_counter() - start)
+                errors.append("timeout")
+                break
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run_load(concurrency: int, rows: int, seconds: float):
+    """Return the latency of every request, and the status of those that failed."""
+    latencies, errors = [], []
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(
+        *(client(rows, deadline, latencies, errors) for _ in range(concurrency))
+    )
+    return latencies, errors
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+
+    results = {}
+    for mode in ("sync", "async"):
+        with tempfile.TemporaryDirectory() as directory:
+            # The app opens todo.db in its working directory.
+            fill_database(os.path.join(directory, "todo.db"), rows)
+            server = start_server(directory, mode)
+            try:
+                for concurrency in CONCURRENCY:
+                    start = time.perf_counter()
+                    latencies, errors = asyncio.run(
+                        run_load(concurrency, rows, seconds)
+                    )
+                    elapsed = time.perf_counter() - start
+                    results[mode, concurrency] = (
+                        len(latencies) / elapsed,
+                        statistics.median(latencies) * 1000,
+                        statistics.quantiles(latencies, n=100)[98] * 1000,
+                        len(errors),
+                    )
+            finally:
+                server.terminate()
+                try:
+                    server.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    # Requests stuck waiting for a connection block a clean exit.
+                    server.kill()
+                    server.wait()
+
+    print(f"{rows:,} todos, {seconds:g} s per run, {WRITE_RATIO:.0%} writes")
+    print(
+        f"{'mode':<6} {'clients':>8} {'requests/sec':>13} "
+        f"{'p50 (ms)':>9} {'p99 (ms)':>9} {'errors':>7}"
+    )
+    for (mode, concurrency), (rate, p50, p99, errors) in results.items():
+        print(
+            f"{mode:<6} {concurrency:>8,} {rate:13,.0f} {p50:9.1f} {p99:9.1f} "
+            f"{errors:>7,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark the latency of reading page 1 and page 50,000 of the todos, with
+offset pagination (GET /todos/) and cursor pagination (GET /todos/page).
+
+Usage:
+    python benchmark_pagination.py [rows]
+
+The default is 5,000,000 todos, in a temporary database, read 100 per page.
+Requests go through FastAPI's TestClient, so the times include the app but not
+the network.
+"""
+
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+from db import get_session
+from fastapi.testclient import TestClient
+from main import app, encode_cursor
+from sqlmodel import Session, SQLModel, create_engine
+
+PAGE_SIZE = 100
+DEEP_PAGE = 50_000
+REPEATS = 20
+
+
+def fill_database(database: str, rows: int):
+    engine = create_engine(f"sqlite:///{database}")
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+    with sqlite3.connect(database) as connection:
+        connection.executemany(
+            "INSERT INTO todo (task_title, completed) VALUES (?, ?);",
+            ((f"Task {i}", i % 2) for i in range(rows)),
+        )
+    connection.close()
+
+
+def median_milliseconds(client: TestClient, url: str) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        response = client.get(url)
+        timings.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return statistics.median(timings) * 1000
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    deep_page = min(DEEP_PAGE, rows // PAGE_SIZE)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "todo.db")
+        fill_database(database, rows)
+        engine = create_engine(
+            f"sqlite:///{database}", connect_args={"check_same_thread": False}
+        )
+
+        def get_benchmark_session():
+            with Session(engine) as session:
+                yield session
+
+        app.dependency_overrides[get_session] = get_benchmark_session
+        client = TestClient(app)
+        # Ids start at 1, so page n starts after id (n - 1) * PAGE_SIZE.
+        urls = {
+            ("offset", 1): f"/todos/?offset=0&limit={PAGE_SIZE}",
+            ("offset", deep_page): (
+                f"/todos/?offset={(deep_page - 1) * PAGE_SIZE}&limit={PAGE_SIZE}"
+            ),
+            ("cursor", 1): f"/todos/page?limit={PAGE_SIZE}",
+            ("cursor", deep_page): (
+                f"/todos/page?limit={PAGE_SIZE}"
+                f"&cursor={encode_cursor((deep_page - 1) * PAGE_SIZE)}"
+            ),
+        }
+        timings = {key: median_milliseconds(client, url) for key, url in urls.items()}
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+    print(f"{rows:,} todos, {PAGE_SIZE} per page, median of {REPEATS} requests")
+    print(f"{'pagination':<12} {'page':>8} {'latency (ms)':>14}")
+    for (pagination, page), milliseconds in timings.items():
+        print(f"{pagination:<12} {page:>8,} {milliseconds:14.2f}")
+
+
+if __name__ == "__main__":
+    main()
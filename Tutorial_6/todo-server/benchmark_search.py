@@ -0,0 +1,135 @@
+"""
+Benchmark full-text search of todo titles (GET /todos/search, on the FTS5 index)
+against the LIKE '%...%' scan clients would otherwise need.
+
+Usage:
+    python benchmark_search.py [rows]
+
+The default is 5,000,000 todos, in a temporary database, with titles of 2 to 5
+made-up words drawn with a Zipf-like distribution, so a few words are in many
+titles and most in few. Searches go through FastAPI's TestClient and return 20
+matches, the best ones (order=rank) or the first ones by id (order=id). The
+LIKE queries run directly on SQLite, with no app in the way, and return the
+first 20 matches in table order, so they stop early for common words but scan
+the whole table for rare ones.
+"""
+
+import itertools
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+from db import create_search_index, get_session
+from fastapi.testclient import TestClient
+from main import app
+from sqlmodel import Session, SQLModel, create_engine
+
+LIMIT = 20
+REPEATS = 5
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "ta", "vo", "shi", "pe", "dra", "gul"]
+
+
+def make_vocabulary(size: int = 5_000) -> list[str]:
+    rng = random.Random(0)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+    return sorted(words, key=lambda word: (len(word), word))
+
+
+def fill_database(database: str, rows: int, vocabulary: list[str]):
+    engine = create_engine(f"sqlite:///{database}")
+    SQLModel.metadata.create_all(engine)
+    rng = random.Random(1)
+    # Word n is drawn with a weight of 1/n.
+    weights = list(itertools.accumulate(1 / n for n in range(1, len(vocabulary) + 1)))
+    with sqlite3.connect(database) as connection:
+        for start in range(0, rows, 100_000):
+            titles = (
+                " ".join(rng.choices(vocabulary, cum_weights=weights, k=words))
+                for words in rng.choices(range(2, 6), k=min(100_000, rows - start))
+            )
+            connection.executemany(
+                "INSERT INTO todo (task_title, completed) VALUES (?, 0);",
+                ((title,) for title in titles),
+            )
+    connection.close()
+    # Index the loaded rows in one pass, as the app does for an existing table.
+    start = time.perf_counter()
+    create_search_index(engine)
+    engine.dispose()
+    return time.perf_counter() - start
+
+
+def median_milliseconds(run) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    vocabulary = make_vocabulary()
+    common, rare = vocabulary[0], vocabulary[-1]
+    searches = {
+        "common word": (common, False),
+        "rare word": (rare, False),
+        "two words": (f"{vocabulary[5]} {vocabulary[50]}", False),
+        "3-letter prefix": (vocabulary[100][:3], True),
+        # No title has a "z", so LIKE has to read every row.
+        "no match": ("zebra", False),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "todo.db")
+        index_seconds = fill_database(database, rows, vocabulary)
+        engine = create_engine(
+            f"sqlite:///{database}", connect_args={"check_same_thread": False}
+        )
+
+        def get_benchmark_session():
+            with Session(engine) as session:
+                yield session
+
+        app.dependency_overrides[get_session] = get_benchmark_session
+        client = TestClient(app)
+        connection = sqlite3.connect(database)
+        timings = {}
+        for name, (q, prefix) in searches.items():
+            url = f"/todos/search?q={q}&prefix={str(prefix).lower()}&limit={LIMIT}"
+            search = [
+                median_milliseconds(
+                    lambda: client.get(f"{url}&order={order}").raise_for_status()
+                )
+                for order in ("rank", "id")
+            ]
+
+            conditions = " AND ".join("task_title LIKE ?" for _ in q.split())
+            query = f"SELECT * FROM todo WHERE {conditions} LIMIT {LIMIT};"
+            patterns = [f"%{word}%" for word in q.split()]
+            like = median_milliseconds(
+                lambda: connection.execute(query, patterns).fetchall()
+            )
+            timings[name, q] = (*search, like)
+        connection.close()
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+    print(f"{rows:,} todos, search index built in {index_seconds:.1f} s")
+    print(
+        f"{'query':<28} {'search by rank (ms)':>20} {'search by id (ms)':>18} "
+        f"{'LIKE scan (ms)':>15}"
+    )
+    for (name, q), (by_rank, by_id, like) in timings.items():
+        print(f"{f'{name} ({q})':<28} {by_rank:20.2f} {by_id:18.2f} {like:15.2f}")
+
+
+if __name__ == "__main__":
+    main()
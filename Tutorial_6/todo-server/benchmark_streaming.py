@@ -0,0 +1,102 @@
+"""
+Benchmark the peak memory and time to first byte of reading every completed todo
+as one list (GET /todos/completed) against streaming it as a JSON array or as
+JSON lines (GET /todos/completed/stream).
+
+Usage:
+    python benchmark_streaming.py [rows]
+
+The default is 1,000,000 completed todos, in a temporary database. Each endpoint
+is served by a fresh uvicorn process, whose peak resident memory (VmHWM in
+/proc, so Linux only) is read after the response has been received in full.
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+from benchmark_pagination import fill_database
+
+PORT = 8766
+URLS = {
+    "list": "/todos/completed",
+    "stream (JSON array)": "/todos/completed/stream",
+    "stream (JSON lines)": "/todos/completed/stream?format=ndjson",
+}
+
+
+def memory_kib(pid: int, field: str) -> int:
+    """Read a memory field, such as VmRSS or VmHWM, of a process in KiB."""
+    with open(f"/proc/{pid}/status") as status_file:
+        for line in status_file:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1])
+    raise ValueError(f"No {field} for process {pid}")
+
+
+def measure(directory: str, path: str) -> tuple[float, float, int, int]:
+    """
+    Serve the app from directory and read path once. Return the time to first
+    byte and in total, in seconds, and the memory before and at peak, in KiB.
+    """
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--app-dir", app_dir]
+        + ["--port", str(PORT), "--log-level", "warning"],
+        cwd=directory,
+    )
+    url = f"http://127.0.0.1:{PORT}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{url}/todos/page?limit=1")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        rss_before = memory_kib(server.pid, "VmRSS")
+
+        start = time.perf_counter()
+        with httpx.stream("GET", url + path, timeout=600) as response:
+            response.raise_for_status()
+            chunks = response.iter_raw()
+            next(chunks)
+            first_byte = time.perf_counter() - start
+            for _ in chunks:
+                pass
+        total = time.perf_counter() - start
+        return first_byte, total, rss_before, memory_kib(server.pid, "VmHWM")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        # The app opens todo.db in its working directory.
+        database = os.path.join(directory, "todo.db")
+        fill_database(database, rows)
+        with sqlite3.connect(database) as connection:
+            connection.execute("UPDATE todo SET completed = 1;")
+        connection.close()
+        results = {name: measure(directory, path) for name, path in URLS.items()}
+
+    print(f"{rows:,} completed todos")
+    print(
+        f"{'endpoint':<20} {'first byte (ms)':>15} {'total (s)':>10} "
+        f"{'peak RSS (MiB)':>15} {'growth (MiB)':>13}"
+    )
+    for name, (first_byte, total, rss_before, peak) in results.items():
+        print(
+            f"{name:<20} {first_byte * 1000:15.1f} {total:10.2f} "
+            f"{peak / 1024:15.1f} {(peak - rss_before) / 1024:13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
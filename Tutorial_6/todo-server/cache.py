@@ -0,0 +1,152 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from fastapi import Request, Response
+from models import TodoResponse
+from pydantic import TypeAdapter
+from starlette import status
+
+
+class CachedResponse(NamedTuple):
+    """A serialized response body, its ETag, and when it expires."""
+
+    body: bytes
+    etag: str
+    tags: frozenset[str]
+    expires: float
+
+
+def make_etag(body: bytes) -> str:
+    """A strong ETag for a response body: a quoted hash of its bytes."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+class ResponseCache:
+    """
+    An in-process cache of serialized responses, bounded in size and age.
+
+    Entries are evicted least recently used first once there are max_entries of
+    them, and expire ttl seconds after they were stored. Each entry has tags, such
+    as "todo:1" or "lists", and writes invalidate the entries carrying the tags
+    they affect. The cache is shared by the threads serving requests, so every
+    operation holds a lock.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation, so a read that started before a write
+        # does not store what it read after the write has invalidated it.
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the entry for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self, key: str, body: bytes, tags: set[str], generation: int
+    ) -> CachedResponse:
+        """
+        Store a response body under key and return its entry.
+
+        :param generation: The cache generation when the body was read from the
+            database. If something has been invalidated since, the body may be
+            stale, so it is returned but not stored.
+        """
+        entry = CachedResponse(
+            body, make_etag(body), frozenset(tags), time.monotonic() + self.ttl
+        )
+        with self._lock:
+            if generation != self.generation:
+                return entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def invalidate(self, *tags: str):
+        """Drop the entries carrying any of the tags, or every entry if none given."""
+        with self._lock:
+            self.generation += 1
+            if not tags:
+                stale = list(self._entries)
+            else:
+                stale = [
+                    key
+                    for key, entry in self._entries.items()
+                    if not entry.tags.isdisjoint(tags)
+                ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+# Serialized responses of the read endpoints, invalidated by every write. The
+# cache lives in this process, so run a single worker or accept that the other
+# workers serve what they cached for up to TODO_CACHE_TTL seconds.
+response_cache = ResponseCache(
+    max_entries=int(os.environ.get("TODO_CACHE_MAX_ENTRIES", 1024)),
+    ttl=float(os.environ.get("TODO_CACHE_TTL", 30)),
+)
+todo_adapter = TypeAdapter(TodoResponse)
+todo_list_adapter = TypeAdapter(list[TodoResponse])
+
+
+def store_json(
+    key: str, tags: set[str], result, adapter: TypeAdapter, generation: int
+) -> CachedResponse:
+    """Serialize a result through adapter and cache it under key."""
+    result = adapter.validate_python(result, from_attributes=True)
+    return response_cache.put(key, adapter.dump_json(result), tags, generation)
+
+
+def etag_response(request: Request, entry: CachedResponse) -> Response:
+    """
+    Return a cached JSON response with its ETag, or an empty 304 response if the
+    request's If-None-Match has that ETag.
+    """
+    headers = {"ETag": entry.etag}
+    if_none_match = request.headers.get("if-none-match", "")
+    etags = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+    if entry.etag in etags or "*" in etags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
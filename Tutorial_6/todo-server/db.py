@@ -1,7 +1,17 @@
+import os
+import sys
+from pathlib import Path
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# The SQLite setup, and the route helpers main.py imports, are shared with the
+# hero app.
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from sqlite_setup import create_fts_index, use_sqlite_profile
 
 sqlite_file_name = "todo.db"
 sqlite_url = f"sqlite:///{sqlite_file_name}"
@@ -9,9 +19,27 @@ sqlite_url = f"sqlite:///{sqlite_file_name}"
 connect_args = {"check_same_thread": False}
 engine = create_engine(sqlite_url, connect_args=connect_args)
 
+# The same database through aiosqlite, for the async endpoints. "sync" serves
+# requests with the def endpoints of main.py, on the threadpool; "async" with
+# those of async_routes.py, on the event loop.
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{sqlite_file_name}")
+db_mode = os.environ.get("TODO_DB_MODE", "sync")
+
+# The PRAGMAs applied to every new connection: SQLite's own settings unless
+# TODO_DB_PROFILE names another profile, such as "performance".
+sqlite_profile = use_sqlite_profile(
+    [engine, async_engine.sync_engine], "TODO_DB_PROFILE"
+)
+
+
+def create_search_index(bind=engine):
+    """Create the full-text search index over task titles and its triggers."""
+    create_fts_index(bind, "todo", "task_title")
+
 
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
+    create_search_index(engine)
 
 
 def get_session():
@@ -20,3 +48,11 @@ def get_session():
 
 
 SessionDep = Annotated[Session, Depends(get_session)]
+
+
+async def get_async_session():
+    async with AsyncSession(async_engine) as session:
+        yield session
+
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
@@ -0,0 +1,105 @@
+"""
+Load test creating todos one per request (POST /todos/) against creating them in
+batches (POST /todos/bulk), sent as a JSON array and as JSON lines.
+
+Usage:
+    python load_test_bulk.py [items] [--batch-size 1000] [--url http://host:port]
+
+Without --url, the app is started with uvicorn in a temporary directory, so its
+todo.db is thrown away afterwards. Requests go over HTTP with httpx, so the
+rates include the network and JSON encoding on both sides.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, nullcontext
+
+import httpx
+
+PORT = 8765
+
+
+@contextmanager
+def run_server():
+    """Start the app with uvicorn in a temporary directory and yield its URL."""
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as directory:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--app-dir", app_dir]
+            + ["--port", str(PORT), "--log-level", "warning"],
+            cwd=directory,
+        )
+        url = f"http://127.0.0.1:{PORT}"
+        try:
+            for _ in range(100):
+                try:
+                    httpx.get(f"{url}/todos/page?limit=1")
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+            yield url
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def single_requests(client: httpx.Client, items: int) -> float:
+    start = time.perf_counter()
+    for i in range(items):
+        client.post("/todos/", json={"task_title": f"Task {i}"}).raise_for_status()
+    return time.perf_counter() - start
+
+
+def bulk_requests(client: httpx.Client, items: int, batch_size: int, ndjson: bool):
+    start = time.perf_counter()
+    for first in range(0, items, batch_size):
+        batch = [
+            {"task_title": f"Task {i}"}
+            for i in range(first, min(first + batch_size, items))
+        ]
+        if ndjson:
+            response = client.post(
+                "/todos/bulk",
+                content="".join(json.dumps(item) + "\n" for item in batch),
+                headers={"content-type": "application/x-ndjson"},
+            )
+        else:
+            response = client.post("/todos/bulk", json=batch)
+        response.raise_for_status()
+        if any(result["status"] != 201 for result in response.json()):
+            raise RuntimeError("A bulk item was not created")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("items", type=int, nargs="?", default=5_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--url", help="a running todo server (default: start one)")
+    args = parser.parse_args()
+
+    with run_server() if args.url is None else nullcontext(args.url) as url:
+        with httpx.Client(base_url=url, timeout=60) as client:
+            timings = {
+                "single": single_requests(client, args.items),
+                "bulk (JSON array)": bulk_requests(
+                    client, args.items, args.batch_size, ndjson=False
+                ),
+                "bulk (JSON lines)": bulk_requests(
+                    client, args.items, args.batch_size, ndjson=True
+                ),
+            }
+
+    print(f"{args.items:,} todos created, bulk batches of {args.batch_size:,}")
+    print(f"{'endpoint':<20} {'seconds':>9} {'items/sec':>11}")
+    for endpoint, seconds in timings.items():
+        print(f"{endpoint:<20} {seconds:9.2f} {args.items / seconds:11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,110 @@
-from typing import Annotated
+import json
+from typing import Annotated, Literal
 
-from db import SessionDep, create_db_and_tables
-from fastapi import FastAPI, HTTPException, Query
-from models import CreateTodo, DeleteTodo, Todo, TodoResponse
-from sqlmodel import select
+from cache import (
+    etag_response,
+    response_cache,
+    store_json,
+    todo_adapter,
+    todo_list_adapter,
+)
+from db import SessionDep, create_db_and_tables, db_mode
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from models import (
+    BulkResult,
+    BulkTodo,
+    CreateTodo,
+    DeleteTodo,
+    Todo,
+    TodoPage,
+    TodoResponse,
+)
+from pydantic import TypeAdapter, ValidationError
+from route_helpers import (
+    decode_cursor,
+    encode_cursor,
+    missing_fields_detail,
+    read_bulk_items,
+    search_query,
+    use_async_routes,
+    validation_detail,
+)
+from sqlmodel import Session, select
 from starlette import status
 
 app = FastAPI()
 
 
+def cached_json(
+    request: Request, key: str, tags: set[str], read, adapter: TypeAdapter
+) -> Response:
+    """
+    Return the cached JSON response for key, or call read() and cache its result
+    serialized through adapter. Errors raised by read(), such as a 404, are not
+    cached.
+    """
+    entry = response_cache.get(key)
+    if entry is None:
+        generation = response_cache.generation
+        entry = store_json(key, tags, read(), adapter, generation)
+    return etag_response(request, entry)
+
+
+# Rows read per query by the streaming endpoints.
+STREAM_BATCH_SIZE = 1_000
+
+
+def stream_todos(bind, completed: bool, ndjson: bool):
+    """
+    Yield the todos with a completion status as a JSON array, or as JSON lines,
+    reading STREAM_BATCH_SIZE rows at a time by id. Only one batch is held in
+    memory, however many todos there are, and no ORM objects are built.
+
+    Each batch is read in a transaction of its own, not from a single snapshot:
+    todos written while the response streams may or may not be in it, but no
+    todo is sent twice, and every todo left untouched is sent once. Holding one
+    read transaction instead would, without WAL, block every writer until the
+    client had read the whole response. The session is opened here rather than
+    taken from get_session, which is closed before a streaming response is sent.
+    """
+    columns = select(Todo.id, Todo.task_title, Todo.completed)
+    with Session(bind) as session:
+        if not ndjson:
+            yield "["
+        last_id = 0
+        while True:
+            query = (
+                columns.where(Todo.completed == completed, Todo.id > last_id)
+                .order_by(Todo.id)
+                .limit(STREAM_BATCH_SIZE)
+            )
+            rows = session.exec(query).all()
+            if not rows:
+                break
+            items = [
+                json.dumps({"id": id, "task_title": title, "completed": done})
+                for id, title, done in rows
+            ]
+            if ndjson:
+                yield "\n".join(items) + "\n"
+            else:
+                yield ("," if last_id else "") + ",".join(items)
+            last_id = rows[-1].id
+        if not ndjson:
+            yield "]"
+
+
+def streaming_todos(
+    session: Session, completed: bool, format: str
+) -> StreamingResponse:
+    ndjson = format == "ndjson"
+    return StreamingResponse(
+        stream_todos(session.get_bind(), completed, ndjson),
+        media_type="application/x-ndjson" if ndjson else "application/json",
+    )
+
+
 @app.on_event("startup")
 def on_startup():
     create_db_and_tables()
@@ -21,9 +117,85 @@ def create_todo(todo: CreateTodo, session: SessionDep):
     session.add(db_todo)
     session.commit()
     session.refresh(db_todo)
+    response_cache.invalidate("lists", f"title:{db_todo.task_title}")
     return db_todo
 
 
+# POST /todos/bulk
+@app.post("/todos/bulk", response_model=list[BulkResult])
+def bulk_todos(items: Annotated[list, Depends(read_bulk_items)], session: SessionDep):
+    """
+    Create, update and delete many todos in one transaction. Each item has an
+    action ("create" by default); updates and deletes also need an id. The
+    response has one result per item, in order, with a status such as 201, 200,
+    204, 404 or 422; items that fail are skipped and the rest are committed.
+    """
+    results = []
+    valid_items = []
+    for index, item in enumerate(items):
+        try:
+            valid_items.append((index, BulkTodo.model_validate(item)))
+        except ValidationError as e:
+            results.append(
+                BulkResult(index=index, status=422, detail=validation_detail(e))
+            )
+
+    # Load every todo to update or delete up front, a few thousand ids per query.
+    ids = sorted(
+        {item.id for _, item in valid_items if item.action != "create" and item.id}
+    )
+    todos = {}
+    for start in range(0, len(ids), 5_000):
+        query = select(Todo).where(Todo.id.in_(ids[start : start + 5_000]))
+        todos.update((todo.id, todo) for todo in session.exec(query))
+
+    created = []
+    for index, item in valid_items:
+        if item.action == "create":
+            detail = missing_fields_detail(item, ("task_title",))
+            if detail:
+                results.append(BulkResult(index=index, status=422, detail=detail))
+                continue
+            # The item was validated as a BulkTodo; building the Todo from its
+            # fields does not validate them again.
+            db_todo = Todo(
+                **item.model_dump(
+                    include={"task_title", "completed"}, exclude_none=True
+                )
+            )
+            session.add(db_todo)
+            created.append((index, db_todo))
+            continue
+
+        if item.id is None:
+            detail = "id: Required to update or delete"
+            results.append(BulkResult(index=index, status=422, detail=detail))
+            continue
+        db_todo = todos.get(item.id)
+        if db_todo is None:
+            results.append(BulkResult(index=index, status=404, detail="Todo not found"))
+        elif item.action == "update":
+            db_todo.sqlmodel_update(
+                item.model_dump(include={"task_title", "completed"}, exclude_none=True)
+            )
+            session.add(db_todo)
+            results.append(BulkResult(index=index, status=200, id=item.id))
+        else:
+            session.delete(db_todo)
+            del todos[item.id]
+            results.append(BulkResult(index=index, status=204, id=item.id))
+
+    # One flush inserts the new todos together and assigns their ids, instead of
+    # a commit and a refresh per todo.
+    session.flush()
+    results.extend(
+        BulkResult(index=index, status=201, id=db_todo.id) for index, db_todo in created
+    )
+    session.commit()
+    response_cache.invalidate()
+    return sorted(results, key=lambda result: result.index)
+
+
 # GET /todos
 @app.get("/todos/", response_model=list[TodoResponse], status_code=status.HTTP_200_OK)
 def read_todos(
@@ -37,13 +209,54 @@ def read_todos(
     return todos
 
 
+# GET /todos/page
+@app.get("/todos/page", response_model=TodoPage, status_code=status.HTTP_200_OK)
+def read_todos_page(
+    session: SessionDep,
+    cursor: str | None = None,  # The next_cursor of the previous page, if any
+    limit: Annotated[int, Query(ge=1, le=100)] = 100,
+):
+    # Unlike offset, the cursor seeks straight to the first id of the page through
+    # the primary key, so every page is as fast as the first one.
+    query = select(Todo).order_by(Todo.id).limit(limit + 1)
+    if cursor is not None:
+        query = query.where(Todo.id > decode_cursor(cursor))
+    todos = session.exec(query).all()
+    # The extra row only tells us whether there is a next page.
+    next_cursor = encode_cursor(todos[limit - 1].id) if len(todos) > limit else None
+    return {"items": todos[:limit], "next_cursor": next_cursor}
+
+
+# GET /todos/search
+@app.get("/todos/search", response_model=TodoPage, status_code=status.HTTP_200_OK)
+def search_todos(
+    session: SessionDep,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    prefix: bool = True,  # Match words starting with the last word of q
+    order: Literal["rank", "id"] = "rank",
+    cursor: str | None = None,  # The next_cursor of the previous page, if any
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+):
+    offset = decode_cursor(cursor, "offset") if cursor is not None else 0
+    todos = session.exec(search_query(Todo, q, prefix, order, offset, limit)).all()
+    next_cursor = (
+        encode_cursor(offset + limit, "offset") if len(todos) > limit else None
+    )
+    return {"items": todos[:limit], "next_cursor": next_cursor}
+
+
 # GET /todos/by-title
 @app.get("/todos/by-title", response_model=TodoResponse, status_code=status.HTTP_200_OK)
-def read_todo_by_title(todo_title: str, session: SessionDep):
-    todo = session.exec(select(Todo).where(Todo.task_title == todo_title)).first()
-    if not todo:
-        raise HTTPException(status_code=404, detail="Todo not found")
-    return todo
+def read_todo_by_title(todo_title: str, request: Request, session: SessionDep):
+    def read():
+        query = select(Todo).where(Todo.task_title == todo_title)
+        todo = session.exec(query).first()
+        if not todo:
+            raise HTTPException(status_code=404, detail="Todo not found")
+        return todo
+
+    key = f"title:{todo_title}"
+    return cached_json(request, key, {key}, read, todo_adapter)
 
 
 # GET /todos/completed
@@ -52,9 +265,11 @@ def read_todo_by_title(todo_title: str, session: SessionDep):
     response_model=list[TodoResponse],
     status_code=status.HTTP_200_OK,
 )
-def read_completed_todos(session: SessionDep):
-    todos = session.exec(select(Todo).where(Todo.completed == True)).all()
-    return todos
+def read_completed_todos(request: Request, session: SessionDep):
+    def read():
+        return session.exec(select(Todo).where(Todo.completed == True)).all()
+
+    return cached_json(request, "completed", {"lists"}, read, todo_list_adapter)
 
 
 # GET /todos/incompleted
@@ -63,20 +278,42 @@ def read_completed_todos(session: SessionDep):
     response_model=list[TodoResponse],
     status_code=status.HTTP_200_OK,
 )
-def read_incompleted_todos(session: SessionDep):
-    todos = session.exec(select(Todo).where(Todo.completed == False)).all()
-    return todos
+def read_incompleted_todos(request: Request, session: SessionDep):
+    def read():
+        return session.exec(select(Todo).where(Todo.completed == False)).all()
+
+    return cached_json(request, "incompleted", {"lists"}, read, todo_list_adapter)
+
+
+# GET /todos/completed/stream
+@app.get("/todos/completed/stream", response_class=StreamingResponse)
+def stream_completed_todos(
+    session: SessionDep, format: Literal["json", "ndjson"] = "json"
+):
+    return streaming_todos(session, True, format)
+
+
+# GET /todos/incompleted/stream
+@app.get("/todos/incompleted/stream", response_class=StreamingResponse)
+def stream_incompleted_todos(
+    session: SessionDep, format: Literal["json", "ndjson"] = "json"
+):
+    return streaming_todos(session, False, format)
 
 
 # GET /todos/{todo_id}
 @app.get(
     "/todos/{todo_id}", response_model=TodoResponse, status_code=status.HTTP_200_OK
 )
-def read_todo(todo_id: int, session: SessionDep):
-    todo = session.get(Todo, todo_id)
-    if not todo:
-        raise HTTPException(status_code=404, detail="Todo not found")
-    return todo
+def read_todo(todo_id: int, request: Request, session: SessionDep):
+    def read():
+        todo = session.get(Todo, todo_id)
+        if not todo:
+            raise HTTPException(status_code=404, detail="Todo not found")
+        return todo
+
+    key = f"todo:{todo_id}"
+    return cached_json(request, key, {key}, read, todo_adapter)
 
 
 # PATCH /todos/{todo_id}
@@ -85,11 +322,15 @@ def update_todo(todo_id: int, todo: CreateTodo, session: SessionDep):
     todo_db = session.get(Todo, todo_id)
     if not todo_db:
         raise HTTPException(status_code=404, detail="Todo not found")
+    old_title = todo_db.task_title
     todo_data = todo.model_dump(exclude_unset=True)
     todo_db.sqlmodel_update(todo_data)
     session.add(todo_db)
     session.commit()
     session.refresh(todo_db)
+    response_cache.invalidate(
+        f"todo:{todo_id}", "lists", f"title:{old_title}", f"title:{todo_db.task_title}"
+    )
     return todo_db
 
 
@@ -99,5 +340,20 @@ def delete_todo(todo_id: int, session: SessionDep):
     todo = session.get(Todo, todo_id)
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
+    title = todo.task_title
     session.delete(todo)
+    session.commit()
+    response_cache.invalidate(f"todo:{todo_id}", "lists", f"title:{title}")
     return None
+
+
+# GET /cache/metrics
+@app.get("/cache/metrics", status_code=status.HTTP_200_OK)
+def read_cache_metrics():
+    return response_cache.metrics()
+
+
+if db_mode == "async":
+    from async_routes import router
+
+    use_async_routes(app, router.routes)
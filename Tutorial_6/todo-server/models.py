@@ -1,3 +1,5 @@
+from typing import Literal
+
 from sqlmodel import Field, SQLModel
 
 
@@ -28,6 +30,17 @@ class TodoResponse(SQLModel):
     completed: bool
 
 
+class TodoPage(SQLModel):
+    """
+    This class is used to define the structure of the response body for a page of tasks
+    The items field will store the tasks on the page, in id order
+    The next_cursor field will store the cursor of the next page, or None on the last page
+    """
+
+    items: list[TodoResponse]
+    next_cursor: str | None = None
+
+
 class CreateTodo(SQLModel):
     """
     This class is used to define the structure of the request body for creating a new task
@@ -57,3 +70,32 @@ class DeleteTodo(SQLModel):
     """
 
     id: int
+
+
+class BulkTodo(SQLModel):
+    """
+    This class is used to define the structure of one item of a bulk request
+    The action field will store what to do with the task: create, update or delete
+    The id field is required to update or delete a task
+    The task_title and completed fields will store the values to create or update
+    """
+
+    action: Literal["create", "update", "delete"] = "create"
+    id: int | None = None
+    task_title: str | None = None
+    completed: bool | None = None
+
+
+class BulkResult(SQLModel):
+    """
+    This class is used to define the structure of the result of one bulk item
+    The index field will store the position of the item in the request
+    The status field will store an HTTP status code for the item, e.g. 201 or 404
+    The id field will store the id of the task, if there is one
+    The detail field will store why the item failed, if it did
+    """
+
+    index: int
+    status: int
+    id: int | None = None
+    detail: str | None = None
@@ -0,0 +1,255 @@
+import asyncio
+import json
+
+import async_routes
+import db
+import main
+import pytest
+from cache import response_cache
+from db import create_db_and_tables
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from route_helpers import MAX_BULK_ITEMS, use_async_routes
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine
+
+
+def async_app() -> FastAPI:
+    """Return the app as it is served when TODO_DB_MODE is "async"."""
+    app = FastAPI()
+    app.router.routes[:] = main.app.router.routes
+    use_async_routes(app, async_routes.router.routes)
+    return app
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    # Every test gets a database of its own in place of todo.db.
+    database = tmp_path / "todo.db"
+    engine = create_engine(
+        f"sqlite:///{database}", connect_args={"check_same_thread": False}
+    )
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+    monkeypatch.setattr(db, "engine", engine)
+    monkeypatch.setattr(db, "async_engine", async_engine)
+    response_cache.invalidate()
+    yield
+    engine.dispose()
+    asyncio.run(async_engine.dispose())
+
+
+@pytest.fixture(params=["sync", "async"])
+def client(request, database):
+    create_db_and_tables()
+    app = main.app if request.param == "sync" else async_app()
+    with TestClient(app) as client:
+        yield client
+
+
+def create_todos(client: TestClient, *todos: dict) -> list[int]:
+    results = client.post("/todos/bulk", json=list(todos)).json()
+    return [result["id"] for result in results]
+
+
+def search(client: TestClient, q: str) -> list[str]:
+    items = client.get("/todos/search", params={"q": q, "order": "id"}).json()["items"]
+    return [todo["task_title"] for todo in items]
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+def test_bulk_statuses(client, ndjson):
+    """
+    Test that a bulk request, as a JSON array or as JSON lines, gets one status
+    per item in order, and that the items which failed leave the rest committed.
+    """
+    todo_id, deleted_id = create_todos(client, {"task_title": "a"}, {"task_title": "b"})
+    items = [
+        {"task_title": "new", "completed": True},
+        {"completed": True},
+        "not an object",
+        {"action": "update", "id": todo_id, "task_title": "renamed"},
+        {"action": "update", "task_title": "no id"},
+        {"action": "delete", "id": deleted_id},
+        {"action": "delete", "id": 999},
+        {"action": "archive", "id": todo_id},
+    ]
+    if ndjson:
+        response = client.post(
+            "/todos/bulk",
+            content="\n".join(map(json.dumps, items)) + "\n",
+            headers={"content-type": "application/x-ndjson"},
+        )
+    else:
+        response = client.post("/todos/bulk", json=items)
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["index"] for result in results] == list(range(len(items)))
+    assert [result["status"] for result in results] == [
+        201,
+        422,
+        422,
+        200,
+        422,
+        204,
+        404,
+        422,
+    ]
+    assert results[1]["detail"] == "task_title: Field required"
+    assert results[4]["detail"] == "id: Required to update or delete"
+    todos = client.get("/todos/").json()
+    assert [(todo["id"], todo["task_title"]) for todo in todos] == [
+        (todo_id, "renamed"),
+        (results[0]["id"], "new"),
+    ]
+
+
+def test_bulk_rejects_bad_bodies(client):
+    """
+    Test that invalid JSON, a body other than an array and too many items, as a
+    JSON array or as JSON lines, are rejected as a whole.
+    """
+    assert client.post("/todos/bulk", content="[").status_code == 400
+    assert client.post("/todos/bulk", json={"task_title": "a"}).status_code == 422
+    too_many = [{"task_title": "a"}] * (MAX_BULK_ITEMS + 1)
+    assert client.post("/todos/bulk", json=too_many).status_code == 413
+    response = client.post(
+        "/todos/bulk",
+        content="\n".join(map(json.dumps, too_many)),
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert response.status_code == 413
+    assert client.get("/todos/").json() == []
+
+
+def test_cache_invalidated_by_every_write(client):
+    """
+    Test that a matching If-None-Match gets a 304 until a create, update, delete
+    or bulk request changes the cached responses.
+    """
+
+    def etag(path: str, **params) -> str:
+        response = client.get(path, params=params)
+        assert response.status_code == 200
+        again = client.get(
+            path, params=params, headers={"If-None-Match": response.headers["ETag"]}
+        )
+        assert again.status_code == 304
+        assert again.content == b""
+        return response.headers["ETag"]
+
+    todo_id = client.post("/todos/", json={"task_title": "a"}).json()["id"]
+
+    def etags() -> dict[str, str]:
+        return {
+            "item": etag(f"/todos/{todo_id}"),
+            "title": etag("/todos/by-title", todo_title="a"),
+            "list": etag("/todos/incompleted"),
+        }
+
+    tags = etags()
+
+    def changed() -> set[str]:
+        new_tags = etags()
+        changed = {name for name in tags if tags[name] != new_tags[name]}
+        tags.update(new_tags)
+        return changed
+
+    client.post("/todos/", json={"task_title": "b"})
+    assert changed() == {"list"}
+    client.patch(f"/todos/{todo_id}", json={"task_title": "a", "completed": True})
+    assert changed() == {"item", "title", "list"}
+    client.post(
+        "/todos/bulk",
+        json=[
+            {"action": "update", "id": todo_id, "completed": False},
+            {"task_title": "c"},
+        ],
+    )
+    assert changed() == {"item", "title", "list"}
+
+    client.delete(f"/todos/{todo_id}")
+    assert client.get(f"/todos/{todo_id}").status_code == 404
+    assert client.get("/todos/by-title", params={"todo_title": "a"}).status_code == 404
+    assert [todo["task_title"] for todo in client.get("/todos/incompleted").json()] == [
+        "b",
+        "c",
+    ]
+
+
+@pytest.mark.parametrize("completed", [True, False])
+def test_streams(client, monkeypatch, completed):
+    """
+    Test that the streaming endpoints send the same todos as the cached lists,
+    across several batches, as a JSON array or as JSON lines, and that no todos
+    stream as an empty array or no lines.
+    """
+    path = "/todos/completed" if completed else "/todos/incompleted"
+    assert client.get(f"{path}/stream").json() == []
+    assert client.get(f"{path}/stream", params={"format": "ndjson"}).text == ""
+
+    monkeypatch.setattr(main, "STREAM_BATCH_SIZE", 2)
+    create_todos(
+        client,
+        *({"task_title": f"todo {i}", "completed": i % 3 == 0} for i in range(10)),
+    )
+    expected = client.get(path).json()
+    assert len(expected) > 2
+
+    response = client.get(f"{path}/stream")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == expected
+
+    response = client.get(f"{path}/stream", params={"format": "ndjson"})
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.endswith("\n")
+    assert [json.loads(line) for line in response.text.splitlines()] == expected
+
+
+def test_search_follows_writes(client):
+    """
+    Test that search results follow the todos as they are inserted, updated and
+    deleted, one at a time or in bulk.
+    """
+    todo_id = client.post("/todos/", json={"task_title": "buy milk"}).json()["id"]
+    bulk_id, _ = create_todos(
+        client, {"task_title": "buy bread"}, {"task_title": "walk the dog"}
+    )
+    assert search(client, "buy") == ["buy milk", "buy bread"]
+    assert search(client, "mil") == ["buy milk"]
+
+    client.patch(f"/todos/{todo_id}", json={"task_title": "sell milk"})
+    client.post(
+        "/todos/bulk",
+        json=[{"action": "update", "id": bulk_id, "task_title": "bake bread"}],
+    )
+    assert search(client, "buy") == []
+    assert search(client, "bread") == ["bake bread"]
+
+    client.delete(f"/todos/{todo_id}")
+    client.post("/todos/bulk", json=[{"action": "delete", "id": bulk_id}])
+    assert search(client, "milk") == []
+    assert search(client, "bread") == []
+    assert search(client, "dog") == ["walk the dog"]
+
+
+def test_search_index_on_existing_database(database):
+    """
+    Test that starting on a database with todos but no search index indexes
+    them, and that an index created before its triggers gets them.
+    """
+    SQLModel.metadata.create_all(db.engine)
+    with Session(db.engine) as session:
+        session.add(main.Todo(task_title="old todo"))
+        session.commit()
+    with TestClient(main.app) as client:
+        assert search(client, "old") == ["old todo"]
+
+    with db.engine.begin() as connection:
+        for trigger in ["insert", "update", "delete"]:
+            connection.exec_driver_sql(f"DROP TRIGGER todo_fts_after_{trigger};")
+    with TestClient(main.app) as client:
+        client.patch("/todos/1", json={"task_title": "new todo"})
+        client.post("/todos/", json={"task_title": "newer todo"})
+        assert search(client, "old") == []
+        assert search(client, "new") == ["new todo", "newer todo"]